@@ -1,7 +1,32 @@
+import os
+import threading
+
 from django.utils.encoding import smart_str
 
 from .translation import blisscribe
 
+_translators = {}
+_translators_lock = threading.Lock()
+
+
+def shared_translator(lang, font_fam, font_size):
+    """
+    Returns the BlissTranslator shared by all requests with this
+    language, font and font size, starting it if needed.
+    ~
+    Each translation runs in its own TranslationSession, so one
+    translator can serve concurrent requests.
+    """
+    key = (lang, font_fam, font_size)
+    with _translators_lock:
+        translator = _translators.get(key, None)
+        if translator is None:
+            translator = blisscribe.BlissTranslator(
+                language=lang, font_path=font_fam, font_size=font_size
+            )
+            _translators[key] = translator
+    return translator
+
 
 class FormTranslator:
     FILE_PATH = blisscribe.PATH + "/out"
@@ -28,9 +53,7 @@ class FormTranslator:
         self.lang = smart_str(lang)
         self.font_fam = smart_str(font_fam)
         self.font_size = int(font_size)
-        self.translator = blisscribe.BlissTranslator(
-            language=self.lang, font_path=self.font_fam, font_size=self.font_size
-        )
+        self.translator = shared_translator(self.lang, self.font_fam, self.font_size)
         print(self.lang, self.translator)
         self.nouns = bool(nouns)
         self.verbs = bool(verbs)
@@ -49,7 +72,18 @@ class FormTranslator:
         return True
 
     def translate(self):
-        self.translator.translate(self.phrase, title_page=self.title_page)
+        """
+        Translates this phrase in its own TranslationSession and
+        returns the path of its PDF, which no other request shares.
+        """
+        with self.translator.session(title_page=self.title_page) as session:
+            try:
+                session.translate(self.phrase)
+            except Exception:
+                if session.pdf_path is not None and os.path.exists(session.pdf_path):
+                    os.remove(session.pdf_path)
+                raise
+        return session.pdf_path
 
     def deleteTranslation(self, filename):
         self.translator.delete_pdf(filename)
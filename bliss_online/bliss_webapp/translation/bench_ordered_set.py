@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+BENCH_ORDERED_SET:
+
+    Micro-benchmark comparing OrderedSet with its previous
+    implementation, which counted items with list.count() and
+    re-ranked them on every access.
+
+    Workloads use synset strings from bci_blissnet, mimicking
+    how BlissTranslator collects and ranks synsets and lemmas.
+    To run from command line:
+
+    > python bench_ordered_set.py [--repeat 5]
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+import random
+import timeit
+from ordered_set import OrderedSet
+
+
+class LegacyOrderedSet:
+    """
+    OrderedSet as it was before keeping incremental counts,
+    kept for comparison.
+    """
+
+    def __init__(self, items=list()):
+        self.items_set = set(items)
+        self.all_items = list(items)
+
+    def items(self, min_ct=None, max_ct=None):
+        return self.rank(self.all_items, min_ct=min_ct, max_ct=max_ct)
+
+    def update(self, other):
+        if type(other) == type(self):
+            self.add_items(other.all_items)
+        else:
+            self.add_items(other)
+
+    def rank(self, items=None, min_ct=None, max_ct=None):
+        if items is None:
+            items = self.all_items
+        items_set = self.remove_duplicates(items)
+        counts = self.frequency_counts()
+        items_set = [
+            i
+            for i in items_set
+            if (min_ct is None or counts.get(i, 0) > min_ct)
+            and (max_ct is None or counts.get(i, 0) < max_ct)
+        ]
+        return sorted(items_set, key=lambda i: counts[i], reverse=True)
+
+    def frequency_counts(self):
+        return {i: self.all_items.count(i) for i in self.items_set}
+
+    def add(self, item):
+        self.all_items.append(item)
+        self.items_set.add(item)
+
+    def add_items(self, items):
+        for item in items:
+            self.add(item)
+
+    def intersections(self, **kwargs):
+        counts = self.frequency_counts()
+        min_i = kwargs.get("min_i", None)
+        if min_i is None:
+            min_i = max(counts.values()) if len(counts) != 0 else 0
+        items = self.remove_duplicates(self.all_items)
+        return [i for i in items if counts[i] >= min_i]
+
+    @staticmethod
+    def remove_duplicates(items):
+        if len(items) == 0:
+            return items
+        else:
+            seen = set()
+            seen_add = seen.add
+            return [item for item in items if not (item in seen or seen_add(item))]
+
+    def __iter__(self):
+        return iter(self.items())
+
+    def __len__(self):
+        return len(self.items_set)
+
+    def __getitem__(self, index):
+        return self.items()[index]
+
+
+def synset_lists(n_lists, seed=0):
+    """
+    Returns n_lists lists of synset strings drawn from bci_blissnet,
+    with the overlap typical of a word's synonyms' synsets.
+
+    :param n_lists: int, number of synset lists
+    :param seed: int, random seed
+    :return: List[List[str]], synset lists
+    """
+    from resources.data import blissnets
+
+    pool = sorted({s for synsets in blissnets.BCI_BLISSNET.values() for s in synsets})
+    rng = random.Random(seed)
+    common = rng.sample(pool, 8)
+    return [
+        rng.sample(common, rng.randint(1, 4)) + rng.sample(pool, rng.randint(2, 12))
+        for _ in range(n_lists)
+    ]
+
+
+def collect_and_rank(cls, lists):
+    """
+    Collects these synset lists into an OrderedSet and reads it
+    the way BlissTranslator does: the top item, a full iteration,
+    and the most common items.
+    """
+    synsets = cls([])
+    for synset_list in lists:
+        synsets.update(synset_list)
+        synsets[0]
+    for _ in synsets:
+        pass
+    synsets.items(min_ct=1)
+    return synsets.intersections()
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark OrderedSet.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print("{:>8}{:>14}{:>14}{:>10}".format("lists", "legacy (ms)", "new (ms)", "speedup"))
+    for n_lists in (5, 20, 100):
+        lists = synset_lists(n_lists)
+        assert collect_and_rank(LegacyOrderedSet, lists) == collect_and_rank(OrderedSet, lists)
+        times = []
+        for cls in (LegacyOrderedSet, OrderedSet):
+            timer = timeit.Timer(lambda: collect_and_rank(cls, lists))
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=args.repeat, number=number)) / number
+            times.append(best * 1000)
+        print(
+            "{:>8}{:>14.3f}{:>14.3f}{:>9.1f}x".format(
+                n_lists, times[0], times[1], times[0] / times[1]
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
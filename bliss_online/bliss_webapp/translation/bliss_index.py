@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+BLISS_INDEX:
+
+    Indexes a Blissymbols lexicon by normalized word and
+    part of speech.
+
+    Words are normalized by Unicode composition (NFC), case folding,
+    and treating underscores as spaces, so that every spelling of a
+    word the translator might try is found with one lookup.  Each
+    word's Blissymbols are bucketed by part of speech, so finding
+    the Blissymbols with a given part of speech doesn't check
+    each Blissymbol.
+"""
+import unicodedata
+
+
+def spelling(word):
+    """
+    Returns this word's spelling with its Unicode composed
+    and underscores replaced with spaces, but its case kept.
+
+    :param word: str, word to spell
+    :return: str, word's spelling
+    """
+    return unicodedata.normalize("NFC", word).replace("_", " ").strip()
+
+
+def normalize(word):
+    """
+    Returns this word in the form it's indexed under.
+    ~
+    e.g. normalize("Ice_Cream") -> "ice cream"
+
+    :param word: str, word to normalize
+    :return: str, normalized word
+    """
+    return spelling(word).casefold()
+
+
+class BlissIndex:
+    """
+    A class for looking up a lexicon's Blissymbols by
+    normalized word and part of speech.
+    ~
+    Each normalized word maps to the lexicon entries with that
+    normal form, and each entry maps parts of speech to its
+    Blissymbols with that part of speech.  Blissymbols without
+    parts of speech are stored under None and match any part
+    of speech.
+    ~
+    An index can be layered over a parent index, as a
+    BlissTranslator's lexicon is layered over the shared core
+    lexicon.  Entries added to the child replace the parent's
+    entries for the same word.
+    """
+
+    def __init__(self, lexicon=None, parent=None):
+        self.parent = parent
+        self.entries = {}
+        if lexicon is not None:
+            for word, blissymbols in lexicon.items():
+                self.add(word, blissymbols)
+
+    @staticmethod
+    def bucket(blissymbols):
+        """
+        Returns these Blissymbols bucketed by part of speech.
+
+        :param blissymbols: Iterable[Blissymbol], Blissymbols to bucket
+        :return: dict, where...
+            key (str) - part of speech, or None for any part of speech
+            val (Tuple[Blissymbol]) - Blissymbols with this part of speech
+        """
+        buckets = {}
+        for blissymbol in blissymbols:
+            pos = blissymbol.pos
+            if pos is None or type(pos) == str:
+                pos = (pos,)
+            for tag in pos:
+                buckets.setdefault(tag, []).append(blissymbol)
+        return {tag: tuple(bs) for tag, bs in buckets.items()}
+
+    def add(self, word, blissymbols):
+        """
+        Indexes this lexicon entry, replacing any entry
+        already indexed for word.
+
+        :param word: str, lexicon entry's word
+        :param blissymbols: Iterable[Blissymbol], word's Blissymbols
+        :return: None
+        """
+        entry = (tuple(blissymbols), self.bucket(blissymbols))
+        self.entries.setdefault(normalize(word), {})[word] = entry
+
+    def get(self, word):
+        """
+        Returns the entries indexed under this word's normal form.
+
+        :param word: str, word to lookup
+        :return: Optional[dict], where...
+            key (str) - lexicon entry's word
+            val (Tuple[tuple, dict]) - entry's Blissymbols, and
+                its Blissymbols bucketed by part of speech
+        """
+        key = normalize(word)
+        entries = self.entries.get(key, None)
+        if self.parent is None:
+            return entries
+        inherited = self.parent.get(key)
+        if entries is None or inherited is None:
+            return inherited if entries is None else entries
+        merged = dict(inherited)
+        merged.update(entries)
+        return merged
+
+    @staticmethod
+    def filter_pos(entry, pos):
+        """
+        Returns this entry's Blissymbols with this part of speech.
+        ~
+        If pos is None, returns all of entry's Blissymbols.
+
+        :param entry: Tuple[tuple, dict], entry as in get()
+        :param pos: Optional[str or Iterable[str]], part(s) of speech
+        :return: Tuple[Blissymbol], entry's Blissymbols with pos
+        """
+        blissymbols, buckets = entry
+        if pos is None:
+            return blissymbols
+        if type(pos) == str:
+            pos = (pos,)
+        found = {}
+        for tag in pos:
+            found.update(dict.fromkeys(buckets.get(tag, ())))
+        found.update(dict.fromkeys(buckets.get(None, ())))
+        return tuple(found)
+
+    def lemma(self, word, pos=None):
+        """
+        Returns the lexicon entry for this word, or for its
+        title-case or lowercase form, which has a Blissymbol
+        with this part of speech.
+        ~
+        Entries differing from word only in Unicode composition
+        or underscores for spaces also match.
+        ~
+        If no entry matches, returns None.
+
+        :param word: str, word to lookup
+        :param pos: Optional[str or Iterable[str]], word's part(s) of speech
+        :return: Optional[str], matching lexicon entry's word
+        """
+        entries = self.get(word)
+        if entries is None:
+            return None
+        spellings = {}
+        for w in entries:
+            spellings.setdefault(spelling(w), w)
+        for variant in (word, word.title(), word.lower()):
+            w = variant if variant in entries else spellings.get(spelling(variant), None)
+            if w is not None and len(self.filter_pos(entries[w], pos)) != 0:
+                return w
+
+    def lookup(self, word, pos=None):
+        """
+        Returns the Blissymbols for this word with this
+        part of speech.
+        ~
+        If none of word's Blissymbols have pos, returns all of
+        word's Blissymbols.  If word isn't in this index's lexicon,
+        returns None.
+
+        :param word: str, word to lookup
+        :param pos: Optional[str or Iterable[str]], word's part(s) of speech
+        :return: Optional[Tuple[Blissymbol]], word's Blissymbols
+        """
+        entries = self.get(word)
+        if entries is None:
+            return None
+        entry = entries.get(word, None)
+        if entry is None:
+            target = spelling(word)
+            for w in entries:
+                if spelling(w) == target:
+                    entry = entries[w]
+                    break
+            else:
+                return None
+        filtered = self.filter_pos(entry, pos)
+        return filtered if len(filtered) != 0 else entry[0]
@@ -7,15 +7,22 @@ import os, sys
 
 PATH = os.path.dirname(os.path.realpath(__file__))
 sys.path.append(PATH)
+import io
+import re
+import hashlib
+import tempfile
+import itertools
+import threading
 import collections
-import nltk
+from imports import safe_import
+
+safe_import("resource_manager")
+from resource_manager import require_resources
 
-nltk.download("wordnet", quiet=True)
-nltk.download("averaged_perceptron_tagger", quiet=True)
+require_resources("wordnet", "averaged_perceptron_tagger")
 from nltk.tag import pos_tag
 from nltk.corpus import wordnet
 from fpdf import FPDF
-from imports import safe_import
 
 safe_import("fonts")
 safe_import("punctuation")
@@ -26,16 +33,30 @@ safe_import("translation_word")
 safe_import("speechart")
 safe_import("ordered_set")
 safe_import("blisslearn")
+safe_import("resources")
+safe_import("omw_registry")
+safe_import("caches")
+safe_import("pdf_writer")
+safe_import("parallel_translation")
+safe_import("translation_session")
+safe_import("lexicon_journal")
 from blisslearn import BlissClassifier
 from fonts import *
 from punctuation import *
 from parts_of_speech import *
 from images import *
-from lexicon_parser import LexiconParser, Blissymbol, NEW_BLISSYMBOLS, BCI_BLISSNET
+from lexicon_parser import LexiconParser, Blissymbol, NEW_BLISSYMBOLS
 from translation_word import TranslationWord
 from speechart.language_parser import LanguageParser
 import speechart.tokenizers as tokenizers
 from ordered_set import OrderedSet
+from resources.data import blissnets
+from omw_registry import OMW_REGISTRY
+from caches import LRUCache, LEMMA_CACHE, SYNSET_CACHE, PARAGRAPH_CACHE, MISSING
+from pdf_writer import PDFWriter
+from parallel_translation import parallel_images
+from translation_session import TranslationSession, current_session
+from lexicon_journal import latest_edit, learned_since, word_keys
 
 # NOTE: deprecating pattern3 until IndentationError patched
 # from pattern3 import text
@@ -81,8 +102,16 @@ class BlissTranslator:
     DEFAULT_LANG = "English"
     WIDTH = 816
     HEIGHT = 1056
+    PARAGRAPH_CHARS = 20000  # longest paragraph translated at once
+    STREAM_CACHE_SIZE = 4096  # distinct words remembered while streaming
+    BREAKS = {"\n", "!", ".", "?", "!."}  # tokens drawn as paragraph breaks
+    _lexicon_edits = itertools.count(1)  # see add_bliss_entry()
+    _refresh_lock = threading.Lock()  # guards writing shared data files
 
     def __init__(self, language=DEFAULT_LANG, font_path=SANS_FONT, font_size=30):
+        self.lexicon_edit = None  # latest edit to this translator's own lexicon
+        self.lexicon_id = None  # tells apart translators whose lexicon was edited
+        self._lexicon_lock = threading.RLock()  # guards changes to lexicon/parsers
         self.lex_parser = LexiconParser(translator=self)
         self._lang_parser = None
         self._classifier = None
@@ -96,12 +125,17 @@ class BlissTranslator:
 
         # Language
         self.bliss_dicts = {}
+        self.bliss_indexes = {}
+        self.own_blissymbols = {}
         self.lexica = {}
         self.language = "English"
         self.set_language(language)
-        self.words_seen = {}
-        self.words_changed = {}
+        self._words_seen = {}
+        self._words_changed = {}
         self.init_seen_changed()
+        self._session_lock = threading.Lock()
+        self._active_sessions = 0
+        self.transword_cache = None
 
     # INITIALIZATIONS
     # ===============
@@ -124,7 +158,9 @@ class BlissTranslator:
         :return: LanguageParser, this BlissTranslator's lang_parser
         """
         if self._lang_parser is None:
-            self._lang_parser = LanguageParser(self.language)
+            with self._lexicon_lock:
+                if self._lang_parser is None:
+                    self._lang_parser = LanguageParser(self.language)
         return self._lang_parser
 
     @property
@@ -153,8 +189,7 @@ class BlissTranslator:
         :return: None
         """
         if lang == "Polish" or lang == "French":
-            lexicon = self.lex_parser.parse_lexicon(lang)
-            self.lexica[lang] = lexicon
+            self.lexica[lang] = self.lex_parser.load_lexicon(lang)
 
     def init_bliss_dicts(self):
         """
@@ -174,16 +209,24 @@ class BlissTranslator:
         if self.language != "English":
             self.bliss_dicts["English"] = self.lex_parser.init_bliss_lexicon("English")
             self.load_multilingual_lemmas(self.lang_code())
+        self.lex_parser.replay_blissymbols()
 
     def init_seen_changed(self):
         """
         Initializes this BlissTranslator's words_seen
         as a default dict.
+        ~
+        Inside a TranslationSession, initializes the
+        session's words_seen instead.
 
         :return: None
         """
-        self.words_seen = collections.defaultdict(bool)
-        self.words_changed = collections.defaultdict(bool)
+        session = self.current_session()
+        if session is not None:
+            session.init_seen_changed()
+        else:
+            self._words_seen = collections.defaultdict(bool)
+            self._words_changed = collections.defaultdict(bool)
 
     def init_language(self, language):
         """
@@ -210,9 +253,9 @@ class BlissTranslator:
     @property
     def bliss_unicode(self):
         """
-        Returns a blissname-to-unicode dictionary.
+        Returns a read-only blissname-to-unicode dictionary.
 
-        :return: dict, where...
+        :return: MappingProxyType, where...
             key (str) - name of a Blissymbol
             val (str) - corresponding unicode
         """
@@ -229,9 +272,10 @@ class BlissTranslator:
         :param language: str, language for this BlissTranslator
         :return: None
         """
-        self.init_language(language)
-        self.add_lexicon(self.language)
-        self.init_bliss_dicts()
+        with self._lexicon_lock:
+            self.init_language(language)
+            self.add_lexicon(self.language)
+            self.init_bliss_dicts()
 
     def set_font(self, font_path, font_size):
         """
@@ -249,22 +293,104 @@ class BlissTranslator:
     # -----------------
     def lookup_bliss_unicode(self, **kwargs):
         """
-        Returns this unicode ID's corresponding Blissymbol name.
+        Returns this unicode ID's corresponding Blissymbol names,
+        or this Blissymbol name's corresponding unicode ID.
 
          kwargs:
         :param uni: str, unicode name to lookup
         :param bliss: str, name of blissymbol to lookup
 
-        :return: str, Blissymbol name for uni / unicode for bliss name
+        :return: List[str] or str, Blissymbol names for uni / unicode for bliss name
         """
-        bliss_unicode = self.bliss_unicode
         uni = kwargs.get("uni", None)
         if uni is not None:
-            return bliss_unicode.get(uni, None)
+            return list(self.lex_parser.load_bliss_unicode_names().get(uni, ()))
         bliss = kwargs.get("bliss", None)
         if bliss is not None:
-            uni_bliss = {bliss_unicode[b]: b for b in bliss_unicode}
-            return uni_bliss.get(bliss, None)
+            return self.bliss_unicode.get(bliss, None)
+
+    def blissymbols_to_unicodes(self, blissymbols):
+        """
+        Returns the unicode IDs for these Blissymbols.
+        ~
+        Blissymbols without their own unicode ID get the unicode
+        IDs of their derivations, as in Blissymbol.unicode.
+
+        :param blissymbols: Iterable[Blissymbol], Blissymbols to lookup
+        :return: List[str], unicode IDs for blissymbols
+        """
+        bliss_unicode = self.bliss_unicode
+        unicodes = []
+        for blissymbol in blissymbols:
+            uni = bliss_unicode.get(blissymbol.bliss_name, None)
+            unicodes.append(uni if uni is not None else blissymbol.unicode)
+        return unicodes
+
+    # SESSIONS
+    # --------
+    def session(self, pdf_path=None, **options):
+        """
+        Returns a new TranslationSession for translating one
+        document with this BlissTranslator and these options.
+        ~
+        Unless pdf_path is given, the session's PDF is written
+        to a new file in the out folder (see new_pdf_path()).
+
+        :param pdf_path: Optional[str], path to write session's PDF to
+        :param options: translation keyword arguments, as in translate()
+        :return: TranslationSession, new session
+        """
+        return TranslationSession(self, pdf_path=pdf_path, **options)
+
+    def current_session(self):
+        """
+        Returns this thread's current TranslationSession if it
+        belongs to this BlissTranslator, or None otherwise.
+
+        :return: Optional[TranslationSession], current session
+        """
+        session = current_session()
+        return session if session is not None and session.translator is self else None
+
+    def begin_session(self, session):
+        """
+        Notes that this session has started using this BlissTranslator.
+
+        :param session: TranslationSession, session starting
+        :return: None
+        """
+        with self._session_lock:
+            self._active_sessions += 1
+
+    def end_session(self, session):
+        """
+        Notes that this session has stopped using this BlissTranslator.
+        ~
+        Forgets the session's new Blissymbol images.  Once no
+        sessions are left, forgets lemmas and TranslationWords
+        made from data learned while translating.
+        ~
+        Learned data is journalled as it's learned, and written
+        to data files by compaction later, rather than here.
+
+        :param session: TranslationSession, session ending
+        :return: None
+        """
+        with self._session_lock:
+            self._active_sessions -= 1
+            self.clear_new_blissymbols(session.new_blissymbols)
+            if self._active_sessions == 0:
+                self.invalidate_learned()
+
+    @property
+    def words_seen(self):
+        session = self.current_session()
+        return self._words_seen if session is None else session.words_seen
+
+    @property
+    def words_changed(self):
+        session = self.current_session()
+        return self._words_changed if session is None else session.words_changed
 
     # SEEN/CHANGED
     # ------------
@@ -312,22 +438,48 @@ class BlissTranslator:
         """
         Overwrites the source Wiktionary JSON data with this
         BlissTranslator's lang_parser's wiktionary_entries.
+        ~
+        Compacts the lexicon's and Wiktionary entries' journals
+        now, rather than waiting for them to compact themselves.
 
         :return: None
         """
         self.clear_new_blissymbols()
-        self.lex_parser.refresh_blissymbols()
-        self.lang_parser.refresh_data()
+        with BlissTranslator._refresh_lock:
+            self.lex_parser.refresh_blissymbols()
+            self.lang_parser.refresh_data()
+        self.invalidate_learned()
 
-    def clear_new_blissymbols(self):
+    def invalidate_learned(self):
         """
-        Deletes all contents of NEW_BLISSYMBOLS.
+        Forgets lemmas and TranslationWords which may be out
+        of date with newly learned data.
+        ~
+        Rendered paragraphs are checked against learned data
+        as they're reused instead, see cached_render().
+
+        :return: None
+        """
+        self.invalidate_lemmas()
+        if self.transword_cache is not None:
+            self.transword_cache.clear()
+
+    def clear_new_blissymbols(self, img_paths=None):
+        """
+        Deletes all contents of NEW_BLISSYMBOLS, or only
+        these img_paths if given.
         ~
         Refreshes naming cycle for new images.
 
+        :param img_paths: Optional[List[str]], new image paths to forget
         :return: None
         """
-        del NEW_BLISSYMBOLS[:]
+        if img_paths is None:
+            del NEW_BLISSYMBOLS[:]
+        else:
+            for img_path in img_paths:
+                if img_path in NEW_BLISSYMBOLS:
+                    NEW_BLISSYMBOLS.remove(img_path)
 
     # IMAGES
     # ------
@@ -478,41 +630,55 @@ class BlissTranslator:
         :param page_nums: bool, whether to include numbers on pages
         :return: FPDF, pdf document named title with pages
         """
-        filenames = []
-        for i in range(len(pages)):
-            filename = "bliss_img" + str(i) + ".png"
-            pages[i].save(filename)
-            filenames.append(filename)
-        width, height = Image.open(filenames[0]).size
-        new_w, new_h = width + (margins * 2), height + (margins * 2)
-
-        pdf = FPDF(unit="pt", format=[new_w, new_h])
-
-        for idx in range(len(filenames)):
-            filename = filenames[idx]
-            pdf.add_page()
-            pdf.image(filename, x=margins, y=margins)
-
-            if idx > 1 and page_nums:
-                number = trim(
-                    word_image(
-                        str(idx),
-                        self.image_heights(),
-                        font_path=self.font_path,
-                        font_size=self.font_size,
-                    )
-                )
-                num_filename = str(idx) + ".png"
-                number.save(num_filename)
-                x = new_w // 2 - number.size[0]
-                y = new_h - (margins // 2) - number.size[1]
-                pdf.image(num_filename, x=x, y=y)
-                os.remove(num_filename)
+        writer = self.pdf_writer(margins=margins, page_nums=page_nums)
+        for page in pages:
+            writer.add_page(page)
+        return writer.close()
+
+    def pdf_writer(self, margins=50, page_nums=False, path=None):
+        """
+        Returns a PDFWriter for writing pages to this
+        BlissTranslator's output PDF one at a time.
+
+        :param margins: int, space in margins (in pixels)
+        :param page_nums: bool, whether to include numbers on pages
+        :param path: Optional[str], path of PDF, or None for out/translation.pdf
+        :return: PDFWriter, writer for PDF at path
+        """
+        if path is None:
+            path = PATH + "/out/" + "translation" + ".pdf"
+        page_number = self.page_number_image if page_nums else None
+        return PDFWriter(path, margins, page_number)
+
+    @staticmethod
+    def new_pdf_path():
+        """
+        Returns the path of a new, empty PDF file in the out folder,
+        with a name no other translation's PDF has.
+
+        :return: str, path of new PDF file
+        """
+        fd, path = tempfile.mkstemp(
+            prefix="translation_", suffix=".pdf", dir=PATH + "/out"
+        )
+        os.close(fd)
+        return path
 
-            os.remove(filename)  # deletes images once in PDF
+    def page_number_image(self, number):
+        """
+        Returns a trimmed Image of this page number.
 
-        pdf.output(PATH + "/out/" + "translation" + ".pdf", "F")
-        return pdf
+        :param number: int, page number
+        :return: Image, image of number
+        """
+        return trim(
+            word_image(
+                str(number),
+                self.image_heights(),
+                font_path=self.font_path,
+                font_size=self.font_size,
+            )
+        )
 
     def delete_pdf(self, filename):
         """
@@ -573,20 +739,17 @@ class BlissTranslator:
         """
         Loads a custom tab file for this lang_code's language to WordNet.
         ~
-        If no such file can be loaded, raises a ValueError.
+        If no such file can be loaded, raises an IOError.
         ~
-        Used to add non-default OMWs to WordNet.
+        Used to add non-default OMWs to WordNet.  Each language is
+        only loaded once per process, see OMWRegistry.
 
         :param lang_code: str, language code for language to load lemmas for
         :return: None
         """
-        if lang_code is not None:
-            tab_file = self.lex_parser.get_tab_file(lang_code)
-
-            if tab_file is not None:
-                wordnet.custom_lemmas(tab_file, lang_code)
-            # else:
-            #    raise ValueError("Blisscribe doesn't support this language yet... oops!")
+        if lang_code is not None and not OMW_REGISTRY.is_loaded(lang_code):
+            OMW_REGISTRY.load(lang_code)
+            self.invalidate_synsets(lang_code)  # earlier misses may now hit
 
     # LANGUAGE PROCESSING
     # -------------------
@@ -1103,7 +1266,7 @@ class BlissTranslator:
         """
         synset = kwargs.get("synset", None)
         if synset is not None:
-            return any(synset.name() in v for v in self.blissnet.values())
+            return synset.name() in self.lex_parser.load_blissnet_synsets()
         bci_num = kwargs.get("bci_num", None)
         if bci_num is None:
             blissymbol = kwargs.get("blissymbol", None)
@@ -1127,23 +1290,35 @@ class BlissTranslator:
         """
         synset = kwargs.get("synset", None)
         if synset is not None:
-            bliss_num, match = None, 0
-            for bci_num in BCI_BLISSNET:
-                synsets = BCI_BLISSNET[bci_num]
-                if synset.name() in synsets:
-                    curr_match = 1 / len(synsets)
-                    if curr_match > match:
-                        bliss_num, match = bci_num, curr_match
-            return (
-                self.bci_num_to_blissymbol(int(bliss_num))
-                if bliss_num is not None
-                else None
-            )
+            bci_nums = self.lex_parser.synset_bci_nums(synset.name())
+            return self.bci_num_to_blissymbol(bci_nums[0]) if bci_nums else None
         else:
             bci_num = kwargs.get("bci_num", None)
             if bci_num is None:
                 bci_num = kwargs.get("blissymbol").bci_num
-            return BCI_BLISSNET.get(bci_num, None)
+            return blissnets.BCI_BLISSNET.get(str(bci_num), None)
+
+    def lookup_blissnet_many(self, synsets):
+        """
+        Returns the most specific Blissymbol in this BlissTranslator's
+        blissnet for each of these synsets, as in lookup_blissnet().
+        ~
+        Synsets without a Blissymbol map to None.
+
+        :param synsets: List[Synset], WordNet Synsets to lookup in blissnet
+        :return: List[Blissymbol], Blissymbol (or None) for each synset
+        """
+        blissymbols = []
+        found = {}
+
+        for synset in synsets:
+            name = synset.name()
+            if name not in found:
+                bci_nums = self.lex_parser.synset_bci_nums(name)
+                found[name] = self.bci_num_to_blissymbol(bci_nums[0]) if bci_nums else None
+            blissymbols.append(found[name])
+
+        return blissymbols
 
     def lookup_bliss_dict(self, word, language):
         """
@@ -1170,10 +1345,34 @@ class BlissTranslator:
         """
         bliss_dict = self.bliss_dicts.get(language, None)
         if bliss_dict is None:
-            bliss_dict = self.lex_parser.init_bliss_lexicon(language)
-            self.bliss_dicts.setdefault(language, bliss_dict)
+            with self._lexicon_lock:
+                bliss_dict = self.bliss_dicts.get(language, None)
+                if bliss_dict is None:
+                    bliss_dict = self.lex_parser.init_bliss_lexicon(language)
+                    self.bliss_dicts[language] = bliss_dict
         return bliss_dict
 
+    def bliss_index(self, language):
+        """
+        Returns the normalized lookup index of the Blissymbols
+        dictionary for this language.
+        ~
+        The index is rebuilt if the dictionary was replaced.
+
+        :param language: str, language of desired Blissymbols dict
+        :return: BlissIndex, index of bliss_dict(language)
+        """
+        bliss_dict = self.bliss_dict(language)
+        indexed = self.bliss_indexes.get(language, None)
+        if indexed is None or indexed[0] is not bliss_dict:
+            with self._lexicon_lock:
+                indexed = self.bliss_indexes.get(language, None)
+                if indexed is None or indexed[0] is not bliss_dict:
+                    index = self.lex_parser.init_bliss_index(language, bliss_dict)
+                    indexed = (bliss_dict, index)
+                    self.bliss_indexes[language] = indexed
+        return indexed[1]
+
     def detect_language(self, word):
         return self.lang_parser.detect_language(word)
 
@@ -1192,6 +1391,56 @@ class BlissTranslator:
             if len(hypernyms) != 0:
                 return hypernyms.intersections()[0]
 
+    def nearest_bliss_ancestor(self, synsets, max_distance=None):
+        """
+        Returns the Blissymbol of the nearest hypernym with a
+        Blissymbol shared by these synsets.
+        ~
+        Hypernyms are looked up in the precomputed table of
+        nearest Bliss-mapped ancestors, so this can look past
+        a synset's immediate hypernyms.  The nearest ancestors
+        win, with ties broken by how many synsets share them;
+        the first whose Blissymbol is in the lexicon is used.
+        If that table's unavailable, falls back to the Blissymbol
+        for synsets' common_hypernym().
+        ~
+        If no hypernym within max_distance links has a Blissymbol,
+        returns None.
+
+        :param synsets: List[Synset], synsets to find ancestor for
+        :param max_distance: Optional[int], most hypernym links to follow
+        :return: Optional[Blissymbol], nearest ancestor's Blissymbol
+        """
+        if len(synsets) == 0:
+            return None
+        if len(self.lex_parser.load_bliss_ancestors()) == 0:
+            hypernym = self.common_hypernym(synsets)
+            return None if hypernym is None else self.lookup_blissnet(synset=hypernym)
+
+        nearest = None
+        ancestors = OrderedSet([])
+        for synset in synsets:
+            found = self.lex_parser.bliss_ancestors(synset.name())
+            if found is None:
+                continue
+            distance, names = found
+            if max_distance is not None and distance > max_distance:
+                continue
+            if nearest is None or distance < nearest:
+                nearest = distance
+                ancestors = OrderedSet([])
+            if distance == nearest:
+                ancestors.add_items(names)
+
+        candidates = ancestors.intersections()
+        shared = set(candidates)
+        candidates.extend(a for a in ancestors.items() if a not in shared)
+        for ancestor in candidates:
+            for bci_num in self.lex_parser.synset_bci_nums(ancestor):
+                blissymbol = self.bci_num_to_blissymbol(bci_num)
+                if blissymbol is not None:
+                    return blissymbol
+
     def pos_match(self, pos1, pos2):
         if pos1 is None or pos2 is None:
             return True
@@ -1259,40 +1508,18 @@ class BlissTranslator:
         :param lang: str, word's native language
         :return: str, word's lemma
         """
-        bliss_dict = self.bliss_dict(lang)
-
         if type(pos) == str:
             pos = {pos}
         elif pos is None:
             pos = set(PARTS_OF_SPEECH)
 
-        def in_bliss_dict(w):
-            if w in bliss_dict and any(
-                self.pos_match(pos, b.pos) for b in bliss_dict[w]
-            ):
-                return w
-            else:
-                return None
-
         if self.is_punctuation(word):
             return word
 
         # check if variations of word are in official Blissymbols dict
-        word_entry = in_bliss_dict(word)
-        if word_entry is not None:
-            return word_entry
-
-        word_entry = in_bliss_dict(word.title())
-        if word_entry is not None:
-            return word_entry
-
-        word_entry = in_bliss_dict(word.lower())
+        word_entry = self.bliss_index(lang).lemma(word, pos)
         if word_entry is not None:
             return word_entry
-        else:
-            del word_entry
-
-        del bliss_dict
         """
         if pos is None or self.is_noun(pos):
             singular = self.singularize(word, lang)
@@ -1316,22 +1543,57 @@ class BlissTranslator:
                 del predicative
         """
 
+        if lang in self.lexica:
+            # check if word in Polish/French inflectional dict
+            return self.lemmatize_multilingual(word, lang, pos=pos)
+
+        key = (word, frozenset(pos), lang)
+        lemma = LEMMA_CACHE.get(key)
+        if lemma is MISSING:
+            lemma = self.lookup_lemma(word, pos, lang)
+            LEMMA_CACHE.put(key, lemma)
+        return lemma
+
+    def lookup_lemma(self, word, pos, lang):
+        """
+        Looks up this word's lemma with WordNet (for English)
+        or Wiktionary (for other languages).
+        ~
+        Results are shared by all BlissTranslators through
+        LEMMA_CACHE, see lemmatize().
+
+        :param word: str, word to lemmatize
+        :param pos: Set[str], word's part(s) of speech
+        :param lang: str, word's native language
+        :return: str, word's lemma
+        """
         if lang[:3] == "Eng":
             pos_abbrev = self.abbreviate_pos(pos)
             if len(pos_abbrev) != 0:
                 return tokenizers.lemmatize(word, pos_abbrev[0])
 
-        if lang in self.lexica:
-            # check if word in Polish/French inflectional dict
-            return self.lemmatize_multilingual(word, lang, pos=pos)
+        if pos is not None:
+            wikt_pos = self.convert_pos_to_wikt(pos)
         else:
-            if pos is not None:
-                wikt_pos = self.convert_pos_to_wikt(pos)
-            else:
-                wikt_pos = None
-            return self.lang_parser.lemmatize(
-                word, lang=lang, pos=wikt_pos, add_new=True
-            )
+            wikt_pos = None
+        return self.lang_parser.lemmatize(word, lang=lang, pos=wikt_pos, add_new=True)
+
+    @staticmethod
+    def invalidate_lemmas(lang=None):
+        """
+        Removes cached lemmas in this language from LEMMA_CACHE,
+        or all cached lemmas if lang is None.
+        ~
+        Call whenever the lexica or Wiktionary data behind
+        lemmatize() change.
+
+        :param lang: Optional[str], language of lemmas to remove
+        :return: None
+        """
+        if lang is None:
+            LEMMA_CACHE.clear()
+        else:
+            LEMMA_CACHE.invalidate(lambda key: key[2] == lang)
 
     def lemmatize_multilingual(self, word, lang, pos=None):
         """
@@ -1406,6 +1668,40 @@ class BlissTranslator:
         """
         return TranslationWord(word=word_token, pos=pos, translator=self, lang=lang)
 
+    def cached_translation_word(self, word_token, pos, lang, cache):
+        """
+        Returns a new TranslationWord for this word_token, as in
+        translation_word(), reusing the resolution of any equal
+        (word_token, pos, lang) already in cache.
+
+        :param word_token: str, a word token representing the word as found in text
+        :param pos: str or Iterable[str], this word token's (Penn Treebank) part(s)-of-speech
+        :param lang: str, native language of given word token
+        :param cache: LRUCache, resolutions of TranslationWords translated so far
+        :return: TranslationWord, a new TranslationWord with the given fields
+        """
+        key = (word_token, frozenset({pos} if type(pos) == str else pos), lang)
+        resolution = cache.get(key)
+        if resolution is MISSING:
+            trans_word = self.translation_word(word_token, pos, lang)
+            cache.put(key, trans_word.resolution())
+            return trans_word
+        return TranslationWord.from_resolution(word_token, self, resolution, lang)
+
+    def set_transword_cache(self, maxsize=None):
+        """
+        Sets whether this BlissTranslator keeps the words it
+        resolves in translate_to_transwords() between documents.
+        ~
+        If maxsize is None, each document is resolved from scratch.
+        Otherwise, up to maxsize (word, pos, language) resolutions
+        are kept, least recently used first out.
+
+        :param maxsize: Optional[int], number of resolutions to keep
+        :return: None
+        """
+        self.transword_cache = None if maxsize is None else LRUCache(maxsize=maxsize)
+
     def blissymbol(self, bliss_name, pos, derivation, translations=None, num=0):
         """
         Returns a new Blissymbol with...
@@ -1471,44 +1767,76 @@ class BlissTranslator:
         :param pos: str or Iterable, word's part of speech
         :return: Optional[Blissymbol], a Blissymbol for this word
         """
-        if word is not None:
-            blissymbols = self.lookup_bliss_dict(word, lang)
-
-            if pos is not None and blissymbols is not None:
-                pos_match = (
-                    lambda p, b: p in b.pos
-                    if type(p) == str
-                    else any(s in b.pos for s in pos)
-                )
-                filtered_bliss = [
-                    bliss for bliss in blissymbols if pos_match(pos, bliss)
-                ]
-                if len(filtered_bliss) != 0:
-                    blissymbols = filtered_bliss
+        return self.lookup_many([word], [pos], lang=lang, return_none=return_none)[0]
 
-            if blissymbols is not None and len(blissymbols) != 0:
-                if len(blissymbols) == 1:
-                    return list(blissymbols)[0]
-                elif len(blissymbols) > 1:
-                    nonneutral = None
+    def lookup_many(self, words, pos_tags=None, lang="English", return_none=True):
+        """
+        Returns the Blissymbol for each of these words in this
+        language, as in word_to_blissymbol().
+        ~
+        Meant for a document's whole vocabulary: the language's
+        index is fetched once, and each distinct word and part
+        of speech is looked up once.
+
+        :param words: List[str], words to lookup Blissymbols for
+        :param pos_tags: Optional[List], each word's part(s) of speech
+        :param lang: str, words' native language
+        :param return_none: bool, whether to return None (or question_mark)
+            for words without Blissymbols
+        :return: List[Optional[Blissymbol]], a Blissymbol for each word
+        """
+        index = self.bliss_index(lang)
+        if pos_tags is None:
+            pos_tags = [None] * len(words)
+        default = None if return_none else self.blissword_to_blissymbol("question_mark")
+        found = {}
+        blissymbols = []
+
+        for word, pos in zip(words, pos_tags):
+            key = (word, pos if pos is None or type(pos) == str else frozenset(pos))
+            blissymbol = found.get(key, MISSING)
+            if blissymbol is MISSING:
+                blissymbol = None
+                if word is not None:
+                    blissymbol = self.choose_blissymbol(word, index.lookup(word, pos), lang)
+                found[key] = blissymbol
+            blissymbols.append(default if blissymbol is None else blissymbol)
+
+        return blissymbols
+
+    def choose_blissymbol(self, word, blissymbols, lang):
+        """
+        Returns the best of this word's Blissymbols.
+        ~
+        Prefers a neutral Blissymbol named word, then one with
+        word as a translation in lang, then the last non-neutral
+        Blissymbol.
 
+        :param word: str, word Blissymbols were found for
+        :param blissymbols: Optional[Tuple[Blissymbol]], word's Blissymbols
+        :param lang: str, word's native language
+        :return: Optional[Blissymbol], word's best Blissymbol
+        """
+        if blissymbols is not None and len(blissymbols) != 0:
+            if len(blissymbols) == 1:
+                return list(blissymbols)[0]
+            elif len(blissymbols) > 1:
+                nonneutral = None
+
+                for blissymbol in blissymbols:
+                    if not blissymbol.is_neutral():
+                        nonneutral = blissymbol
+                        continue
+                    elif word == blissymbol.bliss_name:
+                        return blissymbol
+                else:
                     for blissymbol in blissymbols:
-                        if not blissymbol.is_neutral():
-                            nonneutral = blissymbol
-                            continue
-                        elif word == blissymbol.bliss_name:
-                            return blissymbol
-                    else:
-                        for blissymbol in blissymbols:
-                            translations = blissymbol.get_translation(lang)
+                        translations = blissymbol.get_translation(lang)
 
-                            if word in translations or word in translations:
-                                return blissymbol
-
-                        return nonneutral
+                        if word in translations:
+                            return blissymbol
 
-        if not return_none:
-            return self.blissword_to_blissymbol("question_mark")
+                    return nonneutral
 
     def words_to_blissymbol(self, words, lang="English", pos=None):
         """
@@ -1522,17 +1850,16 @@ class BlissTranslator:
         :return: Blissymbol, a Blissymbol corresponding to this word
         """
         blissymbols = OrderedSet([])
+        bliss_dict = self.bliss_dict(lang)
+        if pos is not None:
+            tags = [pos] if type(pos) == str else list(pos)
+            tags += [p[:2] for p in tags]
 
         for word in words:
-            entry = self.lookup_bliss_dict(word, lang)
+            entry = bliss_dict.get(word, None)
             if entry is not None:
                 if pos is not None:
-                    matches_pos = (
-                        lambda p, b: (p in b.pos) or (p[:2] in b.pos)
-                        if type(p) == str
-                        else any((p_ in b.pos) or (p_[:2] in b.pos) for p_ in p)
-                    )
-                    entry = {bliss for bliss in entry if matches_pos(pos, bliss)}
+                    entry = {bliss for bliss in entry if any(t in bliss.pos for t in tags)}
                 blissymbols.update(entry)
 
         blissymbols = blissymbols.intersections()
@@ -1562,15 +1889,14 @@ class BlissTranslator:
         :return: Blissymbol, a Blissymbol for these synsets
         """
         blissymbols = OrderedSet([])
-
-        for synset in synsets:
-            blissymbols.update(self.lookup_blissnet(synset=synset))
+        blissymbols.add_items(
+            [b for b in self.lookup_blissnet_many(synsets) if b is not None]
+        )
 
         if len(blissymbols) != 0:
             return blissymbols.intersections()[0]
         else:
-            hypernym = self.common_hypernym(synsets)
-            return None if hypernym is None else self.lookup_blissnet(synset=hypernym)
+            return self.nearest_bliss_ancestor(synsets)
 
     def blissymbol_to_bci_num(self, blissymbol):
         """
@@ -1581,10 +1907,10 @@ class BlissTranslator:
         :param blissymbol: Blissymbol, to find BCI-AV# for
         :return: Optional[int], Blissymbol's BCI-AV# (None if nonexistent)
         """
-        if blissymbol.bci_num is None:
-            for bs in self.lex_parser.blissymbols:
-                if bs.bliss_name == blissymbol.bliss_name:
-                    return int(bs.bci_num)
+        if blissymbol.bci_num is not None:
+            return blissymbol.bci_num
+        bs = self.lex_parser.bliss_names.get(blissymbol.bliss_name, None)
+        return int(bs.bci_num) if bs is not None and bs.bci_num is not None else None
 
     def bci_num_to_blissymbol(self, bci_num):
         """
@@ -1594,9 +1920,7 @@ class BlissTranslator:
         :param bci_num: int, BCI-AV# corresponding to a Blissymbol
         :return: Optional[Blissymbol], Blissymbol with this bci_num (None if nonexistent)
         """
-        for bs in self.lex_parser.blissymbols:
-            if bci_num == bs.bci_num:
-                return bs
+        return self.lex_parser.bci_nums.get(bci_num, None)
 
     def blissymbol_to_synsets(self, blissymbol):
         """
@@ -1638,37 +1962,99 @@ class BlissTranslator:
         """
         Returns the Blissymbol for to this (English) blissword.
         ~
+        Looks blissword up as a full bliss_name first, then as
+        one alias in a comma-separated bliss_name.
+        ~
         If blissword has no Blissymbol, returns None.
 
         :param blissword: str, comma-separated English word(s) for a Blissymbol
         :return: Blissymbol, Blissymbol for this blissword
         """
         blissword = self.underscore(blissword)
-        bliss_dict = self.bliss_dict(self.language)
-
-        for entry in bliss_dict:
-            blissymbols = bliss_dict[entry]
-            for blissymbol in blissymbols:
-                if blissymbol.bliss_name == blissword:
-                    return blissymbol
+        blissymbol = self.lex_parser.bliss_names.get(blissword, None)
+        if blissymbol is None:
+            blissymbol = self.lex_parser.bliss_aliases.get(blissword, None)
+        return blissymbol
 
-    def add_bliss_entry(self, blissymbol):
+    def add_bliss_entry(self, blissymbol, journal=True):
         """
         Adds this Blissymbol to this BlissTranslator's
         Blissymbol dictionaries.
+        ~
+        If journal is True, journals blissymbol so it's saved
+        to the lexicon (see LexiconParser.journal_blissymbol()).
+        ~
+        Changes to the lexicon are made one thread at a time.
 
         :param blissymbol: Blissymbol, entry to add
+        :param journal: bool, whether to journal this entry
         :return: None
         """
-        languages = {self.language, "English"}.union(self.bliss_dicts.keys())
-        all_translations = blissymbol.translations
-        for language in languages:
-            translations = all_translations.get(language, None)
-            if translations is not None:
-                bliss_dict = self.bliss_dict(language)
-                for translation in translations:
-                    bliss_dict.setdefault(translation, set())
-                    bliss_dict[translation].add(blissymbol)
+        with self._lexicon_lock:
+            self.lex_parser.index_blissymbol(blissymbol)
+            if journal:
+                self.lex_parser.journal_blissymbol(blissymbol)
+            self.lexicon_edit = next(BlissTranslator._lexicon_edits)
+            if self.lexicon_id is None:
+                # unique across processes, so workers' keys can't collide
+                self.lexicon_id = (os.getpid(), self.lexicon_edit)
+            languages = {self.language, "English"}.union(self.bliss_dicts.keys())
+            all_translations = blissymbol.translations
+            for language in languages:
+                translations = all_translations.get(language, None)
+                if translations is not None:
+                    bliss_dict = self.bliss_dict(language)
+                    for translation in translations:
+                        # copy shared entries to this translator's overlay
+                        entry = bliss_dict.maps[0].get(translation, None)
+                        if entry is None:
+                            entry = set(bliss_dict.get(translation, ()))
+                            bliss_dict[translation] = entry
+                        entry.discard(blissymbol)  # replace equal Blissymbol
+                        entry.add(blissymbol)
+                        self.bliss_index(language).add(translation, entry)
+
+    def own_blissymbol(self, blissymbol):
+        """
+        Returns this BlissTranslator's own copy of this Blissymbol,
+        which can be modified without modifying the lexicon shared
+        with other BlissTranslators.
+        ~
+        If blissymbol isn't shared, returns blissymbol.
+
+        :param blissymbol: Blissymbol, Blissymbol to modify
+        :return: Blissymbol, modifiable Blissymbol
+        """
+        if not self.lex_parser.is_core_blissymbol(blissymbol):
+            return blissymbol
+        with self._lexicon_lock:
+            own = self.own_blissymbols.get(blissymbol.bliss_name, None)
+            if own is None:
+                own = blissymbol.copy(translator=self)
+                self.own_blissymbols[blissymbol.bliss_name] = own
+        return own
+
+    def learn_translations(self, blissymbol, translations):
+        """
+        Adds these translations to this BlissTranslator's own copy
+        of this Blissymbol, adds it to this BlissTranslator's
+        dictionaries, and returns it.
+        ~
+        Translations are added in order, while no other thread
+        changes this BlissTranslator's lexicon.
+
+        :param blissymbol: Blissymbol, Blissymbol learned
+        :param translations: List[tuple], where each tuple is...
+            0 (str) - language of translations
+            1 (List[str]) - translations in language
+        :return: Blissymbol, modified Blissymbol
+        """
+        with self._lexicon_lock:
+            blissymbol = self.own_blissymbol(blissymbol)
+            for language, words in translations:
+                blissymbol.add_translations(language, words)
+            self.add_bliss_entry(blissymbol)
+        return blissymbol
 
     @staticmethod
     def ordered_set(items):
@@ -1737,8 +2123,8 @@ class BlissTranslator:
         """
         if lang_code not in WORDNET_SUPPORTED_LANGS:
             try:
-                self.load_multilingual_lemmas(self.lang_code())
-            except ValueError:
+                self.load_multilingual_lemmas(lang_code)
+            except (IOError, ValueError):
                 return []
             else:
                 WORDNET_SUPPORTED_LANGS.add(lang_code)
@@ -1754,12 +2140,59 @@ class BlissTranslator:
         If lookup fails with this pos, returns this
         word's Wordnet synsets for all parts of speech
         (assuming an incorrect pos label).
+        ~
+        Results, including words without synsets, are shared
+        by all BlissTranslators through SYNSET_CACHE.
 
         :param word: str, word to lookup synset for
         :param pos: str or Iterable, word's part(s) of speech
         :param lang_code: str, word's language
         :return: List[Synset], synsets under this word, pos, and lang
         """
+        return self.lookup_synsets([word], pos, lang_code)[0]
+
+    def lookup_synsets(self, words, pos=None, lang_code="eng"):
+        """
+        Returns the Wordnet Synsets for each of these words with
+        this part of speech, as in word_synsets().
+        ~
+        Each distinct word is looked up in SYNSET_CACHE, and only
+        looked up in WordNet on a miss.
+
+        :param words: List[str], words to lookup synsets for
+        :param pos: str or Iterable, words' part(s) of speech
+        :param lang_code: str, words' language
+        :return: List[List[Synset]], synsets for each word
+        """
+        pos_abbrev = self.abbreviate_pos(pos) if pos is not None else None
+        if pos_abbrev is None or type(pos_abbrev) == str:
+            pos_key = pos_abbrev
+        else:
+            pos_key = tuple(pos_abbrev)
+        found = {}
+
+        for word in words:
+            if word in found:
+                continue
+            key = (word, pos_key, lang_code)
+            synsets = SYNSET_CACHE.get(key)
+            if synsets is MISSING:
+                synsets = tuple(self.wordnet_synsets(word, pos, lang_code))
+                SYNSET_CACHE.put(key, synsets)
+            found[word] = synsets
+
+        return [list(found[word]) for word in words]
+
+    def wordnet_synsets(self, word, pos=None, lang_code="eng"):
+        """
+        Looks up this word's synsets in WordNet, bypassing
+        SYNSET_CACHE, as in word_synsets().
+
+        :param word: str, word to lookup synsets for
+        :param pos: str or Iterable, word's part(s) of speech
+        :param lang_code: str, word's language
+        :return: List[Synset], synsets under this word, pos, and lang
+        """
         pos_abbrev = self.abbreviate_pos(pos) if pos is not None else None
 
         try:
@@ -1773,6 +2206,22 @@ class BlissTranslator:
 
         return synsets
 
+    @staticmethod
+    def invalidate_synsets(lang_code=None):
+        """
+        Removes cached synsets in this language from SYNSET_CACHE,
+        or all cached synsets if lang_code is None.
+        ~
+        Call whenever WordNet's lemmas for lang_code change.
+
+        :param lang_code: Optional[str], language code of synsets to remove
+        :return: None
+        """
+        if lang_code is None:
+            SYNSET_CACHE.clear()
+        else:
+            SYNSET_CACHE.invalidate(lambda key: key[2] == lang_code)
+
     def words_synsets(self, words, pos=None, lang_code="eng"):
         """
         Returns a list of Wordnet Synsets corresponding to this
@@ -1789,8 +2238,7 @@ class BlissTranslator:
         if len(words) != 0:
             synsets = OrderedSet([])
 
-            for word in words:
-                word_synsets = self.word_synsets(word, pos=pos, lang_code=lang_code)
+            for word_synsets in self.lookup_synsets(words, pos, lang_code):
                 if len(word_synsets) != 0:
                     synsets.update(word_synsets)
 
@@ -1938,13 +2386,24 @@ class BlissTranslator:
         Translates input phrase to Blissymbols according to this
         BlissTranslator's part-of-speech and language preferences.
         ~
-        Saves translation to a PDF file in this directory's
-        out folder with this title, or otherwise
-        titled after this phrase's first 20 characters.
+        Saves translation to its TranslationSession's PDF file,
+        or to translation.pdf in this directory's out folder
+        if called outside a session.
         ~
         Default image size is 816x1056px (standard PDF page).
+        ~
+        Text is translated a paragraph at a time and each page is
+        written as soon as it's full, so memory use doesn't grow
+        with phrase's length.  phrase may be an open text file.
+        ~
+        If workers is more than 1, paragraphs are translated in
+        that many processes, with the same output.
+        ~
+        Each call translates in its own TranslationSession (or
+        the current one), so this BlissTranslator can translate
+        several documents at once from different threads.
 
-        :param phrase: str, text in BlissTranslator's native language
+        :param phrase: str or TextIO, text in BlissTranslator's native language
         :keyword lang: str, phrase's language
         :keyword width: int, desired width of PDF pages (in pixels)
         :keyword height: int, desired height of PDF pages (in pixels)
@@ -1952,15 +2411,32 @@ class BlissTranslator:
         :keyword title_pg: bool, whether to create title page
         :keyword pos: Iterable[str], Penn Treebank parts of speech to translate
         :keyword page_nums: bool, whether to add numbers to PDF pages
+        :keyword workers: int, number of processes to translate with
         :return: FPDF, pdf document named title with pages of phrase in Blissymbols
         """
-        kwargs = self._setdefault_kwargs(**kwargs)
-        pages = self.translate_to_pages(phrase, **kwargs)
-        pdf = self.get_pdf(
-            kwargs["title"], pages, margins=50, page_nums=kwargs["page_nums"]
+        session = self.current_session()
+        if session is None:
+            pdf_path = PATH + "/out/" + "translation" + ".pdf"
+            with self.session(pdf_path=pdf_path, **kwargs) as session:
+                return self.translate(phrase, **kwargs)
+
+        kwargs = dict(session.options, **kwargs)
+        img_w, img_h = kwargs["width"], kwargs["height"]
+        writer = self.pdf_writer(
+            margins=50, page_nums=kwargs["page_nums"], path=session.output_path()
         )
-        self.refresh_data()
-        return pdf
+
+        if kwargs["workers"] > 1:
+            images = parallel_images(self, phrase, **kwargs)
+        else:
+            images = self.iter_images(phrase, **kwargs)
+
+        if kwargs["title_pg"]:
+            writer.add_page(self.title_page(kwargs["title"], img_w, img_h))
+        for page in self.iter_pages(images, img_w, img_h):
+            writer.add_page(page)
+
+        return writer.close()
 
     def translate_to_pages(self, phrase, **kwargs):
         """
@@ -1969,6 +2445,9 @@ class BlissTranslator:
         ~
         Returns a list of Images of pages translated to Blissymbols.
         ~
+        Paragraphs unchanged since they were last translated with
+        the same options are reused rather than translated again.
+        ~
         Default image size is 816x1056px (standard PDF page).
 
         :param phrase: str, text to translate to pages of Blissymbols
@@ -1984,7 +2463,7 @@ class BlissTranslator:
         """
         kwargs = self._setdefault_kwargs(**kwargs)
         img_w, img_h = kwargs["width"], kwargs["height"]
-        images = self.translate_to_images(phrase, **kwargs)
+        images = self.iter_images(phrase, **kwargs)
         pages = self.images_to_pages(images, img_w, img_h)
 
         if kwargs["title_pg"]:
@@ -1999,18 +2478,25 @@ class BlissTranslator:
         and returns the list.
 
         :param phrase: str, phrase to translate to TranslationWords
+        :keyword cache: LRUCache, TranslationWords to reuse
         :return: List[TranslationWord], TWs for each word in phrase
         """
         kwargs = self._setdefault_kwargs(**kwargs)
         lang = kwargs["lang"]
         word_tags = self.tokenize_pos_tag(phrase, lang)
+        cache = kwargs.get("cache", None)
+        if cache is None:
+            cache = self.transword_cache
+        if cache is None:
+            cache = LRUCache(maxsize=max(len(word_tags), 1))
         return [
-            self.translation_word(
+            self.cached_translation_word(
                 word_tag[0].lower()
                 if self.in_bliss_dict(word_tag[0].lower(), lang)
                 else word_tag[0],
                 word_tag[1],
                 lang,
+                cache,
             )
             if self.is_word(word_tag[0])
             else word_tag[0]
@@ -2061,12 +2547,293 @@ class BlissTranslator:
         """
         kwargs = self._setdefault_kwargs(**kwargs)
         trans_words = self.translate_to_transwords(phrase, **kwargs)
+        imgs = self.transwords_to_images(trans_words, sub_all=kwargs["sub_all"])
+        self.init_seen_changed()
+        return imgs
+
+    def iter_paragraphs(self, text, max_chars=None):
+        """
+        Yields each paragraph of this text, reading it one
+        line at a time.
+        ~
+        Paragraphs are separated by blank lines.  Paragraphs
+        longer than max_chars are split at a line break.
+
+        :param text: str or Iterable[str], text or open text file
+        :param max_chars: Optional[int], most characters per paragraph
+        :return: Generator[str], text's paragraphs
+        """
+        if max_chars is None:
+            max_chars = self.PARAGRAPH_CHARS
+        lines = io.StringIO(text) if type(text) == str else text
+        paragraph = []
+        size = 0
+
+        for line in lines:
+            if len(line.strip()) == 0:
+                if len(paragraph) != 0:
+                    yield "".join(paragraph)
+                    paragraph, size = [], 0
+            else:
+                paragraph.append(line)
+                size += len(line)
+                if size >= max_chars:
+                    yield "".join(paragraph)
+                    paragraph, size = [], 0
+
+        if len(paragraph) != 0:
+            yield "".join(paragraph)
+
+    def iter_images(self, text, **kwargs):
+        """
+        Yields an Image for each word/symbol in this text,
+        translating it a paragraph at a time.
+        ~
+        Yields None after each paragraph, as for the paragraph
+        breaks in translate_to_images().  TranslationWords are
+        reused across paragraphs through a bounded cache, and
+        unchanged paragraphs are reused from PARAGRAPH_CACHE,
+        see cached_render().
+
+        :param text: str or Iterable[str], text or open text file
+        :return: Generator[Image], an Image for each word/symbol in text
+        """
+        kwargs = self._setdefault_kwargs(**kwargs)
+        if kwargs.get("cache", None) is None:
+            kwargs["cache"] = self.transword_cache
+        if kwargs["cache"] is None:
+            kwargs["cache"] = LRUCache(maxsize=self.STREAM_CACHE_SIZE)
+
+        try:
+            for paragraph in self.iter_paragraphs(text):
+                rendered = self.cached_render(paragraph, **kwargs)
+                imgs = self.place_rendered(rendered, sub_all=kwargs["sub_all"])
+                del rendered
+                for img in imgs:
+                    yield img
+                if len(imgs) != 0 and imgs[-1] is not None:
+                    yield None
+        finally:
+            self.init_seen_changed()
+
+    def paragraph_key(self, paragraph, **kwargs):
+        """
+        Returns the key this paragraph's rendering is cached
+        under with these translation options.
+        ~
+        Paragraphs are keyed by a hash of their text, so editing
+        one paragraph of a document only changes its key.  Keys
+        of translators whose own lexicon was edited tell them
+        apart, since their lexicons differ from the shared one.
+        Learned data doesn't change keys, see cached_render().
+
+        :param paragraph: str, paragraph to translate
+        :return: tuple, paragraph's key in PARAGRAPH_CACHE
+        """
+        kwargs = self._setdefault_kwargs(**kwargs)
+        return (
+            hashlib.sha256(paragraph.encode("utf-8")).hexdigest(),
+            kwargs["lang"],
+            self.font_path,
+            self.font_size,
+            kwargs["sub_all"],
+            frozenset(kwargs["pos"]),
+            self.lexicon_id,
+        )
+
+    def cached_render(self, paragraph, **kwargs):
+        """
+        Returns this paragraph rendered as in render_paragraph(),
+        reusing its rendering from PARAGRAPH_CACHE if it's been
+        rendered with the same options before.
+        ~
+        Renderings are cached with their Images compressed, and
+        the words they were rendered from.  A rendering is reused
+        unless data was learned for one of its words since, other
+        than by the session which rendered it, so a session's own
+        learning doesn't spoil its paragraphs for the next pass.
+        ~
+        Renderings are cached under their key once rendered,
+        since rendering may edit this translator's lexicon.
+
+        :param paragraph: str, paragraph to translate
+        :return: List[Optional[tuple]], rendered words
+        """
+        key = self.paragraph_key(paragraph, **kwargs)
+        cached = PARAGRAPH_CACHE.get(key, valid=self.is_fresh)
+        if cached is MISSING:
+            session = current_session()
+            source = None if session is None else session.serial
+            edit = latest_edit()
+            rendered = self.render_paragraph(paragraph, **kwargs)
+            key = self.paragraph_key(paragraph, **kwargs)
+            self.cache_rendered(key, paragraph, rendered, edit, source)
+            return rendered
+        return self.unpack_rendered(cached[0])
+
+    def cache_rendered(self, key, paragraph, rendered, edit, source=None):
+        """
+        Caches this paragraph's rendering in PARAGRAPH_CACHE.
+
+        :param key: tuple, key of translator which rendered it,
+            as in paragraph_key() once it was rendered
+        :param paragraph: str, paragraph rendered
+        :param rendered: List[Optional[tuple]], as in render_paragraph()
+        :param edit: int, latest_edit() when rendering started
+        :param source: Optional[int], serial of session which rendered it
+        :return: None
+        """
+        words = re.findall(r"\w+", paragraph)
+        words.extend(entry[0] for entry in rendered if entry is not None and entry[0])
+        PARAGRAPH_CACHE.put(
+            key,
+            (self.pack_rendered(rendered), frozenset(word_keys(words)), edit, source),
+        )
+
+    @staticmethod
+    def is_fresh(cached):
+        """
+        Returns True if no data was learned for this cached
+        rendering's words since it was rendered, other than
+        by the session which rendered it.
+
+        :param cached: tuple, as cached by cache_rendered()
+        :return: bool, whether cached rendering is up to date
+        """
+        _, words, edit, source = cached
+        return not learned_since(words, edit, source)
+
+    @staticmethod
+    def pack_rendered(rendered):
+        """
+        Returns these rendered words with their Images compressed.
+
+        :param rendered: List[Optional[tuple]], as in render_paragraph()
+        :return: Tuple[Optional[tuple]], rendered words with packed Images
+        """
+        pack = lambda img: None if img is None else pack_image(img)
+        return tuple(
+            None if entry is None else (entry[0], pack(entry[1]), pack(entry[2]))
+            for entry in rendered
+        )
+
+    @staticmethod
+    def unpack_rendered(packed):
+        """
+        Returns the rendered words compressed by pack_rendered().
+
+        :param packed: Tuple[Optional[tuple]], rendered words with packed Images
+        :return: List[Optional[tuple]], as in render_paragraph()
+        """
+        unpack = lambda img: None if img is None else unpack_image(img)
+        return [
+            None if entry is None else (entry[0], unpack(entry[1]), unpack(entry[2]))
+            for entry in packed
+        ]
+
+    @staticmethod
+    def paragraph_cache_stats():
+        """
+        Returns how many paragraphs have been reused from
+        PARAGRAPH_CACHE (hits) and rendered anew (misses).
+
+        :return: dict, as in LRUCache.stats()
+        """
+        return PARAGRAPH_CACHE.stats()
+
+    def render_paragraph(self, paragraph, **kwargs):
+        """
+        Translates this paragraph and draws each word's Image,
+        leaving subtitling to place_rendered().
+        ~
+        Unless sub_all is set, a word's subtitled and plain Images
+        are both drawn for its first occurrence in paragraph, since
+        whether it's subtitled depends on the paragraphs before it.
+        Later occurrences are only drawn plain.
+        ~
+        Used to translate paragraphs in parallel, see
+        parallel_translation.
+
+        :param paragraph: str, paragraph to translate
+        :return: List[Optional[tuple]], None for a paragraph break,
+            else a word's lemma (None if untranslated), its subtitled
+            Image, and its plain Image
+        """
+        kwargs = self._setdefault_kwargs(**kwargs)
+        sub_all = kwargs["sub_all"]
+        trans_words = self.translate_to_transwords(paragraph, **kwargs)
+        rendered = []
+        drawn = set()
+
+        for trans_word in trans_words:
+            if type(trans_word) == str:
+                if trans_word in self.BREAKS:
+                    rendered.append(None)
+                else:
+                    img = self.word_image(trans_word)
+                    rendered.append((None, img, img))
+            else:
+                lemma = trans_word.lemma
+                if lemma == "\n":
+                    rendered.append(None)
+                elif sub_all:
+                    rendered.append((lemma, trans_word.image(subs=True), None))
+                elif lemma in drawn:
+                    rendered.append((lemma, None, trans_word.image(subs=False)))
+                else:
+                    drawn.add(lemma)
+                    rendered.append(
+                        (lemma, trans_word.image(subs=True), trans_word.image(subs=False))
+                    )
+
+        return rendered
+
+    def place_rendered(self, rendered, sub_all=True):
+        """
+        Returns the Images for these rendered words, subtitling
+        each as transwords_to_images() would.
+        ~
+        Rendered paragraphs must be placed in order, since words
+        are noted in words_changed and words_seen.
+
+        :param rendered: List[Optional[tuple]], as in render_paragraph()
+        :param sub_all: bool, whether to subtitle all Blissymbols
+        :return: List[Image], an Image (or None) for each word
+        """
+        imgs = []
+
+        for entry in rendered:
+            if entry is None:
+                imgs.append(None)
+                continue
+            lemma, subbed, plain = entry
+            if lemma is None:
+                imgs.append(subbed)
+            else:
+                subs = sub_all or not self.is_changed(lemma)
+                self.add_changed(lemma) if subs else self.add_seen(lemma)
+                imgs.append(subbed if subs else plain)
+
+        return imgs
+
+    def transwords_to_images(self, trans_words, sub_all=True):
+        """
+        Returns an Image for each of these TranslationWords
+        (or untranslated strs).
+        ~
+        Paragraph breaks and sentence-final punctuation are None.
+        If sub_all is False, only subtitles each word's first
+        Blissymbol, noting words in words_changed and words_seen.
+
+        :param trans_words: List[TranslationWord or str], words to draw
+        :param sub_all: bool, whether to subtitle all Blissymbols
+        :return: List[Image], an Image (or None) for each word
+        """
         imgs = []
 
         for trans_word in trans_words:
-            print("word", trans_word)
             if type(trans_word) == str:
-                if trans_word in ["\n", '!', '.', '?', '!.']:
+                if trans_word in self.BREAKS:
                     imgs.append(None)
                 else:
                     imgs.append(self.word_image(trans_word))
@@ -2075,12 +2842,11 @@ class BlissTranslator:
                 if lemma == "\n":
                     imgs.append(None)
                 else:
-                    subs = kwargs["sub_all"] or not self.is_changed(lemma)
+                    subs = sub_all or not self.is_changed(lemma)
                     self.add_changed(lemma) if subs else self.add_seen(lemma)
                     img = trans_word.image(subs=subs)
                     imgs.append(img)
 
-        self.init_seen_changed()
         return imgs
 
     def images_to_lines(self, images, w=WIDTH, init_indent=True):
@@ -2172,10 +2938,24 @@ class BlissTranslator:
         :param h: int, desired height of each page (in pixels)
         :return: List[Image], pages with images pasted
         """
+        return list(self.iter_pages(images, w, h))
+
+    def iter_pages(self, images, w=WIDTH, h=HEIGHT):
+        """
+        Pastes each image in images to pages, yielding each
+        page as soon as it's full.
+        ~
+        Only the page being filled is kept in memory, so images
+        can be a generator over a text of any length.
+
+        :param images: Iterable[Image], Images to paste to pages (in order)
+        :param w: int, desired width of each page (in pixels)
+        :param h: int, desired height of each page (in pixels)
+        :return: Generator[Image], pages with images pasted
+        """
         space = self.space_size()
         indent = self.font_size
 
-        pages = []
         new_page = lambda: blank_image(w, h)
         page = new_page()
 
@@ -2197,28 +2977,35 @@ class BlissTranslator:
                 if inc_y() > h:
                     # y > pdf height
                     x, y = 0, 0
-                    pages.append(page)
+                    yield page
                     page = new_page()
 
                 page.paste(image, (x, y))
                 x = inc_x(image)
 
-        pages.append(page)
-        return pages
+        yield page
 
     def analyze_concepts(self, phrase):
         """
         Translates this phrase to Blissymbols and
         returns a frequency dictionary of the most common
         derivative Blissymbols in the output translations.
+        ~
+        Given a list of phrases, e.g. a corpus of documents,
+        analyzes the concepts of all of them together.
 
-        :param phrase: str, phrase to analyze concepts of
+        :param phrase: str or Iterable[str], phrase(s) to analyze concepts of
         :return: dict, where...
             key (str) - name of Blissymbol
             val (int) - number of occurrences in translation
         """
-        phrase = str(phrase)
-        trans_words = self.translate_to_transwords(phrase)
+        if isinstance(phrase, str) or not hasattr(phrase, "__iter__"):
+            phrases = [str(phrase)]
+        else:
+            phrases = phrase
+        trans_words = []
+        for phrase in phrases:
+            trans_words += self.translate_to_transwords(phrase)
         return self.analyze_trans_word_concepts(trans_words)
 
     def analyze_trans_word_concepts(self, trans_words):
@@ -2231,20 +3018,40 @@ class BlissTranslator:
             key (str) - name of Blissymbol
             val (int) - number of occurrences in translation
         """
-        concept_freqs = {}
+        atom_table = self.lex_parser.load_atomic_derivations()
+        bci_nums = []
+        concept_freqs = collections.Counter()
 
         for trans_word in trans_words:
-            if trans_word.has_blissymbol():
+            if type(trans_word) != str and trans_word.has_blissymbol():
                 blissymbol = trans_word.blissymbol
-                subsymbols = blissymbol.get_subsymbols()
+                if blissymbol.bci_num in atom_table:
+                    bci_nums.append(blissymbol.bci_num)
+                else:
+                    for subsymbol in self.atomic_blissymbols(blissymbol):
+                        concept_freqs[subsymbol.bliss_name] += 1
+
+        for bci_num, count in atom_table.histogram(bci_nums).items():
+            subsymbol = self.bci_num_to_blissymbol(bci_num)
+            if subsymbol is not None:
+                concept_freqs[subsymbol.bliss_name] += count
 
-                if len(subsymbols) != 0:
-                    for subsymbol in subsymbols:
-                        name = subsymbol.bliss_name
-                        concept_freqs.setdefault(name, int())
-                        concept_freqs[name] += 1
+        return dict(concept_freqs)
 
-        return concept_freqs
+    def atomic_blissymbols(self, blissymbol):
+        """
+        Returns the atomic Blissymbols this blissymbol is derived from.
+        ~
+        e.g. rabbit == rodent + ear == (animal + teeth) + ear
+
+        :param blissymbol: Blissymbol, Blissymbol to expand
+        :return: List[Blissymbol], blissymbol's atomic derivation
+        """
+        bci_nums = self.lex_parser.load_atomic_derivations().get(blissymbol.bci_num)
+        if bci_nums is not None:
+            atoms = [self.bci_num_to_blissymbol(bci_num) for bci_num in bci_nums]
+            return [atom for atom in atoms if atom is not None]
+        return self.lex_parser.atomic_derivation(blissymbol, self.blissword_to_blissymbol)
 
     def _setdefault_kwargs(self, **kwargs):
         kwargs.setdefault("title", "translation")
@@ -2256,6 +3063,7 @@ class BlissTranslator:
         kwargs.setdefault("machine_learn", False)
         kwargs.setdefault("fast", True)
         kwargs.setdefault("lang", self.language)
+        kwargs.setdefault("workers", 1)
         kwargs.setdefault(
             "pos", PARTS_OF_SPEECH
         )  # set of desired parts of speech to translate
@@ -798,8 +798,12 @@ class BlissClassifier:
         if answer == "n":
             self.choose_translation(trans_word)
             unicodes = [
-                self.unicode_to_str(bs.unicode)
-                for bs in trans_word.blissymbol.derivation_blissymbols(True)
+                self.unicode_to_str(uni)
+                for uni in self.translator.blissymbols_to_unicodes(
+                    trans_word.blissymbol.derivation_blissymbols(
+                        True, translator=self.translator
+                    )
+                )
             ]
             prediction = " ".join(unicodes)
             return prediction
@@ -821,15 +825,16 @@ class BlissClassifier:
             prediction = self.predict(list(pair))
             unicodes = self.prediction_to_unicodes(prediction)
 
-            for uni in unicodes:
-                blisswords = self.translator.lookup_bliss_unicode(uni=uni)
-
-                for blissword in blisswords:
-                    entries = self.translator.lookup_bliss_dict(blissword, "English")
-
-                    if entries is not None:
-                        blissymbol = next(iter(entries))
+            blisswords = [self.translator.lookup_bliss_unicode(uni=uni) for uni in unicodes]
+            found = iter(
+                self.translator.lookup_many(
+                    [bw for bws in blisswords for bw in bws], lang="English"
+                )
+            )
 
+            for bws in blisswords:
+                for blissymbol in [next(found) for _ in bws]:
+                    if blissymbol is not None:
                         if debug:
                             blissymbol = self.verify_translation(trans_word, blissymbol)
                             if blissymbol is None:
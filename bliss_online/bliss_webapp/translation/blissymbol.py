@@ -15,9 +15,13 @@ from imports import safe_import
 safe_import("images")
 safe_import("parts_of_speech")
 safe_import("resources")
+safe_import("glyph_manifest")
+safe_import("translation_session")
 from images import *
 from parts_of_speech import *
-from resources.data.bci_blissnet import BCI_BLISSNET
+from glyph_manifest import GLYPHS
+from translation_session import current_session
+from resources.data import blissnets
 
 NEW_BLISSYMBOLS = (
     []
@@ -55,7 +59,6 @@ class Blissymbol:
             self.translations = self.clean_translations(
                 translations
             )  # holds translations in different languages
-            self.synsets = None
             self.init_synsets()
         else:
             self.bliss_name = bliss_name
@@ -64,9 +67,110 @@ class Blissymbol:
             self.translations = {}
             self.translator = translator
             self.bci_num = 0
-            self.synsets = None
+            self._synset_strs = None
+            self._synsets = None
         self.translations = {k: sorted(v) for k, v in self.translations.items()}
 
+    @classmethod
+    def from_snapshot_row(cls, row, translator):
+        """
+        Returns a Blissymbol restored from this lexicon snapshot row.
+        ~
+        Skips __init__, since snapshot rows hold fields which were
+        already resolved when the snapshot was built, i.e. no image
+        files are checked and no translations are cleaned.
+
+        :param row: tuple, row from Blissymbol.snapshot_row()
+        :param translator: BlissTranslator, translator for this Blissymbol
+        :return: Blissymbol, Blissymbol for this row
+        """
+        blissymbol = cls.__new__(cls)
+        bliss_name, pos, derivation, translations, bci_num, synsets = row
+        blissymbol.translator = translator
+        blissymbol.bliss_name = bliss_name
+        blissymbol.pos = pos
+        blissymbol.derivation = derivation
+        blissymbol.translations = translations
+        blissymbol.bci_num = bci_num
+        blissymbol._synset_strs = synsets
+        blissymbol._synsets = None
+        return blissymbol
+
+    def snapshot_row(self):
+        """
+        Returns this Blissymbol's resolved fields as a tuple
+        of plain values, for storing in a lexicon snapshot.
+
+        :return: tuple, (bliss_name, pos, derivation, translations,
+            bci_num, synset strings) for this Blissymbol
+        """
+        if self._synsets is not None:
+            synsets = [s.name() for s in self._synsets]
+        else:
+            synsets = self._synset_strs
+        return (
+            self.bliss_name,
+            self.pos,
+            self.derivation,
+            self.translations,
+            self.bci_num,
+            synsets,
+        )
+
+    def copy(self, translator=None):
+        """
+        Returns a copy of this Blissymbol with its own parts of speech
+        and translations, so the copy can be modified without
+        modifying this Blissymbol.
+
+        :param translator: Optional[BlissTranslator], translator for copy
+        :return: Blissymbol, copy of this Blissymbol
+        """
+        blissymbol = self.__class__.__new__(self.__class__)
+        blissymbol.translator = self.translator if translator is None else translator
+        blissymbol.bliss_name = self.bliss_name
+        blissymbol.pos = self.pos[:]
+        blissymbol.derivation = self.derivation[:]
+        blissymbol.translations = {
+            lang: list(trans) for lang, trans in self.translations.items()
+        }
+        blissymbol.bci_num = self.bci_num
+        blissymbol._synset_strs = self._synset_strs
+        blissymbol._synsets = self._synsets
+        return blissymbol
+
+    def resolver(self, translator=None):
+        """
+        Returns the BlissTranslator to look up this Blissymbol's
+        derivations, synsets and images with.
+        ~
+        Core Blissymbols are shared by every BlissTranslator, but
+        keep the one which loaded them, so callers pass their own
+        translator rather than resolving through another's lexicon.
+
+        :param translator: Optional[BlissTranslator], caller's translator
+        :return: BlissTranslator, translator if given, else self.translator
+        """
+        return self.translator if translator is None else translator
+
+    @property
+    def synsets(self):
+        """
+        Returns this Blissymbol's English WordNet Synsets.
+        ~
+        Synsets are looked up from this Blissymbol's synset strings
+        the first time they're read, then cached.
+
+        :return: Optional[List[Synset]], this Blissymbol's synsets
+        """
+        if self._synsets is None and self._synset_strs is not None:
+            self._synsets = self.translator.strs_synsets(self._synset_strs)
+        return self._synsets
+
+    @synsets.setter
+    def synsets(self, synsets):
+        self._synsets = synsets
+
     @property
     def is_atomic(self):
         return len(self.derivation) == 1
@@ -77,9 +181,8 @@ class Blissymbol:
 
     @property
     def unicode(self):
-        return self.translator.lex_parser.load_bliss_unicode().get(
-            self.bliss_name, " ".join(self.find_deriv_unicode())
-        )
+        uni = self.translator.lex_parser.load_bliss_unicode().get(self.bliss_name)
+        return uni if uni is not None else " ".join(self.find_deriv_unicode())
 
     def set_pos(self, pos):
         """
@@ -100,24 +203,27 @@ class Blissymbol:
             :param height: Optional[int], maximum height of output image
             :param whitebg: bool, whether to output white or transparent background
             :param text_img: bool, whether to return word or Blissymbol image
+            :param translator: Optional[BlissTranslator], translator drawing it
 
         :return: Image, image of this Blissymbol with given dimensions
         """
+        translator = self.resolver(kwargs.pop("translator", None))
         kwargs.setdefault("width", None)
-        height = kwargs.setdefault("height", self.translator.image_heights())
+        height = kwargs.setdefault("height", translator.image_heights())
         kwargs.setdefault("whitebg", False)
         is_text = kwargs.setdefault("text_img", False)
         subs = kwargs.setdefault("subs", False)
         if is_text:
             return word_image(self.bliss_name, img_h=height, subs=subs)
         else:
-            return self.translator.bliss_image(self.bliss_name, **kwargs)
+            return translator.bliss_image(self.bliss_name, **kwargs)
 
     @property
     def indicators(self):
         return [d for d in self.derivation if self.is_indicator(d)]
 
-    def overlay_indicators(self, img, indicators):
+    def overlay_indicators(self, img, indicators, translator=None):
+        translator = self.resolver(translator)
         if len(indicators) == 0:
             return img
         # elif len(indicators) == 1:
@@ -129,7 +235,7 @@ class Blissymbol:
                 key=lambda i: INDICATORS.get(i[11:-1], max(INDICATORS.values()) + 1),
             )
             ind_imgs = [
-                self.translator.bliss_image(
+                translator.bliss_image(
                     ind, width=img.size[0], height=img.size[1], whitebg=False
                 )
                 for ind in indicators
@@ -139,30 +245,32 @@ class Blissymbol:
                 ind_banner = beside(ind_banner, ind_img)
             if len(deriv_inds) != 0:
                 # cover up indicator area (up to 350y)
-                cover = self.translator.blank_image(
+                cover = translator.blank_image(
                     x=img.size[0], y=img.size[1] // 3, opacity=255
                 )
                 img.paste(cover, (0, 0))
             return overlay(ind_banner, img)
 
-    def indicator_image(self, img, indicator):
+    def indicator_image(self, img, indicator, translator=None):
         """
         Returns this Blissymbol img with this indicator.
 
         :param img: Image, Blissymbol image to pluralize
         :param indicator: str, name of indicator
+        :param translator: Optional[BlissTranslator], translator drawing it
         :return: Image, input image pluralized
         """
+        translator = self.resolver(translator)
         bliss_indicators = self.indicators
-        ind = self.translator.bliss_image(
+        ind = translator.bliss_image(
             indicator, width=img.size[0], height=img.size[1], whitebg=True
         )
         if len(bliss_indicators) != 0:
             # indicator width = 158
-            blank_img = self.translator.blank_image(
+            blank_img = translator.blank_image(
                 x=int(158 * 1.5 * len(bliss_indicators)), y=img.size[1], opacity=0
             )
-            ind = self.translator.beside(blank_img, ind)
+            ind = translator.beside(blank_img, ind)
         return overlay(ind, img)
 
     def is_punct(self):
@@ -177,15 +285,12 @@ class Blissymbol:
         """
         Returns True if this Blissymbol's img_filename can be opened,
         False otherwise.
+        ~
+        Checks the glyph manifest rather than the image directory.
 
         :return: bool, whether img_filename can be opened
         """
-        try:
-            open(IMG_PATH + self.bliss_name + ".png")
-        except IOError:
-            return False
-        else:
-            return True
+        return self.bliss_name in GLYPHS
 
     def check_img_filename(self):
         """
@@ -197,19 +302,14 @@ class Blissymbol:
         """
         if not self.valid_filename():
             for name in self.bliss_name.split(","):
-                filename = name + ".png"
-                try:
-                    open(IMG_PATH + filename)
-                except IOError:
-                    continue
-                else:
+                if name in GLYPHS:
                     self.bliss_name = name
                     break
             else:
                 print("couldn't open file: " + self.bliss_name + str(self.derivation))
 
-            if len(self.derivation) != 0:
-                self.new_blissymbol(self.derivation, self.bliss_name)
+                if len(self.derivation) != 0:
+                    self.new_blissymbol(self.derivation, self.bliss_name)
 
     def count_indicators(self):
         count = 0
@@ -218,7 +318,7 @@ class Blissymbol:
                 count += 1
         return count
 
-    def derivation_blissymbols(self, atomic=True):
+    def derivation_blissymbols(self, atomic=True, translator=None):
         """
         Returns a list of Blissymbols for this Blissymbol's derivation.
         ~
@@ -232,8 +332,10 @@ class Blissymbol:
              bs.derivation_blissymbols(True) -> [Blissymbol("animal"), Blissymbol("teeth"), Blissymbol("ear")]
 
         :param atomic: bool, whether to return only atomic Blissymbol derivations
+        :param translator: Optional[BlissTranslator], translator to look up derivations with
         :return: List[Blissymbol], this Blissymbol's derivative Blissymbols
         """
+        translator = self.resolver(translator)
         bliss_derivatives = list()
 
         if self.is_atomic:
@@ -241,7 +343,7 @@ class Blissymbol:
             return bliss_derivatives
         else:
             for derivation in self.derivation:
-                deriv_bliss = self.translator.blissword_to_blissymbol(derivation)
+                deriv_bliss = translator.blissword_to_blissymbol(derivation)
 
                 if (
                     deriv_bliss is None
@@ -252,7 +354,9 @@ class Blissymbol:
                     continue
                 else:
                     if atomic:
-                        bliss_derivatives += deriv_bliss.derivation_blissymbols(atomic)
+                        bliss_derivatives += deriv_bliss.derivation_blissymbols(
+                            atomic, translator=translator
+                        )
                     else:
                         bliss_derivatives.append(self)
 
@@ -261,7 +365,7 @@ class Blissymbol:
 
             return bliss_derivatives
 
-    def new_blissymbol(self, derivations, bliss_name):
+    def new_blissymbol(self, derivations, bliss_name, translator=None):
         """
         Given a list of derivations for a Blissymbol,
         combines derivations to make a new Blissymbol image
@@ -271,8 +375,10 @@ class Blissymbol:
 
         :param derivations: List[str], derivative Blissymbol(s)
         :param bliss_name: str, name of new Blissymbol
+        :param translator: Optional[BlissTranslator], translator drawing it
         :return: Image, new Blissymbol image from derivations
         """
+        translator = self.resolver(translator)
         if bliss_name is None:
             bliss_name = self.bliss_name
 
@@ -282,11 +388,10 @@ class Blissymbol:
         space = 2
 
         for derivation in self.derivation:
-            blissymbol = self.translator.blissword_to_blissymbol(derivation)
+            blissymbol = translator.blissword_to_blissymbol(derivation)
 
             if blissymbol is not None:
-                bliss_name = blissymbol.bliss_name
-                bliss_img = self.translator.bliss_image(bliss_name)
+                bliss_img = translator.bliss_image(blissymbol.bliss_name)
             else:
                 print("couldn't find Blissymbol derivation for " + derivation + "...")
                 continue
@@ -317,11 +422,15 @@ class Blissymbol:
 
                 img = overlay(all_indicators, img)
 
-            img_path = str(IMG_PATH + bliss_name)
+            img_path = str(IMG_PATH + bliss_name + ".png")
             img.save(img_path)
+            GLYPHS.add(bliss_name, img)
             print("made new Blissymbol: " + bliss_name)
             print("with the derivations " + " ".join([d for d in derivations]))
             NEW_BLISSYMBOLS.append(img_path)
+            session = current_session()
+            if session is not None:
+                session.new_blissymbols.append(img_path)
             return img
 
     def add_translation(self, language, translation):
@@ -376,7 +485,7 @@ class Blissymbol:
         """
         return word in self.derivation
 
-    def get_subsymbols(self):
+    def get_subsymbols(self, translator=None):
         """
         Returns this Blissymbol's constituent atomic Blissymbols.
         ~
@@ -385,17 +494,12 @@ class Blissymbol:
         ~
         e.g. rabbit == rodent + ear == (animal + teeth) + ear
 
+        :param translator: Optional[BlissTranslator], translator to look up derivations with
         :return: List[Blissymbol], derivations of Blissymbol
         """
-        subderivations = []
-
-        for derivation in self.derivation:
-            subderivation = self.find_subsymbols(derivation)
-            subderivations += subderivation
-
-        return subderivations
+        return self.resolver(translator).atomic_blissymbols(self)
 
-    def find_subsymbols(self, derivation):
+    def find_subsymbols(self, derivation, translator=None):
         """
         Returns this Blissymbol's atomic derivations.
         ~
@@ -403,10 +507,12 @@ class Blissymbol:
         returns a list of the bottommost derivations.
 
         :param derivation: str, derivation to derive subderivations from
+        :param translator: Optional[BlissTranslator], translator to look up derivations with
         :return: List[Blissymbol], derivations of Blissymbol
         """
+        translator = self.resolver(translator)
         atoms = []
-        blissymbol = self.translator.blissword_to_blissymbol(derivation)
+        blissymbol = translator.blissword_to_blissymbol(derivation)
 
         if blissymbol is None:
             return atoms
@@ -423,7 +529,7 @@ class Blissymbol:
                 else:
                     for deriv in derivs:
                         if deriv not in blissymbol.derivations:
-                            atoms += blissymbol.find_subsymbols(deriv)
+                            atoms += blissymbol.find_subsymbols(deriv, translator)
                         else:
                             break
                     return atoms
@@ -570,7 +676,7 @@ class Blissymbol:
         """
         return POS_COLOURS[colour]
 
-    def derivation_unicodes(self, atomic=True):
+    def derivation_unicodes(self, atomic=True, translator=None):
         """
         Returns a list of this Blissymbol's derivations' unicode
         identifiers.
@@ -578,10 +684,12 @@ class Blissymbol:
         :return: List[str], this Blissymbol's derivations' unicode IDs
         """
         return (
-            [self.unicode] if self.is_atomic else self.find_deriv_unicode(atomic=atomic)
+            [self.unicode]
+            if self.is_atomic
+            else self.find_deriv_unicode(atomic=atomic, translator=translator)
         )
 
-    def derivation_bci_nums(self, atomic=True):
+    def derivation_bci_nums(self, atomic=True, translator=None):
         """
         Returns a list of this Blissymbol's derivations' BCI-AV#s.
 
@@ -590,7 +698,7 @@ class Blissymbol:
         return (
             [self.bci_num]
             if self.is_atomic
-            else self.find_deriv_bci_nums(atomic=atomic)
+            else self.find_deriv_bci_nums(atomic=atomic, translator=translator)
         )
 
     def derivations_synonyms(self, derivations):
@@ -622,7 +730,7 @@ class Blissymbol:
         deriv_synonym = self.remove_parens(deriv_synonym)
         return deriv_synonym
 
-    def find_deriv_bci_nums(self, atomic=True):
+    def find_deriv_bci_nums(self, atomic=True, translator=None):
         """
         Returns a list of BCI-AV#s corresponding to
         the Blissymbol translations of this Blissymbol's
@@ -634,9 +742,12 @@ class Blissymbol:
         :return: List[int], BCI-AV#s for this Blissymbol's
             derivations
         """
-        return [db.bci_num for db in self.derivation_blissymbols(atomic=atomic)]
+        return [
+            db.bci_num
+            for db in self.derivation_blissymbols(atomic=atomic, translator=translator)
+        ]
 
-    def find_deriv_unicode(self, atomic=True):
+    def find_deriv_unicode(self, atomic=True, translator=None):
         """
         Returns a list of unicode strings corresponding to
         the Blissymbol translations of this Blissymbol's
@@ -648,7 +759,10 @@ class Blissymbol:
         :return: List[str], unicodes for this Blissymbol's
             derivations
         """
-        return [db.unicode for db in self.derivation_blissymbols(atomic=atomic)]
+        return [
+            db.unicode
+            for db in self.derivation_blissymbols(atomic=atomic, translator=translator)
+        ]
 
     def init_bci_num(self, bci_num):
         """
@@ -665,12 +779,15 @@ class Blissymbol:
 
     def init_synsets(self):
         """
-        Sets this Blissymbol's synsets as a corresponding list of
-        English Wordnet Synsets.
+        Sets this Blissymbol's synset strings from the Blissnet.
+        ~
+        Synset strings are only looked up in WordNet once this
+        Blissymbol's synsets are read.
 
         :return: None
         """
-        self.synsets = [self.translator.str_synset(s) for s in self.lookup_blissnet()]
+        self._synset_strs = self.lookup_blissnet()
+        self._synsets = None
 
     def lookup_blissnet(self):
         """
@@ -679,16 +796,18 @@ class Blissymbol:
 
         :return: List[str], synset strings
         """
-        return BCI_BLISSNET.get(self.bci_num, [])
+        return blissnets.BCI_BLISSNET.get(str(self.bci_num), [])
 
-    def find_synsets(self):
+    def find_synsets(self, translator=None):
         """
         Returns a list of English Wordnet synsets corresponding
         to this Blissymbol.
 
+        :param translator: Optional[BlissTranslator], translator to look up synsets with
         :return: Set[Synset], this Blissymbol's Wordnet synsets
         """
-        synsets = self.translator.ordered_set([])
+        translator = self.resolver(translator)
+        synsets = translator.ordered_set([])
         translations = self.translations
         word = self.bliss_name
         word = word.replace("_", " ")
@@ -696,25 +815,22 @@ class Blissymbol:
         pos = self.get_pos()
 
         if len(words) > 0:
-            word_synsets = self.translator.ordered_set([])
-            lang_synsets = self.translator.ordered_set([])
+            word_synsets = translator.ordered_set([])
+            lang_synsets = translator.ordered_set([])
 
-            for word in words:
-                word = self.remove_parens(word)
-                word = word.rstrip("_")
-                word_synset = self.translator.word_synsets(word, pos)
+            words = [self.remove_parens(word).rstrip("_") for word in words]
+            for word_synset in translator.lookup_synsets(words, pos):
                 word_synsets.update(word_synset)
 
             for lang in translations:
                 if lang != "English":
                     translation = translations[lang]
                     lang_synset = set()
-                    lang_code = self.translator.find_lang_code(lang)
+                    lang_code = translator.find_lang_code(lang)
 
-                    for defn in translation:
-                        synset = self.translator.word_synsets(
-                            defn, pos, lang_code=lang_code
-                        )
+                    for synset in translator.lookup_synsets(
+                        translation, pos, lang_code=lang_code
+                    ):
                         if synset is None:
                             lang = False
                             break
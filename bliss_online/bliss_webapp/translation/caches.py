@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+CACHES:
+
+    Holds bounded caches shared across BlissTranslators.
+"""
+import threading
+from collections import OrderedDict
+
+MISSING = object()  # distinguishes cached None from a cache miss
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded cache which evicts its least
+    recently used entry once it's full.
+    ~
+    Counts hits and misses, and can be cleared or have
+    entries invalidated when the data behind them changes.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=MISSING, valid=None):
+        """
+        Returns the value cached for this key, marking it
+        as most recently used.
+        ~
+        If key isn't cached, or valid is given and returns
+        False for its value, returns default.  Invalid values
+        are removed and counted as misses.
+
+        :param key: Hashable, key to lookup
+        :param default: Any, value to return on a miss
+        :param valid: Optional[function], returns False for stale values
+        :return: Any, cached value or default
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if valid is not None and not valid(value):
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Caches this value for this key, evicting the least
+        recently used entry if this cache is full.
+
+        :param key: Hashable, key to cache value under
+        :param value: Any, value to cache
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, predicate):
+        """
+        Removes every entry whose key satisfies this predicate.
+
+        :param predicate: function, returns True for keys to remove
+        :return: int, number of entries removed
+        """
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self):
+        """
+        Removes every entry from this cache and resets its counters.
+
+        :return: None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """
+        Returns this cache's hit and miss counts and size.
+
+        :return: dict, where...
+            key (str) - "hits", "misses", "size", or "maxsize"
+            val (int) - corresponding count
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+# (word, frozenset(pos), language) -> lemma, see BlissTranslator.lemmatize()
+LEMMA_CACHE = LRUCache(maxsize=65536)
+
+# (word, pos abbreviations, lang_code) -> synsets, see BlissTranslator.word_synsets()
+SYNSET_CACHE = LRUCache(maxsize=65536)
+
+# (paragraph hash, translation options) -> packed rendered words and
+# the words they depend on, see BlissTranslator.cached_render()
+PARAGRAPH_CACHE = LRUCache(maxsize=1024)
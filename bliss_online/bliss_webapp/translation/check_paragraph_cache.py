@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+CHECK_PARAGRAPH_CACHE:
+
+    Checks that translating an unchanged text again reuses its
+    paragraphs from PARAGRAPH_CACHE, and that learning a word
+    only re-renders the paragraphs it appears in.
+
+    Translates a text in one session, then again in another, and
+    counts PARAGRAPH_CACHE's hits and misses for the second pass.
+    Then notes a word as learned by neither session, and counts
+    again.  To run from command line:
+
+    > python check_paragraph_cache.py [--language English]
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+sys.path.append(os.path.dirname(PATH))  # so safe_import works when run from here
+from imports import safe_import
+
+safe_import("blisscribe")
+safe_import("caches")
+safe_import("lexicon_journal")
+from blisscribe import BlissTranslator
+from caches import PARAGRAPH_CACHE
+from lexicon_journal import note_learned
+
+TEXT = (
+    "The cat sat on the mat.\n"
+    "\n"
+    "A dog ran to the house.\n"
+    "\n"
+    "A bird sang in the tree.\n"
+)
+LEARNED = "dog"  # appears in one paragraph of TEXT
+
+
+def translation_pass(translator, text, **kwargs):
+    """
+    Returns how many of this text's paragraphs were reused
+    from PARAGRAPH_CACHE and rendered anew in one session.
+
+    :param translator: BlissTranslator, translator to translate with
+    :param text: str, text to translate
+    :return: Tuple[int, int], hits and misses
+    """
+    before = translator.paragraph_cache_stats()
+    with translator.session(**kwargs) as session:
+        for _ in translator.iter_images(text, **session.options):
+            pass
+    after = translator.paragraph_cache_stats()
+    return after["hits"] - before["hits"], after["misses"] - before["misses"]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check paragraph cache reuse.")
+    parser.add_argument("--language", default="English")
+    args = parser.parse_args(argv)
+
+    translator = BlissTranslator(language=args.language)
+    paragraphs = len(list(translator.iter_paragraphs(TEXT)))
+    PARAGRAPH_CACHE.clear()
+    results = []
+
+    translation_pass(translator, TEXT)
+    hits, misses = translation_pass(translator, TEXT)
+    print("unchanged: {} hits, {} misses".format(hits, misses))
+    results.append((hits, misses) == (paragraphs, 0))
+
+    note_learned([LEARNED])
+    hits, misses = translation_pass(translator, TEXT)
+    print("learned {!r}: {} hits, {} misses".format(LEARNED, hits, misses))
+    results.append((hits, misses) == (paragraphs - 1, 1))
+
+    ok = all(results)
+    print("same as expected" if ok else "DIFFERENT from expected")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+CHECK_PARALLEL:
+
+    Checks that translating in a pool of processes gives the same
+    pages as translating in one.
+
+    Translates a text whose words repeat across paragraphs, so which
+    repeats are subtitled depends on paragraphs being placed in order,
+    with workers=1 and with workers=2, and compares each page's pixels.
+    The parallel translation is checked with forked workers, and again
+    with a thread running, so workers start their own translators.
+    Both are checked with a fresh translator and with one whose own
+    lexicon has a translation the shared lexicon doesn't.
+    To run from command line:
+
+    > python check_parallel.py [--language English]
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+sys.path.append(os.path.dirname(PATH))  # so safe_import works when run from here
+import threading
+from imports import safe_import
+
+safe_import("blisscribe")
+safe_import("caches")
+safe_import("parallel_translation")
+from blisscribe import BlissTranslator
+from caches import PARAGRAPH_CACHE
+from parallel_translation import parallel_images, pool_context
+
+TEXT = (
+    "The cat sat on the mat.\n"
+    "A dog saw the cat.\n"
+    "\n"
+    "The dog ran to the house.\n"
+    "The cat ran after the dog.\n"
+    "\n"
+    "A bird sang in the tree by the house.\n"
+    "\n"
+    "The cat and the dog heard the bird.\n"
+    "The bird flew over the house and the tree.\n"
+    "\n"
+    "The moggy sat by the house.\n"
+)
+EDIT = ("cat", "English", "moggy")  # (Blissymbol name, language, translation)
+
+
+def render_pages(translator, text, workers, **kwargs):
+    """
+    Returns the pages of this text translated by this translator
+    with this many workers, as raw pixel data.
+
+    :param translator: BlissTranslator, translator to translate with
+    :param text: str, text to translate
+    :param workers: int, number of processes to translate with
+    :return: List[bytes], each page's pixels
+    """
+    PARAGRAPH_CACHE.clear()  # so every paragraph is translated
+    with translator.session(workers=workers, **kwargs) as session:
+        options = dict(session.options)
+        if workers > 1:
+            images = parallel_images(translator, text, **options)
+        else:
+            images = translator.iter_images(text, **options)
+        pages = translator.iter_pages(images, options["width"], options["height"])
+        return [page.tobytes() for page in pages]
+
+
+def check(translator, text, **kwargs):
+    """
+    Returns True if this text's pages are the same translated
+    with 1 and 2 workers, and prints which pages differ if not.
+
+    :param translator: BlissTranslator, translator to translate with
+    :param text: str, text to translate
+    :return: bool, whether pages are the same
+    """
+    method = pool_context().get_start_method()
+    expected = render_pages(translator, text, 1, **kwargs)
+    actual = render_pages(translator, text, 2, **kwargs)
+    same = expected == actual
+    print(
+        "{:>12} {:>5} pages: {}".format(
+            method, len(expected), "same" if same else "DIFFERENT"
+        )
+    )
+    if not same:
+        print("  pages per run:", len(expected), len(actual))
+        for i, (page, other) in enumerate(zip(expected, actual)):
+            if page != other:
+                print("  page", i, "differs")
+    return same
+
+
+def edited_translator(language):
+    """
+    Returns a new BlissTranslator with EDIT's translation added
+    to its own lexicon only, without journalling it.
+
+    :param language: str, translator's language
+    :return: BlissTranslator, translator with its own edit
+    """
+    translator = BlissTranslator(language=language)
+    bliss_name, edit_language, translation = EDIT
+    blissymbol = translator.blissword_to_blissymbol(bliss_name)
+    blissymbol = translator.own_blissymbol(blissymbol)
+    blissymbol.add_translations(edit_language, [translation])
+    translator.add_bliss_entry(blissymbol, journal=False)
+    return translator
+
+
+def check_all(translators, text):
+    """
+    Returns a list of whether each of these translators'
+    translations of this text match with 1 and 2 workers,
+    with and without subtitling all words.
+
+    :param translators: List[BlissTranslator], translators to check
+    :param text: str, text to translate
+    :return: List[bool], whether each check's pages are the same
+    """
+    return [
+        check(translator, text, sub_all=sub_all)
+        for translator in translators
+        for sub_all in (False, True)
+    ]
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check parallel translation.")
+    parser.add_argument("--language", default="English")
+    args = parser.parse_args(argv)
+
+    translators = [
+        BlissTranslator(language=args.language),
+        edited_translator(args.language),
+    ]
+    results = check_all(translators, TEXT)
+
+    # a running thread stops workers being forked
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait, daemon=True)
+    thread.start()
+    try:
+        results.extend(check_all(translators, TEXT))
+    finally:
+        stop.set()
+        thread.join()
+
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+CONCEPTS:
+
+    Counts the atomic Blissymbols, or concepts, that translated
+    Blissymbols are built from.
+
+    Each Blissymbol's fully expanded atomic derivation is stored
+    in one flat array, so counting concepts for a whole document
+    or corpus is a histogram over that array.  Uses numpy if it's
+    installed, and plain Counters otherwise.
+"""
+import collections
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class AtomTable:
+    """
+    A class for looking up the atomic derivations of Blissymbols
+    by BCI-AV#.
+    ~
+    Derivations are stored in compressed sparse row form: row i's
+    atoms are flat[offsets[i]:offsets[i + 1]], where each atom is
+    an index into atoms, the sorted BCI-AV#s of all atoms.
+    """
+
+    def __init__(self, derivations):
+        """
+        :param derivations: Mapping, where...
+            key (int) - BCI-AV# of a Blissymbol
+            val (List[int]) - BCI-AV#s of its atomic derivation
+        """
+        self.rows = {}
+        self.atoms = sorted({atom for atoms in derivations.values() for atom in atoms})
+        codes = {atom: i for i, atom in enumerate(self.atoms)}
+        self.offsets = array("l", [0])
+        self.flat = array("l")
+
+        for bci_num, atoms in derivations.items():
+            self.rows[bci_num] = len(self.rows)
+            self.flat.extend(codes[atom] for atom in atoms)
+            self.offsets.append(len(self.flat))
+
+        if numpy is not None:
+            self._flat = numpy.frombuffer(self.flat, dtype=self.flat.typecode)
+            offsets = numpy.frombuffer(self.offsets, dtype=self.offsets.typecode)
+            # row of each atom in flat
+            self._flat_rows = numpy.repeat(numpy.arange(len(self.rows)), numpy.diff(offsets))
+
+    def __contains__(self, bci_num):
+        return bci_num in self.rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get(self, bci_num, default=None):
+        """
+        Returns the BCI-AV#s of the atomic derivation of the
+        Blissymbol with this bci_num.
+
+        :param bci_num: int, Blissymbol's BCI-AV#
+        :param default: Any, value to return if bci_num isn't in table
+        :return: List[int], BCI-AV#s of atoms
+        """
+        row = self.rows.get(bci_num, None)
+        if row is None:
+            return default
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return [self.atoms[code] for code in self.flat[start:end]]
+
+    def histogram(self, bci_nums):
+        """
+        Returns how often each atom occurs in the atomic derivations
+        of Blissymbols with these BCI-AV#s, counting repeats.
+        ~
+        BCI-AV#s not in this table are ignored.
+
+        :param bci_nums: Iterable[int], BCI-AV#s of translated Blissymbols
+        :return: Counter, where...
+            key (int) - BCI-AV# of an atom
+            val (int) - number of occurrences of atom
+        """
+        rows = [self.rows[b] for b in bci_nums if b in self.rows]
+
+        if numpy is not None:
+            weights = numpy.bincount(numpy.array(rows, dtype=numpy.intp), minlength=len(self.rows))
+            counts = numpy.bincount(
+                self._flat, weights=weights[self._flat_rows], minlength=len(self.atoms)
+            )
+            return collections.Counter(
+                {self.atoms[code]: int(counts[code]) for code in numpy.flatnonzero(counts)}
+            )
+
+        counts = collections.Counter()
+        for row, weight in collections.Counter(rows).items():
+            for code in self.flat[self.offsets[row] : self.offsets[row + 1]]:
+                counts[self.atoms[code]] += weight
+        return counts
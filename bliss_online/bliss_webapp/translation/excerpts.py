@@ -4,10 +4,15 @@ EXCERPTS:
     Holds defn English texts used for testing
     and reading.
 """
-import os
-import nltk
+import os, sys
 
-nltk.download("gutenberg", quiet=True)
+sys.path.append(os.path.dirname(os.path.realpath(__file__)))
+from imports import safe_import
+
+safe_import("resource_manager")
+from resource_manager import require_resources
+
+require_resources("gutenberg")
 from nltk.corpus import gutenberg
 
 FILE_PATH = os.path.dirname(os.path.realpath(__file__))
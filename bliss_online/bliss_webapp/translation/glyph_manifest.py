@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+GLYPH_MANIFEST:
+
+    Keeps an index of every Blissymbol image in IMG_PATH with
+    its dimensions and bounding box, so checking whether a
+    Blissymbol has an image doesn't touch the filesystem.
+
+    The manifest is stored as JSON beside the image directory
+    and is rescanned whenever the image directory changes.
+    Only images not already in the manifest are opened.
+    ~
+    New images are added to the manifest in memory, and the
+    manifest file is rewritten a while later and at shutdown,
+    rather than once per image.
+    ~
+    To rebuild the manifest from command line, run:
+
+    > python glyph_manifest.py
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+import json
+import atexit
+import threading
+from imports import safe_import
+
+safe_import("images")
+from images import Image, IMG_PATH
+
+MANIFEST_PATH = PATH + "/symbols/png/glyph_manifest.json"
+MANIFEST_VERSION = 1
+WRITE_DELAY = 300.0  # seconds from adding a glyph to rewriting the manifest
+
+
+class GlyphManifest:
+    """
+    A class for looking up Blissymbol images by Blissymbol name.
+    ~
+    Each glyph is stored as a list of
+        [width, height, [left, upper, right, lower]]
+    where the bounding box covers the image's non-transparent area
+    (or None for a fully transparent image).
+    """
+
+    def __init__(self, img_path=IMG_PATH, manifest_path=MANIFEST_PATH):
+        self.img_path = img_path
+        self.manifest_path = manifest_path
+        self._glyphs = None
+        self._lock = threading.RLock()
+        self._timer = None  # pending write, see add()
+        self._pid = os.getpid()
+
+    @property
+    def glyphs(self):
+        """
+        Returns this GlyphManifest's glyphs, loading them
+        if they haven't been loaded yet.
+
+        :return: dict, where...
+            key (str) - Blissymbol name
+            val (list) - [width, height, bbox] for Blissymbol's image
+        """
+        if self._glyphs is None:
+            self.load()
+        return self._glyphs
+
+    def __contains__(self, bliss_name):
+        return bliss_name in self.glyphs
+
+    def __len__(self):
+        return len(self.glyphs)
+
+    def get(self, bliss_name, default=None):
+        return self.glyphs.get(bliss_name, default)
+
+    def size(self, bliss_name):
+        """
+        Returns the (width, height) of the image for the
+        Blissymbol with this bliss_name.
+        ~
+        If no such image exists, returns None.
+
+        :param bliss_name: str, name of Blissymbol
+        :return: Optional[Tuple[int, int]], image dimensions
+        """
+        glyph = self.glyphs.get(bliss_name, None)
+        return (glyph[0], glyph[1]) if glyph is not None else None
+
+    def bbox(self, bliss_name):
+        """
+        Returns the bounding box of the non-transparent area in
+        the image for the Blissymbol with this bliss_name.
+        ~
+        If no such image exists, returns None.
+
+        :param bliss_name: str, name of Blissymbol
+        :return: Optional[Tuple[int, int, int, int]], image bounding box
+        """
+        glyph = self.glyphs.get(bliss_name, None)
+        if glyph is not None and glyph[2] is not None:
+            return tuple(glyph[2])
+
+    def dir_mtime(self):
+        """
+        Returns the modification time of this manifest's image
+        directory in nanoseconds.
+
+        :return: Optional[int], image directory's modification time
+        """
+        try:
+            return os.stat(self.img_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def load(self):
+        """
+        Loads glyphs from this manifest's JSON file.
+        ~
+        If the image directory changed since the manifest was
+        written, rescans it and rewrites the manifest.
+
+        :return: None
+        """
+        with self._lock:
+            manifest = self.read()
+            if (
+                manifest is not None
+                and manifest.get("version") == MANIFEST_VERSION
+                and manifest.get("mtime") == self.dir_mtime()
+            ):
+                self._glyphs = manifest["glyphs"]
+            else:
+                glyphs = manifest.get("glyphs", {}) if manifest is not None else {}
+                self._glyphs = self.scan(glyphs)
+                self.write()
+
+    def scan(self, known=None):
+        """
+        Returns glyphs for every image in this manifest's image directory.
+        ~
+        Images already in known are reused rather than reopened.
+
+        :param known: Optional[dict], glyphs from a previous scan
+        :return: dict, glyphs as in self.glyphs
+        """
+        known = {} if known is None else known
+        glyphs = {}
+
+        try:
+            entries = list(os.scandir(self.img_path))
+        except OSError:
+            return glyphs
+
+        for entry in entries:
+            if not entry.name.endswith(".png"):
+                continue
+            bliss_name = entry.name[:-4]
+            glyph = known.get(bliss_name, None)
+            if glyph is None:
+                try:
+                    with Image.open(entry.path) as img:
+                        glyph = self.measure(img)
+                except (IOError, OSError):
+                    continue
+            glyphs[bliss_name] = glyph
+
+        return glyphs
+
+    @staticmethod
+    def measure(img):
+        """
+        Returns the glyph entry for this image.
+
+        :param img: Image, Blissymbol image
+        :return: list, [width, height, bbox] for img
+        """
+        width, height = img.size
+        if img.mode in ("RGBA", "LA") or "transparency" in img.info:
+            bbox = img.convert("RGBA").getchannel("A").getbbox()
+        else:
+            bbox = img.getbbox()
+        return [width, height, list(bbox) if bbox is not None else None]
+
+    def add(self, bliss_name, img):
+        """
+        Adds this newly saved Blissymbol image to this manifest,
+        and schedules the manifest file to be rewritten.
+
+        :param bliss_name: str, name of Blissymbol
+        :param img: Image, Blissymbol's image
+        :return: None
+        """
+        with self._lock:
+            self.glyphs[bliss_name] = self.measure(img)
+            if self._timer is None and os.getpid() == self._pid:
+                self._timer = threading.Timer(WRITE_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """
+        Rewrites the manifest file if glyphs were added
+        since it was last written.
+        ~
+        Does nothing in a forked process, which shares
+        its parent's manifest.
+
+        :return: None
+        """
+        with self._lock:
+            if self._timer is None or os.getpid() != self._pid:
+                return
+            self._timer.cancel()
+            self._timer = None
+            self.write()
+
+    def read(self):
+        """
+        Returns the contents of this manifest's JSON file.
+        ~
+        If no readable manifest exists, returns None.
+
+        :return: Optional[dict], manifest contents
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as manifest:
+                return json.load(manifest)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def write(self):
+        """
+        Writes this manifest's glyphs to its JSON file, tagged
+        with the image directory's current modification time.
+
+        :return: None
+        """
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "mtime": self.dir_mtime(),
+            "glyphs": self._glyphs,
+        }
+        tmp_path = "{}.{}.tmp".format(self.manifest_path, os.getpid())
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as tmp:
+                json.dump(manifest, tmp, sort_keys=True, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)
+        except (IOError, OSError):
+            pass  # read-only installs rescan on load instead
+
+
+GLYPHS = GlyphManifest()
+atexit.register(GLYPHS.flush)
+
+
+def main():
+    GLYPHS.load()
+    print("indexed {} glyphs in {}".format(len(GLYPHS), GLYPHS.manifest_path))
+
+
+if __name__ == "__main__":
+    main()
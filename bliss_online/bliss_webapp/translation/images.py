@@ -5,6 +5,7 @@ BLISS_IMAGES:
     A module for modifying images for Blisscribe.
 """
 import os
+import zlib
 from PIL import Image, ImageDraw, ImageFont, ImageChops
 
 PATH = os.path.dirname(os.path.realpath(__file__))
@@ -151,6 +152,32 @@ def word_image(word, img_h, **kwargs):
         return trim_horizontal(img)
 
 
+def pack_image(image):
+    """
+    Returns this image losslessly compressed, for keeping
+    many images in memory at once.
+    ~
+    Mostly transparent images, like Blissymbols and words,
+    compress to a small fraction of their size.
+
+    :param image: Image, image to compress
+    :return: Tuple[str, Tuple[int, int], bytes], image's mode,
+        size, and compressed pixels
+    """
+    return image.mode, image.size, zlib.compress(image.tobytes(), 1)
+
+
+def unpack_image(packed):
+    """
+    Returns the image compressed by pack_image().
+
+    :param packed: tuple, as returned by pack_image()
+    :return: Image, decompressed image
+    """
+    mode, size, data = packed
+    return Image.frombytes(mode, size, zlib.decompress(data))
+
+
 def make_font(font_path, font_size):
     """
     Returns an ImageFont with given font_path and font_size.
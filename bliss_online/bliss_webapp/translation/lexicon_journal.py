@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+"""
+LEXICON_JOURNAL:
+
+    Saves learned lexicon entries to an append-only journal,
+    rather than rewriting whole data files after each translation.
+
+    Each learned entry is appended to its data file's journal as
+    one JSON line, so saving it costs one small write however big
+    the data file is.  Loading a data file replays its journal
+    over it.
+    ~
+    A journal is compacted into its data file in the background,
+    a while after entries are appended, and at shutdown.  Compaction
+    moves the journal aside, so new entries start a new journal
+    without waiting, then reads the data file from disk, applies
+    the moved journal, rewrites the data file and deletes the moved
+    journal, so entries appended by other processes sharing the
+    data file aren't lost.
+    ~
+    Each entry notes the words it was learned for, so renderings
+    cached before it can tell whether it affects them
+    (see learned_since()).
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+import glob
+import json
+import atexit
+import itertools
+import threading
+from imports import safe_import
+
+safe_import("translation_session")
+from translation_session import current_session
+
+try:
+    import fcntl
+except ImportError:  # not on POSIX; journals are only locked per process
+    fcntl = None
+
+COMPACT_DELAY = 300.0  # seconds from an entry's append to compaction
+
+_journals = {}  # journal path -> LexiconJournal
+_journals_lock = threading.Lock()
+_edits = itertools.count(1)
+_latest_edit = 0  # see latest_edit()
+_learned = {}  # word -> List[tuple] of (edit, session serial), see note_learned()
+_learned_lock = threading.Lock()
+
+
+def latest_edit():
+    """
+    Returns a number which grows whenever an entry is
+    appended to any journal in this process, i.e. whenever
+    lexicon or Wiktionary data is learned.
+
+    :return: int, latest journalled edit
+    """
+    return _latest_edit
+
+
+def word_keys(words):
+    """
+    Returns the keys these words are noted under when learned,
+    i.e. each word lowercased, and each of its parts if it's
+    a phrase.
+
+    e.g. word_keys(["Ice_cream", "cat"]) -> {"ice cream", "ice", "cream", "cat"}
+
+    :param words: Iterable[str], words to key
+    :return: Set[str], words' keys
+    """
+    keys = set()
+    for word in words:
+        word = word.lower().replace("_", " ").strip()
+        keys.add(word)
+        keys.update(word.split())
+    return keys
+
+
+def note_learned(words):
+    """
+    Notes that data was just learned for these words,
+    by this thread's current TranslationSession.
+    ~
+    Each word keeps its latest edits by its last two sessions,
+    which is enough to tell whether any session other than a
+    given one learned it since a given edit.
+
+    :param words: Iterable[str], words learned
+    :return: int, this edit
+    """
+    global _latest_edit
+    session = current_session()
+    source = None if session is None else session.serial
+    with _learned_lock:
+        edit = _latest_edit = next(_edits)
+        for word in word_keys(words):
+            others = [
+                learned
+                for learned in _learned.get(word, ())
+                if source is None or learned[1] != source
+            ]
+            _learned[word] = [(edit, source)] + others[:1]
+    return edit
+
+
+def learned_since(words, edit, source=None):
+    """
+    Returns True if any of these words was learned after
+    this edit by a session other than source.
+    ~
+    Data learned outside of any session is never source's.
+
+    :param words: Iterable[str], keys of words, as in word_keys()
+    :param edit: int, edit to compare with, as in latest_edit()
+    :param source: Optional[int], serial of session whose learning is ignored
+    :return: bool, whether words were learned since edit
+    """
+    with _learned_lock:
+        for word in words:
+            for learned, by in _learned.get(word, ()):
+                if learned > edit and (by is None or by != source):
+                    return True
+    return False
+
+
+def lexicon_journal(path, compactor):
+    """
+    Returns this process's LexiconJournal at path, starting one
+    with this compactor if there isn't one yet.
+    ~
+    Every journal started is compacted at shutdown.
+
+    :param path: str, path of journal file
+    :param compactor: function, as in LexiconJournal.__init__()
+    :return: LexiconJournal, journal at path
+    """
+    with _journals_lock:
+        journal = _journals.get(path, None)
+        if journal is None:
+            journal = LexiconJournal(path, compactor)
+            _journals[path] = journal
+            atexit.register(journal.compact)
+    return journal
+
+
+class LexiconJournal:
+    """
+    A class for journalling changes to a data file.
+    ~
+    Each entry is a kind (str) and JSON-serializable arguments,
+    e.g. ("entry", ["cat", "English", "Noun", ["a feline"]]).
+    """
+
+    def __init__(self, path, compactor, delay=COMPACT_DELAY):
+        """
+        :param path: str, path of journal file
+        :param compactor: function, given List[tuple] of this journal's
+            entries, writes its data file from disk with entries applied
+        :param delay: float, seconds from an append to compaction
+        """
+        self.path = path
+        self.compactor = compactor
+        self.delay = delay
+        self._lock = threading.RLock()  # guards the journal file
+        self._compact_lock = threading.Lock()  # one compaction at a time
+        self._timer = None
+        self._pid = os.getpid()
+
+    def append(self, kind, *args, learned=()):
+        """
+        Appends this entry to this journal and schedules compaction.
+        ~
+        Notes that data was learned for the words in learned
+        (see note_learned()).
+
+        :param kind: str, kind of entry
+        :param args: Any, entry's JSON-serializable arguments
+        :param learned: Iterable[str], words this entry changes
+        :return: None
+        """
+        line = json.dumps([kind, args], ensure_ascii=False) + "\n"
+        with self._lock:
+            while True:
+                with open(self.path, mode="a", encoding="utf-8") as journal:
+                    self.lock_file(journal)
+                    if self.is_current(journal):
+                        journal.write(line)
+                        journal.flush()
+                        break
+                # moved aside by compaction while waiting for its lock
+        note_learned(learned)
+        self.schedule_compaction()
+
+    def entries(self):
+        """
+        Returns this journal's entries in the order they were appended.
+        ~
+        Includes entries moved aside by compactions which haven't
+        finished yet, so they aren't missed while they're compacted.
+        A line left incomplete by a crash is skipped.
+
+        :return: List[tuple], where each tuple is...
+            0 (str) - kind of entry
+            1 (list) - entry's arguments
+        """
+        entries = []
+        with self._lock:
+            for path in self.detached_paths() + [self.path]:
+                try:
+                    with open(path, encoding="utf-8") as journal:
+                        self.lock_file(journal, shared=True)
+                        entries.extend(self.parse(journal))
+                except FileNotFoundError:
+                    continue
+        return entries
+
+    def detached_path(self):
+        """
+        Returns the path this process moves this journal to
+        while compacting it.
+
+        :return: str, path of journal being compacted
+        """
+        return "{}.{}.compacting".format(self.path, self._pid)
+
+    def detached_paths(self):
+        """
+        Returns the paths of this journal's entries being compacted,
+        by any process, oldest first.
+
+        :return: List[str], paths of journals being compacted
+        """
+        paths = []
+        for path in glob.glob(glob.escape(self.path) + ".*.compacting"):
+            try:
+                paths.append((os.stat(path).st_mtime_ns, path))
+            except FileNotFoundError:  # finished compacting meanwhile
+                continue
+        return [path for _, path in sorted(paths)]
+
+    def is_current(self, journal):
+        """
+        Returns True if this open journal file is still at this
+        journal's path, i.e. compaction hasn't moved it aside.
+
+        :param journal: TextIO, open journal file
+        :return: bool, whether journal is still at path
+        """
+        try:
+            return os.path.samestat(os.fstat(journal.fileno()), os.stat(self.path))
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def parse(lines):
+        entries = []
+        for line in lines:
+            try:
+                kind, args = json.loads(line)
+            except ValueError:
+                continue
+            entries.append((kind, args))
+        return entries
+
+    def replay(self, apply):
+        """
+        Calls apply(kind, *args) for each of this journal's entries.
+
+        :param apply: function, applies one entry
+        :return: int, number of entries replayed
+        """
+        entries = self.entries()
+        for kind, args in entries:
+            apply(kind, *args)
+        return len(entries)
+
+    def compact(self):
+        """
+        Rewrites this journal's data file with its entries and
+        empties this journal.
+        ~
+        The journal is moved aside under its lock, and compacted
+        from there without holding it, so appends never wait on
+        the data file's rewrite.  Rewrites are locked by a separate
+        file, so processes don't rewrite the data file at once.
+        If an earlier compaction in this process failed, its
+        entries are compacted with this one's.
+        ~
+        Does nothing in a forked process, which shares its
+        parent's journals, or if this journal is empty.
+
+        :return: None
+        """
+        if os.getpid() != self._pid:
+            return
+        with self._compact_lock:
+            self.cancel_compaction()
+            detached = self.detached_path()
+            with self._lock:
+                try:
+                    journal = open(self.path, encoding="utf-8")
+                except FileNotFoundError:
+                    journal = None
+                if journal is not None:
+                    with journal:
+                        self.lock_file(journal)
+                        if os.path.exists(detached):
+                            with open(detached, mode="a", encoding="utf-8") as older:
+                                older.write(journal.read())
+                            os.remove(self.path)
+                        else:
+                            os.replace(self.path, detached)
+
+            try:
+                with open(detached, encoding="utf-8") as journal:
+                    entries = self.parse(journal)
+            except FileNotFoundError:
+                return
+            if len(entries) != 0:
+                with open(self.path + ".lock", mode="a") as lock:
+                    self.lock_file(lock)
+                    self.compactor(entries)
+            os.remove(detached)
+
+    def schedule_compaction(self):
+        """
+        Starts a background timer to compact this journal
+        after delay seconds, if one isn't already running.
+
+        :return: None
+        """
+        with self._lock:
+            if os.getpid() != self._pid or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.delay, self.compact)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel_compaction(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    @staticmethod
+    def lock_file(file, shared=False):
+        """
+        Locks this open file against other processes until it's closed.
+
+        :param file: TextIO, open journal file
+        :param shared: bool, whether to lock for reading only
+        :return: None
+        """
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
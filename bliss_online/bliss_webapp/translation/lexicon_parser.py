@@ -56,18 +56,32 @@ import os, sys
 
 PATH = os.path.dirname(os.path.realpath(__file__))
 sys.path.append(PATH)
+import ast
 import json
 import pprint
+import threading
+import types
+import collections
 from imports import safe_import
 
 safe_import("blissymbol")
 safe_import("bliss_lexicon")
 safe_import("resources")
+safe_import("lexicon_snapshot")
+safe_import("images")
+safe_import("bliss_index")
+safe_import("concepts")
+safe_import("lexicon_journal")
 from blissymbol import Blissymbol, NEW_BLISSYMBOLS
 from bliss_lexicon import BlissLexicon
-from resources.data.blissnets import BLISSNET, BCI_BLISSNET, ALL_BLISSYMBOLS
+from lexicon_snapshot import source_fingerprint, read_snapshot, write_snapshot
+from resources.tables import load_packed, open_packed
+from images import IMG_PATH
+from bliss_index import BlissIndex
+from concepts import AtomTable
+from lexicon_journal import lexicon_journal
+from resources.data import blissnets
 
-import time
 
 
 class LexiconParser:
@@ -77,6 +91,18 @@ class LexiconParser:
     BLISSWORDS_PATH = DATA_PATH + "blissymbols_gh_pages/blissdata_words.json"
     WORDNET_PATH = RESOURCE_PATH + "wordnet/"
     LEXICA_PATH = RESOURCE_PATH + "lexica/"
+    SNAPSHOT_PATH = DATA_PATH + "bliss_lexicon.snapshot"
+    SYNSET_BCIS_PATH = DATA_PATH + "synset_bcis.table"
+    ATOMS_PATH = DATA_PATH + "atomic_derivations_2.table"  # rows need numbered atoms
+    ANCESTORS_PATH = DATA_PATH + "bliss_ancestors.table"
+    JOURNAL_PATH = DATA_PATH + "all_blissymbols.journal"
+    SNAPSHOT_SOURCES = [
+        PATH + "/bliss_lexicon.py",
+        DATA_PATH + "bci_blissnet.py",
+        BLISSCHARS_PATH,
+        BLISSWORDS_PATH,
+        IMG_PATH,
+    ]
     LEXICON_COLS = [
         "BCI-AV#",
         "English",
@@ -132,10 +158,33 @@ class LexiconParser:
         "Danish",
     }
 
+    # shared by all LexiconParsers in this process, see load_core_lexicon()
+    _core_lock = threading.RLock()
+    _core_derivations = None
+    _core_blissymbols = None
+    _core_bliss_names = None
+    _core_bci_nums = None
+    _core_bliss_aliases = None
+    _core_lexica = {}
+    _core_indexes = {}
+    _core_unicode = None
+    _compiled_lexica = {}
+    _core_unicode_names = None
+    _core_synset_bcis = None
+    _core_blissnet_synsets = None
+    _core_atoms = None
+    _core_ancestors = None
+
     def __init__(self, translator):
         self.translator = translator
-        self.bliss_derivations = self.load_bliss_derivations()
-        self.blissymbols = BlissLexicon(self.translator).blissymbols
+        self.bliss_derivations, self.blissymbols = self.load_core_lexicon()
+        self.bliss_names = collections.ChainMap({}, LexiconParser._core_bliss_names)
+        self.bci_nums = collections.ChainMap({}, LexiconParser._core_bci_nums)
+        self.bliss_aliases = collections.ChainMap({}, LexiconParser._core_bliss_aliases)
+        self.bliss_journal = lexicon_journal(
+            self.JOURNAL_PATH, LexiconParser.compact_blissymbols
+        )
+        self.journalled = {}  # bliss_name -> JSON of its latest journal entry
 
     def check_blissymbols(self):
         for b in self.blissymbols:
@@ -148,19 +197,20 @@ class LexiconParser:
 
     @property
     def blissnet(self):
-        return BLISSNET
+        return blissnets.BLISSNET
 
     @property
     def bci_blissnet(self):
-        return BCI_BLISSNET
+        return blissnets.BCI_BLISSNET
 
     # JSON
     # ====
-    def write_python(self, data, filename, obj_name):
-        first_destination = self.DATA_PATH + filename + ".py.bk"
-        second_destination = self.DATA_PATH + filename + ".py"
+    @classmethod
+    def write_python(cls, data, filename, obj_name):
+        first_destination = cls.DATA_PATH + filename + ".py.bk"
+        second_destination = cls.DATA_PATH + filename + ".py"
         with open(
-            self.DATA_PATH + filename + ".py.bk", mode="w", encoding="utf-8"
+            cls.DATA_PATH + filename + ".py.bk", mode="w", encoding="utf-8"
         ) as pyfile:
             pyfile.write("# fmt: off\n")
             pyfile.write(obj_name + " = ")
@@ -169,7 +219,28 @@ class LexiconParser:
             pyfile.flush()
 
         os.rename(first_destination, second_destination)
-        time.sleep(1)
+
+    @classmethod
+    def read_python(cls, filename, obj_name):
+        """
+        Returns obj_name as currently written to filename.py
+        by write_python(), reading it from disk rather than
+        importing it.
+
+        :param filename: str, name of .py file to read
+        :param obj_name: str, name of object in file
+        :return: X, obj_name's value
+        """
+        with open(cls.DATA_PATH + filename + ".py", encoding="utf-8") as pyfile:
+            module = ast.parse(pyfile.read())
+        for node in module.body:
+            if (
+                isinstance(node, ast.Assign)
+                and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == obj_name
+            ):
+                return ast.literal_eval(node.value)
+        raise LookupError(obj_name + " not in " + filename + ".py")
 
     def dump_json(self, data, filename, **kwargs):
         """
@@ -224,7 +295,7 @@ class LexiconParser:
             key (str) - Blissymbol's attribute
             val (X) - attribute's value
         """
-        return ALL_BLISSYMBOLS
+        return blissnets.ALL_BLISSYMBOLS
 
     def fresh_all_blissymbols(self):
         blissymbols = self.load_all_blissymbols()
@@ -248,6 +319,17 @@ class LexiconParser:
             self.check_blissymbols()
             blissymbols = self.blissymbols
         blissymbols = sorted(blissymbols, key=lambda b: b.bci_num)
+        self.write_bliss_lexicon([str(b) for b in blissymbols])
+
+    @staticmethod
+    def write_bliss_lexicon(bliss_strs):
+        """
+        Writes bliss_lexicon.py with these Blissymbol constructor
+        calls, as made by str(Blissymbol).
+
+        :param bliss_strs: List[str], Blissymbols as strings
+        :return: None
+        """
         with open(PATH + "/bliss_lexicon.py", mode="w") as bliss_file:
             bliss_file.write(
                 "import os, sys\n"
@@ -258,14 +340,198 @@ class LexiconParser:
                 "self.translator = translator\n\t\t"
                 "self.blissymbols = {\n\t\t\t".replace("\t", "    ")
             )
-            for i in range(len(blissymbols)):
-                blissymbol = blissymbols[i]
-                bliss_str = str(blissymbol)
-                bliss_file.write(bliss_str)
-                if i < len(blissymbols) - 1:
+            for i in range(len(bliss_strs)):
+                bliss_file.write(bliss_strs[i])
+                if i < len(bliss_strs) - 1:
                     bliss_file.write(",\n\t\t\t".replace("\t", "    "))
             bliss_file.write("\n\t\t}".replace("\t", "    "))
 
+    # CORE LEXICON
+    # ------------
+    def load_core_lexicon(self):
+        """
+        Returns the Bliss derivations and Blissymbols shared by
+        every LexiconParser in this process.
+        ~
+        The core lexicon is loaded by the first LexiconParser to ask
+        for it and is read-only afterwards.  BlissTranslators add
+        their own entries to an overlay on top of it instead,
+        see BlissTranslator.add_bliss_entry().
+
+        :return: Tuple[dict, FrozenSet[Blissymbol]], where...
+            [0] (dict) - Bliss derivations, as in load_bliss_derivations()
+            [1] (FrozenSet[Blissymbol]) - all Blissymbols in lexicon
+        """
+        cls = LexiconParser
+        with cls._core_lock:
+            if cls._core_blissymbols is None:
+                cls._core_derivations = self.load_bliss_derivations()
+                blissymbols = frozenset(self.load_blissymbols())
+                names, bci_nums, aliases = self.index_blissymbols(blissymbols)
+                cls._core_bliss_names = types.MappingProxyType(names)
+                cls._core_bci_nums = types.MappingProxyType(bci_nums)
+                cls._core_bliss_aliases = types.MappingProxyType(aliases)
+                cls._core_blissymbols = blissymbols
+        return cls._core_derivations, cls._core_blissymbols
+
+    def core_bliss_lexicon(self, language):
+        """
+        Returns the read-only Blissymbols lexicon in this language
+        shared by every LexiconParser in this process.
+
+        :param language: str, desired Blissymbol lexicon language
+        :return: MappingProxyType, where...
+            key (str) - word in this language
+            val (FrozenSet(Blissymbol)) - Blissymbols for word
+        """
+        cls = LexiconParser
+        lexicon = cls._core_lexica.get(language, None)
+        if lexicon is None:
+            with cls._core_lock:
+                lexicon = cls._core_lexica.get(language, None)
+                if lexicon is None:
+                    bliss_dict = {}
+                    for blissymbol in self.blissymbols:
+                        for lang_word in blissymbol.get_translation(language):
+                            bliss_dict.setdefault(lang_word, set()).add(blissymbol)
+                    lexicon = types.MappingProxyType(
+                        {w: frozenset(bs) for w, bs in bliss_dict.items()}
+                    )
+                    cls._core_lexica[language] = lexicon
+        return lexicon
+
+    def core_bliss_index(self, language):
+        """
+        Returns the BlissIndex of the read-only Blissymbols lexicon
+        in this language shared by every LexiconParser in this process.
+
+        :param language: str, desired Blissymbol lexicon language
+        :return: BlissIndex, index of core_bliss_lexicon(language)
+        """
+        cls = LexiconParser
+        index = cls._core_indexes.get(language, None)
+        if index is None:
+            lexicon = self.core_bliss_lexicon(language)
+            with cls._core_lock:
+                index = cls._core_indexes.get(language, None)
+                if index is None:
+                    index = BlissIndex(lexicon)
+                    cls._core_indexes[language] = index
+        return index
+
+    def is_core_blissymbol(self, blissymbol):
+        """
+        Returns True if this blissymbol belongs to the shared
+        core lexicon, i.e. if it shouldn't be modified.
+
+        :param blissymbol: Blissymbol, Blissymbol to check
+        :return: bool, whether blissymbol is in core lexicon
+        """
+        names = LexiconParser._core_bliss_names
+        return names is not None and names.get(blissymbol.bliss_name) is blissymbol
+
+    @staticmethod
+    def index_blissymbols(blissymbols):
+        """
+        Returns indexes of these Blissymbols by bliss_name,
+        by BCI-AV#, and by each alias in their bliss_names.
+        ~
+        Aliases are the comma-separated words in a bliss_name,
+        e.g. "ATB,all-terrain_bike" has aliases "ATB" and
+        "all-terrain_bike".  Where Blissymbols share a BCI-AV#
+        or alias, the first by bliss_name is indexed.
+
+        :param blissymbols: Iterable[Blissymbol], Blissymbols to index
+        :return: Tuple[dict, dict, dict], where...
+            [0] (dict(str, Blissymbol)) - Blissymbols by bliss_name
+            [1] (dict(int, Blissymbol)) - Blissymbols by BCI-AV#
+            [2] (dict(str, Blissymbol)) - Blissymbols by alias
+        """
+        names, bci_nums, aliases = {}, {}, {}
+
+        for blissymbol in sorted(blissymbols, key=lambda b: b.bliss_name):
+            names[blissymbol.bliss_name] = blissymbol
+            if blissymbol.bci_num:
+                bci_nums.setdefault(blissymbol.bci_num, blissymbol)
+            for alias in blissymbol.bliss_name.split(","):
+                aliases.setdefault(alias.strip(), blissymbol)
+
+        return names, bci_nums, aliases
+
+    def index_blissymbol(self, blissymbol):
+        """
+        Adds this Blissymbol to this LexiconParser's indexes,
+        on top of the shared core lexicon's indexes.
+        ~
+        Replaces any indexed Blissymbol with the same bliss_name,
+        but not other Blissymbols with the same BCI-AV# or alias.
+
+        :param blissymbol: Blissymbol, Blissymbol to index
+        :return: None
+        """
+        bliss_name = blissymbol.bliss_name
+        self.bliss_names[bliss_name] = blissymbol
+
+        indexed = self.bci_nums.get(blissymbol.bci_num, None)
+        if blissymbol.bci_num and (indexed is None or indexed.bliss_name == bliss_name):
+            self.bci_nums[blissymbol.bci_num] = blissymbol
+
+        for alias in bliss_name.split(","):
+            alias = alias.strip()
+            indexed = self.bliss_aliases.get(alias, None)
+            if indexed is None or indexed.bliss_name == bliss_name:
+                self.bliss_aliases[alias] = blissymbol
+
+    # BLISS SNAPSHOT
+    # --------------
+    def load_blissymbols(self):
+        """
+        Returns the set of all Blissymbols in the Blissymbols lexicon.
+        ~
+        Loads Blissymbols from the precompiled lexicon snapshot if it
+        is up to date with its sources.  Otherwise, builds Blissymbols
+        from bliss_lexicon.py and writes a fresh snapshot.
+
+        :return: Set[Blissymbol], all Blissymbols in lexicon
+        """
+        blissymbols = self.load_bliss_snapshot()
+        if blissymbols is None:
+            blissymbols = self.fresh_bliss_snapshot()
+        return blissymbols
+
+    def load_bliss_snapshot(self):
+        """
+        Returns the set of Blissymbols stored in the lexicon snapshot.
+        ~
+        If no snapshot exists, or if the snapshot is stale, returns None.
+
+        :return: Optional[Set[Blissymbol]], Blissymbols in snapshot
+        """
+        fingerprint = source_fingerprint(self.SNAPSHOT_SOURCES)
+        rows = read_snapshot(self.SNAPSHOT_PATH, fingerprint)
+        if rows is None:
+            return None
+        return {Blissymbol.from_snapshot_row(row, self.translator) for row in rows}
+
+    def fresh_bliss_snapshot(self):
+        """
+        Returns a fresh set of Blissymbols from bliss_lexicon.py and
+        dumps them to the lexicon snapshot.
+        ~
+        Fingerprints sources after building Blissymbols, since
+        building them may generate new Blissymbol images.
+
+        :return: Set[Blissymbol], all Blissymbols in lexicon
+        """
+        blissymbols = BlissLexicon(self.translator).blissymbols
+        fingerprint = source_fingerprint(self.SNAPSHOT_SOURCES)
+        rows = [b.snapshot_row() for b in sorted(blissymbols, key=lambda b: b.bci_num)]
+        try:
+            write_snapshot(self.SNAPSHOT_PATH, rows, fingerprint)
+        except OSError:
+            pass  # read-only installs keep working, just without a snapshot
+        return blissymbols
+
     # BCI-BLISSNAME MAP
     # -----------------
     def load_bci_blissname_map(self):
@@ -331,6 +597,183 @@ class LexiconParser:
         self.dump_json(net_bci_map, "bci_blissnet")
         return net_bci_map
 
+    def load_synset_bcis(self):
+        """
+        Returns a read-only synset-to-BCI-AV# index of bci_blissnet.
+        ~
+        Each synset's BCI-AV#s are ranked from most to least
+        specific, i.e. by 1/len(synsets) of each BCI-AV#'s synsets,
+        with ties kept in bci_blissnet order.
+        ~
+        Loaded from its packed table once per process, and
+        repacked whenever bci_blissnet changes.
+
+        :return: Mapping, where...
+            key (str) - synset string
+            val (List[int]) - BCI-AV#s with synset, most specific first
+        """
+        index = LexiconParser._core_synset_bcis
+        if index is None:
+            with LexiconParser._core_lock:
+                index = LexiconParser._core_synset_bcis
+                if index is None:
+                    index = load_packed(
+                        self.SYNSET_BCIS_PATH,
+                        self.DATA_PATH + "bci_blissnet.py",
+                        self.fresh_synset_bcis,
+                    )
+                    LexiconParser._core_synset_bcis = index
+        return index
+
+    def fresh_synset_bcis(self):
+        """
+        Returns a fresh synset-to-BCI-AV# index of bci_blissnet,
+        as in load_synset_bcis().
+
+        :return: dict, where...
+            key (str) - synset string
+            val (List[int]) - BCI-AV#s with synset, most specific first
+        """
+        ranked = sorted(self.bci_blissnet.items(), key=lambda item: len(item[1]))
+        index = {}
+
+        for bci_num, synsets in ranked:
+            for synset in synsets:
+                bci_nums = index.setdefault(synset, [])
+                if int(bci_num) not in bci_nums:
+                    bci_nums.append(int(bci_num))
+
+        return index
+
+    def synset_bci_nums(self, synset):
+        """
+        Returns the BCI-AV#s for Blissymbols with this synset,
+        most specific first.
+
+        :param synset: str, synset string, e.g. "dog.n.01"
+        :return: List[int], BCI-AV#s for synset
+        """
+        return self.load_synset_bcis().get(synset, [])
+
+    def load_bliss_ancestors(self):
+        """
+        Returns a read-only index of each WordNet synset's nearest
+        hypernyms with Blissymbols in bci_blissnet.
+        ~
+        Loaded from its packed table once per process.  Building
+        the table searches all of WordNet, so it's only packed by
+        pack_bliss_ancestors() (see lexicon_snapshot.py), never
+        while translating.  If the table hasn't been packed since
+        bci_blissnet last changed, returns an empty dict, and
+        nearest ancestors fall back to common hypernyms.
+
+        :return: Mapping, where...
+            key (str) - synset string without a Blissymbol
+            val (List[int, List[str]]) - distance to nearest
+                Bliss-mapped hypernyms, and their synset strings
+        """
+        index = LexiconParser._core_ancestors
+        if index is None:
+            with LexiconParser._core_lock:
+                index = LexiconParser._core_ancestors
+                if index is None:
+                    index = open_packed(
+                        self.ANCESTORS_PATH, self.DATA_PATH + "bci_blissnet.py"
+                    )
+                    if index is None:
+                        index = {}
+                    LexiconParser._core_ancestors = index
+        return index
+
+    def pack_bliss_ancestors(self):
+        """
+        Builds and packs the table of each WordNet synset's
+        nearest Bliss-mapped hypernyms, if it isn't up to date,
+        and loads it for this process.
+        ~
+        Requires WordNet.
+
+        :return: Mapping, as in load_bliss_ancestors()
+        """
+        with LexiconParser._core_lock:
+            index = load_packed(
+                self.ANCESTORS_PATH,
+                self.DATA_PATH + "bci_blissnet.py",
+                self.fresh_bliss_ancestors,
+            )
+            LexiconParser._core_ancestors = index
+        return index
+
+    def fresh_bliss_ancestors(self):
+        """
+        Returns a fresh index of each WordNet synset's nearest
+        Bliss-mapped hypernyms, as in load_bliss_ancestors().
+        ~
+        Found by a breadth-first search down the hyponym graph,
+        starting from every synset in bci_blissnet at once, so each
+        synset is reached first from its nearest Bliss-mapped
+        ancestors.  Ancestors tied for nearest are all kept, in
+        synset string order.
+
+        :return: dict, where...
+            key (str) - synset string without a Blissymbol
+            val (List[int, List[str]]) - distance to nearest
+                Bliss-mapped hypernyms, and their synset strings
+        """
+        from nltk.corpus import wordnet
+        from nltk.corpus.reader.wordnet import WordNetError
+
+        ancestors = {}
+        frontier = []
+        for name in self.load_synset_bcis():
+            try:
+                synset = wordnet.synset(name)
+            except (WordNetError, ValueError):
+                continue
+            ancestors[synset.name()] = {synset.name()}
+            frontier.append(synset)
+
+        distances = dict.fromkeys(ancestors, 0)
+        distance = 0
+        while len(frontier) != 0:
+            distance += 1
+            reached = []
+            for synset in frontier:
+                found = ancestors[synset.name()]
+                for hyponym in synset.hyponyms() + synset.instance_hyponyms():
+                    name = hyponym.name()
+                    if name not in distances:
+                        distances[name] = distance
+                        ancestors[name] = set(found)
+                        reached.append(hyponym)
+                    elif distances[name] == distance:
+                        ancestors[name].update(found)
+            frontier = reached
+
+        return {
+            name: [distances[name], sorted(ancestors[name])]
+            for name in sorted(distances)
+            if distances[name] != 0
+        }
+
+    def bliss_ancestors(self, synset):
+        """
+        Returns the nearest hypernyms of this synset which have
+        Blissymbols, and how many hypernym links away they are.
+        ~
+        If synset has a Blissymbol itself, returns synset at
+        distance 0.  If none of synset's hypernyms have a
+        Blissymbol, returns None.
+
+        :param synset: str, synset string, e.g. "puppy.n.01"
+        :return: Optional[Tuple[int, List[str]]], distance to and
+            synset strings of nearest Bliss-mapped hypernyms
+        """
+        if len(self.synset_bci_nums(synset)) != 0:
+            return 0, [synset]
+        found = self.load_bliss_ancestors().get(synset, None)
+        return None if found is None else (found[0], found[1])
+
     # BLISS DERIVATIONS
     # -----------------
     def load_bliss_derivations(self):
@@ -350,6 +793,130 @@ class LexiconParser:
         worddata.update({c: [c] for c in chardata})
         return worddata
 
+    def atomic_derivation(self, blissymbol, resolve, memo=None):
+        """
+        Returns the atomic Blissymbols this blissymbol is derived
+        from, as in Blissymbol.derivation_blissymbols(atomic=True).
+        ~
+        If one of blissymbol's derivations has no Blissymbol,
+        blissymbol itself is counted as its last atom.  A Blissymbol
+        derived from one it's still being expanded for (i.e. a cyclic
+        derivation) is counted as itself.
+        ~
+        Only atomic derivations which don't pass through a cycle are
+        kept in memo, since those depend on where the cycle was
+        entered, so results don't depend on which Blissymbols were
+        expanded first.
+
+        :param blissymbol: Blissymbol, Blissymbol to expand
+        :param resolve: function, returns Blissymbol for a derivation name
+        :param memo: Optional[dict], atomic derivations expanded so far
+        :return: List[Blissymbol], blissymbol's atomic derivation
+        """
+        memo = {} if memo is None else memo
+        return self._atomic_derivation(blissymbol, resolve, memo, set())[0]
+
+    def _atomic_derivation(self, blissymbol, resolve, memo, expanding):
+        """
+        Returns blissymbol's atomic derivation, as in atomic_derivation(),
+        and whether it passes through a cyclic derivation.
+
+        :param blissymbol: Blissymbol, Blissymbol to expand
+        :param resolve: function, returns Blissymbol for a derivation name
+        :param memo: dict, acyclic atomic derivations expanded so far
+        :param expanding: Set[str], names of Blissymbols being expanded
+        :return: Tuple[List[Blissymbol], bool], atoms and whether
+            they depend on a Blissymbol still being expanded
+        """
+        bliss_name = blissymbol.bliss_name
+        atoms = memo.get(bliss_name, None)
+        if atoms is not None:
+            return atoms, False
+        if bliss_name in expanding:  # cyclic derivation
+            return [blissymbol], True
+        if blissymbol.is_atomic:
+            memo[bliss_name] = [blissymbol]
+            return memo[bliss_name], False
+
+        expanding.add(bliss_name)
+        atoms = []
+        cyclic = False
+        for derivation in blissymbol.derivation:
+            deriv_bliss = resolve(derivation)
+            if deriv_bliss is None:
+                atoms.append(blissymbol)
+                break
+            elif deriv_bliss == blissymbol or deriv_bliss in atoms:
+                continue
+            else:
+                deriv_atoms, deriv_cyclic = self._atomic_derivation(
+                    deriv_bliss, resolve, memo, expanding
+                )
+                atoms += deriv_atoms
+                cyclic = cyclic or deriv_cyclic
+        expanding.discard(bliss_name)
+
+        if len(atoms) == 0:
+            atoms.append(blissymbol)
+        if not cyclic:
+            memo[bliss_name] = atoms
+        return atoms, cyclic
+
+    def load_atomic_derivations(self):
+        """
+        Returns a table of the atomic derivation of each Blissymbol
+        in the shared core lexicon.
+        ~
+        Loaded from its packed table once per process, and
+        repacked whenever the lexicon snapshot changes.
+
+        :return: AtomTable, atomic derivations by BCI-AV#
+        """
+        table = LexiconParser._core_atoms
+        if table is None:
+            with LexiconParser._core_lock:
+                table = LexiconParser._core_atoms
+                if table is None:
+                    table = AtomTable(
+                        load_packed(
+                            self.ATOMS_PATH,
+                            self.SNAPSHOT_PATH,
+                            self.fresh_atomic_derivations,
+                        )
+                    )
+                    LexiconParser._core_atoms = table
+        return table
+
+    def fresh_atomic_derivations(self):
+        """
+        Returns a fresh dictionary of the atomic derivation of
+        each Blissymbol in the shared core lexicon.
+        ~
+        Blissymbols with an atom without a BCI-AV# are left out,
+        so their atoms are found by name with atomic_derivation()
+        instead, and counted the same whether or not this table
+        is loaded.
+
+        :return: dict, where...
+            key (int) - Blissymbol's BCI-AV#
+            val (List[int]) - BCI-AV#s of Blissymbol's atomic derivation
+        """
+        names = LexiconParser._core_bliss_names
+        aliases = LexiconParser._core_bliss_aliases
+
+        def resolve(derivation):
+            derivation = derivation.strip().replace(" ", "_")
+            blissymbol = names.get(derivation, None)
+            return blissymbol if blissymbol is not None else aliases.get(derivation, None)
+
+        memo = {}
+        derivations = {}
+        for bci_num, blissymbol in sorted(LexiconParser._core_bci_nums.items()):
+            atoms = self.atomic_derivation(blissymbol, resolve, memo)
+            if all(atom.bci_num for atom in atoms):
+                derivations[bci_num] = [atom.bci_num for atom in atoms]
+        return derivations
+
     def fresh_bliss_derivations(self):
         """
         Returns a fresh derivations dictionary for translating
@@ -382,61 +949,244 @@ class LexiconParser:
     def init_bliss_lexicon(self, language):
         """
         Initializes a Blissymbols lexicon in this language.
+        ~
+        Lexicon reads through to the shared core lexicon, while
+        new entries are written to an empty dict in front of it.
 
         :param language: str, desired Blissymbol lexicon language
-        :return: dict, where...
+        :return: ChainMap, where...
             key (str) - word in this language
             val (Set(Blissymbol)) - Blissymbols for word
         """
-        bliss_dict = {}
-
-        for blissymbol in self.blissymbols:
-            lang_words = blissymbol.get_translation(language)
+        return collections.ChainMap({}, self.core_bliss_lexicon(language))
 
-            for lang_word in lang_words:
-                bliss_dict.setdefault(lang_word, set())
-                bliss_dict[lang_word].add(blissymbol)
-
-        return bliss_dict
+    def init_bliss_index(self, language, bliss_dict):
+        """
+        Initializes a BlissIndex of this Blissymbols lexicon in
+        this language.
+        ~
+        If bliss_dict is layered over the shared core lexicon,
+        as from init_bliss_lexicon(), only its own entries are
+        indexed, over the shared core index.
+
+        :param language: str, Blissymbol lexicon's language
+        :param bliss_dict: dict, Blissymbol lexicon to index
+        :return: BlissIndex, index of bliss_dict
+        """
+        if (
+            isinstance(bliss_dict, collections.ChainMap)
+            and len(bliss_dict.maps) == 2
+            and bliss_dict.maps[1] is self.core_bliss_lexicon(language)
+        ):
+            return BlissIndex(bliss_dict.maps[0], parent=self.core_bliss_index(language))
+        return BlissIndex(bliss_dict)
 
     def refresh_blissymbols(self):
         """
-        Refreshes the Blissymbols JSON lexicon to include all new entries in this
+        Refreshes the Blissymbols lexicon to include all new entries in this
         LexiconParser's bliss_dict.
+        ~
+        New entries are journalled as they're added, so this
+        compacts their journal into the lexicon.
 
         :return: None
         """
-        lexicon = self.translator.bliss_dict("English")
-        blissymbols = set()
-        for bliss_lst in lexicon.values():
-            blissymbols.update(bliss_lst)
-        blissymbols = sorted(blissymbols, key=lambda b: b.bci_num)
-        bliss_dicts = [b.__dict__() for b in blissymbols]
-        for i, v in enumerate(bliss_dicts):
-            bliss_dicts[i]["translations"] = {
-                k: sorted(v) for k, v in sorted(v["translations"].items())
+        self.bliss_journal.compact()
+
+    # BLISSYMBOL JOURNAL
+    # ------------------
+    def journal_blissymbol(self, blissymbol):
+        """
+        Journals this Blissymbol if it differs from the shared
+        core lexicon's, or from its last journal entry.
+
+        :param blissymbol: Blissymbol, Blissymbol added to lexicon
+        :return: None
+        """
+        if self.is_core_blissymbol(blissymbol):
+            return
+        bliss_dict = blissymbol.__dict__()
+        bliss_json = json.dumps(bliss_dict, sort_keys=True)
+        previous = self.journalled.get(blissymbol.bliss_name, None)
+        if previous is None:
+            core = LexiconParser._core_bliss_names.get(blissymbol.bliss_name, None)
+            if core is not None:
+                previous = json.dumps(core.__dict__(), sort_keys=True)
+        if bliss_json != previous:
+            learned = [
+                translation
+                for translations in blissymbol.translations.values()
+                for translation in translations
+            ]
+            learned.append(blissymbol.bliss_name)
+            self.bliss_journal.append("blissymbol", bliss_dict, learned=learned)
+            self.journalled[blissymbol.bliss_name] = bliss_json
+
+    def replay_blissymbols(self):
+        """
+        Adds each journalled Blissymbol to this LexiconParser's
+        translator, as learned by earlier translations.
+
+        :return: None
+        """
+        bliss_dicts = {}
+        self.bliss_journal.replay(
+            lambda kind, bliss_dict: self.merge_bliss_dict(bliss_dicts, bliss_dict)
+        )
+        for bliss_dict in bliss_dicts.values():
+            blissymbol = self.dict_to_blissymbol(bliss_dict)
+            if blissymbol is not None:
+                self.translator.own_blissymbols[blissymbol.bliss_name] = blissymbol
+                self.translator.add_bliss_entry(blissymbol, journal=False)
+                self.journalled[blissymbol.bliss_name] = json.dumps(
+                    blissymbol.__dict__(), sort_keys=True
+                )
+
+    @staticmethod
+    def compact_blissymbols(entries):
+        """
+        Writes all_blissymbols and bliss_lexicon with these
+        journalled Blissymbols applied.
+        ~
+        Reads all_blissymbols from disk, not from memory, so
+        Blissymbols compacted by other processes since this
+        process loaded it are kept.
+
+        :param entries: List[tuple], journalled Blissymbols
+        :return: None
+        """
+        all_blissymbols = LexiconParser.read_python("all_blissymbols", "ALL_BLISSYMBOLS")
+        bliss_dicts = {d["name"]: dict(d) for d in all_blissymbols}
+        for kind, (bliss_dict,) in entries:
+            LexiconParser.merge_bliss_dict(bliss_dicts, bliss_dict)
+        bliss_dicts = sorted(bliss_dicts.values(), key=lambda d: d["BCI-AV"])
+        for bliss_dict in bliss_dicts:
+            bliss_dict["translations"] = {
+                k: sorted(v) for k, v in sorted(bliss_dict["translations"].items())
             }
-        if bliss_dicts != self.load_all_blissymbols():
-            self.write_python(bliss_dicts, "all_blissymbols", "ALL_BLISSYMBOLS")
-            self.refresh_bliss_lexicon(blissymbols)
+        LexiconParser.write_python(bliss_dicts, "all_blissymbols", "ALL_BLISSYMBOLS")
+        blissnets.ALL_BLISSYMBOLS = bliss_dicts
+        LexiconParser.write_bliss_lexicon(
+            [
+                LexiconParser.bliss_dict_str(d)
+                for d in bliss_dicts
+                if d["name"][-5:] != "(OLD)" and d["name"][-7:] != "ercase)"
+            ]
+        )
+
+    @staticmethod
+    def bliss_dict_str(bliss_dict):
+        """
+        Returns this Blissymbol dict as a Blissymbol constructor
+        call, as str(Blissymbol) would for the Blissymbol it makes.
+
+        :param bliss_dict: dict, Blissymbol dict from all_blissymbols
+        :return: str, Blissymbol as string
+        """
+        pos = bliss_dict["pos"]
+        return 'Blissymbol("{0}", {1}, {2}, {3}, {4}, {5})'.format(
+            bliss_dict["name"],
+            [pos] if type(pos) == str else list(pos or []),
+            bliss_dict.get("derivation", ""),
+            bliss_dict.get("translations", {}),
+            "self.translator",
+            bliss_dict["BCI-AV"],
+        )
+
+    @staticmethod
+    def merge_bliss_dict(bliss_dicts, bliss_dict):
+        """
+        Adds this Blissymbol dict to bliss_dicts, keeping the
+        translations of any Blissymbol dict it replaces.
+        ~
+        Translations are only ever learned, so a journal entry
+        from a translator which hadn't seen another's entries
+        doesn't forget them.
+
+        :param bliss_dicts: dict(str, dict), Blissymbol dicts by name
+        :param bliss_dict: dict, Blissymbol dict to add
+        :return: None
+        """
+        bliss_dict = dict(bliss_dict)
+        previous = bliss_dicts.get(bliss_dict["name"], None)
+        if previous is not None:
+            translations = {
+                lang: list(trans) for lang, trans in previous["translations"].items()
+            }
+            for lang, trans in bliss_dict["translations"].items():
+                known = translations.setdefault(lang, [])
+                known.extend(t for t in trans if t not in known)
+            bliss_dict["translations"] = translations
+        bliss_dicts[bliss_dict["name"]] = bliss_dict
 
     # BLISS UNICODE
     # --------------
     def load_bliss_unicode(self):
         """
-        Returns a unicode-to-Blissymbol name dictionary.
+        Returns a read-only Blissymbol name-to-unicode dictionary.
         ~
         Unicode conforms to suggestions here:
         http://std.dkuug.dk/JTC1/SC2/WG2/docs/n1866.pdf
         ~
+        Loaded from bliss_unicode JSON once per process.
+        ~
         N.B. Blissymbol names are a comma-separated string of
              1 or more English words.
 
-        :return: dict(str, str), where...
+        :return: MappingProxyType(str, str), where...
+            key (str) - Blissymbol's name
+            val (str) - unicode for Blissymbol
+        """
+        unicodes = LexiconParser._core_unicode
+        if unicodes is None:
+            unicodes = self.init_bliss_unicode()[0]
+        return unicodes
+
+    def load_bliss_unicode_names(self):
+        """
+        Returns a read-only unicode-to-Blissymbol names dictionary,
+        i.e. the reverse of load_bliss_unicode().
+
+        :return: MappingProxyType(str, tuple), where...
             key (str) - unicode for Blissymbol
-            val (str) - Blissymbol's name
+            val (Tuple[str]) - names of Blissymbols with this unicode
+        """
+        names = LexiconParser._core_unicode_names
+        if names is None:
+            names = self.init_bliss_unicode()[1]
+        return names
+
+    def init_bliss_unicode(self):
         """
-        return self.load_json("bliss_unicode")
+        Loads the shared Blissymbol name-to-unicode dictionary
+        and its reverse from bliss_unicode JSON.
+
+        :return: Tuple[MappingProxyType, MappingProxyType], as returned by
+            load_bliss_unicode() and load_bliss_unicode_names()
+        """
+        cls = LexiconParser
+        with cls._core_lock:
+            if cls._core_unicode is None:
+                unicodes = self.load_json("bliss_unicode")
+                names = {}
+                for bliss_name, uni in unicodes.items():
+                    names.setdefault(uni, []).append(bliss_name)
+                cls._core_unicode_names = types.MappingProxyType(
+                    {uni: tuple(bns) for uni, bns in names.items()}
+                )
+                cls._core_unicode = types.MappingProxyType(unicodes)
+        return cls._core_unicode, cls._core_unicode_names
+
+    def clear_bliss_unicode(self):
+        """
+        Clears the shared Blissymbol unicode dictionaries, so
+        they're reloaded from bliss_unicode JSON on next use.
+
+        :return: None
+        """
+        with LexiconParser._core_lock:
+            LexiconParser._core_unicode = None
+            LexiconParser._core_unicode_names = None
 
     def fresh_bliss_unicode(self):
         """
@@ -491,6 +1241,7 @@ class LexiconParser:
             uni += 1
 
         self.dump_json(unicodes, "bliss_unicode")
+        self.clear_bliss_unicode()
         return unicodes
 
     def refresh_bliss_unicode(self):
@@ -501,8 +1252,9 @@ class LexiconParser:
 
         :return: None
         """
-        unicodes = self.translator.bliss_unicode()
+        unicodes = dict(self.translator.bliss_unicode)
         self.dump_json(unicodes, "bliss_unicode")
+        self.clear_bliss_unicode()
 
     # BLISSNET
     # --------------
@@ -520,6 +1272,25 @@ class LexiconParser:
         """
         return self.load_json("blissnet")
 
+    def load_blissnet_synsets(self):
+        """
+        Returns the set of all synset strings in blissnet.
+        ~
+        Built once per process.
+
+        :return: FrozenSet[str], synset strings in blissnet
+        """
+        synsets = LexiconParser._core_blissnet_synsets
+        if synsets is None:
+            with LexiconParser._core_lock:
+                synsets = LexiconParser._core_blissnet_synsets
+                if synsets is None:
+                    synsets = frozenset(
+                        synset for strs in self.blissnet.values() for synset in strs
+                    )
+                    LexiconParser._core_blissnet_synsets = synsets
+        return synsets
+
     def find_blissnet(self, reverse=False):
         """
         Returns a Blissymbol-to-Synset dictionary for mapping
@@ -718,6 +1489,35 @@ class LexiconParser:
 
     # MULTILINGUAL
     # ============
+    def load_lexicon(self, language):
+        """
+        Returns the compiled lexicon for this language, as
+        parsed by parse_lexicon().
+        ~
+        Lexicon is compiled to a packed table beside its .txt
+        file the first time it's loaded, and recompiled whenever
+        the .txt file changes.  Compiled lexica are shared by
+        every LexiconParser in this process.
+
+        :param language: str, language of .txt file for lexicon
+        :return: Mapping, where...
+            key (str) - inflected form of a word
+            val (str or List[str]) - lemma form(s) of inflected word
+        """
+        cls = LexiconParser
+        lexicon = cls._compiled_lexica.get(language, None)
+        if lexicon is None:
+            with cls._core_lock:
+                lexicon = cls._compiled_lexica.get(language, None)
+                if lexicon is None:
+                    lexicon = load_packed(
+                        self.LEXICA_PATH + language + ".table",
+                        self.LEXICA_PATH + language + ".txt",
+                        lambda: self.parse_lexicon(language),
+                    )
+                    cls._compiled_lexica[language] = lexicon
+        return lexicon
+
     def parse_lexicon(self, language):
         """
         Parses plaintext file for given language.
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+LEXICON_SNAPSHOT:
+
+    Reads and writes precompiled binary snapshots of the
+    Blissymbols lexicon.
+
+    A snapshot holds every Blissymbol of bliss_lexicon.py with its
+    fields already resolved (image filename checked, synset strings
+    found in the Blissnet), so loading one is a single memory-mapped
+    read rather than thousands of Blissymbol constructor calls.
+    Synsets themselves are only looked up in WordNet when read.
+    ~
+    Each snapshot records a fingerprint of the sources it was built
+    from.  If any source changes, the snapshot is stale and
+    read_snapshot() returns None so callers can rebuild.
+    ~
+    To rebuild the snapshot from command line, along with the
+    table of each WordNet synset's nearest Bliss-mapped hypernyms
+    (see LexiconParser.pack_bliss_ancestors()), run:
+
+    > python lexicon_snapshot.py
+"""
+import os
+import marshal
+import mmap
+import struct
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+SNAPSHOT_MAGIC = b"BLISSNAP"
+SNAPSHOT_VERSION = 2
+HEADER = struct.Struct("<8sII")  # magic, version, fingerprint length
+
+
+def source_fingerprint(paths):
+    """
+    Returns a fingerprint for these source paths, made of
+    each path's modification time and size.
+    ~
+    Missing paths are fingerprinted as None.
+
+    :param paths: List[str], paths to files/directories a snapshot depends on
+    :return: tuple, fingerprint for paths
+    """
+    fingerprint = []
+
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            fingerprint.append((os.path.basename(path), None, None))
+        else:
+            fingerprint.append(
+                (os.path.basename(path), stat.st_mtime_ns, stat.st_size)
+            )
+
+    return tuple(fingerprint)
+
+
+def write_snapshot(path, rows, fingerprint):
+    """
+    Writes these rows to a snapshot file at path, tagged
+    with this fingerprint.
+    ~
+    Writes to a temporary file first and renames it over path,
+    so readers never see a partially written snapshot.
+
+    :param path: str, path of snapshot file to write
+    :param rows: List[tuple], marshallable rows to store
+    :param fingerprint: tuple, fingerprint of the rows' sources
+    :return: None
+    """
+    fp_bytes = marshal.dumps(fingerprint)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+
+    with open(tmp_path, "wb") as snapshot:
+        snapshot.write(HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(fp_bytes)))
+        snapshot.write(fp_bytes)
+        marshal.dump(rows, snapshot)
+        snapshot.flush()
+
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path, fingerprint):
+    """
+    Returns the rows stored in the snapshot file at path.
+    ~
+    If no snapshot exists at path, or if it was written by another
+    snapshot version or from sources with a different fingerprint,
+    returns None.
+
+    :param path: str, path of snapshot file to read
+    :param fingerprint: tuple, expected fingerprint of the rows' sources
+    :return: Optional[List[tuple]], rows stored in snapshot
+    """
+    try:
+        snapshot = open(path, "rb")
+    except OSError:
+        return None
+
+    with snapshot:
+        try:
+            mm = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None
+
+        with mm:
+            if len(mm) < HEADER.size:
+                return None
+            magic, version, fp_len = HEADER.unpack_from(mm, 0)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return None
+
+            start = HEADER.size + fp_len
+            try:
+                stored_fingerprint = marshal.loads(mm[HEADER.size : start])
+                if stored_fingerprint != fingerprint:
+                    return None
+                view = memoryview(mm)[start:]
+                try:
+                    return marshal.loads(view)
+                finally:
+                    view.release()
+            except (EOFError, ValueError, TypeError):
+                return None
+
+
+def main():
+    from blisscribe import BlissTranslator
+
+    translator = BlissTranslator()
+    blissymbols = translator.lex_parser.fresh_bliss_snapshot()
+    print(
+        "wrote {} Blissymbols to {}".format(
+            len(blissymbols), translator.lex_parser.SNAPSHOT_PATH
+        )
+    )
+    ancestors = translator.lex_parser.pack_bliss_ancestors()
+    print(
+        "packed {} synsets' ancestors to {}".format(
+            len(ancestors), translator.lex_parser.ANCESTORS_PATH
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+OMW_REGISTRY:
+
+    Loads Open Multilingual Wordnet tab files once per process.
+
+    Each language's tab file is read and added to NLTK's WordNet
+    reader a single time, however many BlissTranslators ask for
+    that language.
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+import threading
+from nltk.corpus import wordnet
+
+TAB_PATH = PATH + "/resources/omw_tabs/"
+
+
+class OMWRegistry:
+    """
+    A class for loading OMW languages to WordNet at most once.
+    """
+
+    def __init__(self, tab_path=TAB_PATH):
+        self.tab_path = tab_path
+        self._loaded = set()
+        self._lock = threading.RLock()
+
+    def tab_filename(self, lang_code):
+        return self.tab_path + "wn-cldr-" + lang_code + ".tab"
+
+    def is_loaded(self, lang_code):
+        return lang_code in self._loaded
+
+    def load(self, lang_code):
+        """
+        Loads the OMW tab file for this lang_code's language to
+        WordNet, unless it has already been loaded.
+        ~
+        If no tab file exists for this language, raises an IOError.
+
+        :param lang_code: str, 3-character ISO language code
+        :return: None
+        """
+        if lang_code in self._loaded:
+            return
+
+        with self._lock:
+            if lang_code not in self._loaded:
+                try:
+                    with open(self.tab_filename(lang_code), encoding="utf-8") as tab:
+                        wordnet.custom_lemmas(tab, lang_code)
+                except IOError:
+                    raise IOError("Blisscribe doesn't support this language yet... oops!")
+                self._loaded.add(lang_code)
+
+
+OMW_REGISTRY = OMWRegistry()
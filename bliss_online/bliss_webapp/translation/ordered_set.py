@@ -5,13 +5,54 @@ class OrderedSet:
     """
     A List-Set hybrid class for holding ordered
     sequences of items with no duplicates.
+    ~
+    Keeps a count of each item as items are added, in order of
+    each item's first appearance, and caches items ranked by
+    frequency until this OrderedSet next changes.
+    ~
+    Removed items are left in all_items as tombstones, and dropped
+    the next time all_items is read or items are ranked, so removing
+    an item doesn't copy all_items each time.
 
     :param items: List[X], items to create ordered set for
     """
 
     def __init__(self, items=list()):
-        self.items_set = set(items)
-        self.all_items = list(items)
+        self.items_set = set()
+        self._all_items = []
+        self._removed = {}  # item -> len(_all_items) when removed
+        self._counts = {}
+        self._ranked = None
+        self.add_items(items)
+
+    @property
+    def all_items(self):
+        """
+        Returns every item added to this OrderedSet and not
+        removed since, in order of addition.
+
+        :return: List[X], all items with duplicates
+        """
+        self.drop_removed()
+        return self._all_items
+
+    def drop_removed(self):
+        """
+        Drops removed items' tombstones from all_items.
+        ~
+        An item added again after it was removed keeps its
+        occurrences since then.
+
+        :return: None
+        """
+        if len(self._removed) != 0:
+            removed = self._removed
+            self._all_items = [
+                item
+                for idx, item in enumerate(self._all_items)
+                if idx >= removed.get(item, 0)
+            ]
+            self._removed = {}
 
     def items(self, min_ct=None, max_ct=None):
         """
@@ -19,7 +60,25 @@ class OrderedSet:
 
         :return: List[X], list ordered by frequency
         """
-        return self.rank(self.all_items, min_ct=min_ct, max_ct=max_ct)
+        if min_ct is None and max_ct is None:
+            return list(self.ranked())
+        return self.rank(min_ct=min_ct, max_ct=max_ct)
+
+    def ranked(self):
+        """
+        Returns this OrderedSet's items ranked by frequency,
+        with ties in order of first appearance.
+        ~
+        The ranking is cached until this OrderedSet changes,
+        so it must not be modified.
+
+        :return: List[X], list ordered by frequency
+        """
+        if self._ranked is None:
+            self.drop_removed()
+            counts = self._counts
+            self._ranked = sorted(counts, key=counts.__getitem__, reverse=True)
+        return self._ranked
 
     def union(self, other):
         """
@@ -44,11 +103,11 @@ class OrderedSet:
         :param idx: int, index of item to remove from items
         :return: OrderedSet(X), ordered set with item removed
         """
-        if idx < len(self.items()):
-            if idx is None:
-                self.remove(self.items()[0])
-            else:
-                self.remove(self.items()[idx])
+        ranked = self.ranked()
+        if idx is None:
+            idx = 0
+        if -len(ranked) <= idx < len(ranked):
+            self.remove(ranked[idx])
 
         return self
 
@@ -59,11 +118,15 @@ class OrderedSet:
         Removes all instances of item from:
         1) all_items
         2) items_set
+        ~
+        Instances in all_items are only dropped later, see drop_removed().
 
         :param idx: X, item to remove from items
         """
-        self.all_items = [i for i in self.all_items if i != item]
         self.items_set.remove(item)
+        del self._counts[item]
+        self._ranked = None
+        self._removed[item] = len(self._all_items)
 
     def update(self, other):
         """
@@ -85,16 +148,14 @@ class OrderedSet:
 
         :return: None
         """
+        counts = self._counts
+        in_range = lambda i: (min_ct is None or counts.get(i, 0) > min_ct) and (
+            max_ct is None or counts.get(i, 0) < max_ct
+        )
         if items is None:
-            items = self.all_items
-        items_set = self.remove_duplicates(items)
-        counts = self.frequency_counts()
-        items_set = [
-            i
-            for i in items_set
-            if (min_ct is None or counts.get(i, 0) > min_ct)
-            and (max_ct is None or counts.get(i, 0) < max_ct)
-        ]
+            return [i for i in self.ranked() if in_range(i)]
+
+        items_set = [i for i in self.remove_duplicates(items) if in_range(i)]
         return sorted(items_set, key=lambda i: counts[i], reverse=True)
 
     def rank_items(self, items=None):
@@ -143,7 +204,7 @@ class OrderedSet:
             key (X) - item in OrderedSet
             val (int) - # occurrences of item
         """
-        return {i: self.all_items.count(i) for i in self.items_set}
+        return dict(self._counts)
 
     def add(self, item):
         """
@@ -154,8 +215,10 @@ class OrderedSet:
         :param item: str, item to add to all_items
         :return: None
         """
-        self.all_items.append(item)
+        self._all_items.append(item)
         self.items_set.add(item)
+        self._counts[item] = self._counts.get(item, 0) + 1
+        self._ranked = None
 
     def add_items(self, items):
         """
@@ -175,12 +238,11 @@ class OrderedSet:
 
         :return: List[X], items in OrderedSet occurring the most
         """
-        counts = self.frequency_counts()
+        counts = self._counts
         min_i = kwargs.get("min_i", None)
         if min_i is None:
             min_i = max(counts.values()) if len(counts) != 0 else 0
-        items = self.remove_duplicates(self.all_items)
-        return [i for i in items if counts[i] >= min_i]
+        return [i for i, count in counts.items() if count >= min_i]
 
     def intersection(self, other):
         """
@@ -219,13 +281,13 @@ class OrderedSet:
             return [item for item in items if not (item in seen or seen_add(item))]
 
     def __iter__(self):
-        return iter(self.items())
+        return iter(self.ranked())
 
     def __len__(self):
         return len(self.items_set)
 
     def __getitem__(self, index):
-        return self.items()[index]
+        return self.ranked()[index]
 
     # def __str__(self):
     #    return str(self.items())
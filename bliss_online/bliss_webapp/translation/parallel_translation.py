@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+PARALLEL_TRANSLATION:
+
+    Translates a text's paragraphs in a pool of processes.
+
+    Where processes can be forked safely, each worker inherits the
+    calling BlissTranslator with its lexicon already loaded.  Elsewhere,
+    or while other threads are running, each worker starts its own
+    BlissTranslator, whose lexicon loads from the shared snapshot and
+    packed tables; if the calling BlissTranslator's own lexicon was
+    edited, such workers couldn't match it, so its text is translated
+    in the calling process instead.
+    ~
+    Workers translate and draw paragraphs in any order, but their
+    Images are placed in the text's order by the calling translator,
+    which alone decides which words are subtitled.  Output matches
+    translating in one process.
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+import collections
+import threading
+import multiprocessing
+from imports import safe_import
+
+safe_import("caches")
+safe_import("lexicon_journal")
+safe_import("translation_session")
+from caches import LRUCache, PARAGRAPH_CACHE, MISSING
+from lexicon_journal import latest_edit
+from translation_session import current_session
+
+WORKER_BACKLOG = 2  # paragraphs queued per worker
+
+_translator = None  # this worker's BlissTranslator
+_cache = None  # this worker's TranslationWords
+
+
+def init_worker(translator, settings):
+    """
+    Sets up this worker process's BlissTranslator.
+    ~
+    If translator was inherited by fork, uses it as is.
+    Otherwise, starts a new BlissTranslator with these settings.
+
+    :param translator: Optional[BlissTranslator], forked translator
+    :param settings: dict, BlissTranslator's init arguments
+    :return: None
+    """
+    global _translator, _cache
+    if translator is None:
+        from blisscribe import BlissTranslator
+
+        translator = BlissTranslator(**settings)
+    _translator = translator
+    _cache = LRUCache(maxsize=translator.STREAM_CACHE_SIZE)
+
+
+def render_paragraph(paragraph, kwargs):
+    """
+    Returns this paragraph rendered by this worker's
+    BlissTranslator, as in BlissTranslator.render_paragraph(),
+    and its key in this worker once rendered.
+
+    :param paragraph: str, paragraph to translate
+    :param kwargs: dict, translation keyword arguments
+    :return: tuple, where...
+        0 (List[Optional[tuple]]) - rendered words
+        1 (tuple) - paragraph's key, as in BlissTranslator.paragraph_key()
+    """
+    rendered = _translator.render_paragraph(paragraph, cache=_cache, **kwargs)
+    return rendered, _translator.paragraph_key(paragraph, **kwargs)
+
+
+def pool_context():
+    """
+    Returns the fork multiprocessing context if this platform
+    supports it and this process has only one thread, or the
+    forkserver or default context otherwise.
+    ~
+    With other threads running (e.g. concurrent TranslationSessions,
+    or journal compaction timers), a forked worker could inherit a
+    lock held by a thread which doesn't exist in the worker, and
+    deadlock on it.  Workers started otherwise load their own
+    BlissTranslator instead (see init_worker()).
+
+    :return: BaseContext, context to start worker processes with
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+
+def parallel_images(translator, text, **kwargs):
+    """
+    Yields an Image for each word/symbol in this text,
+    as in BlissTranslator.iter_images(), translating its
+    paragraphs in kwargs["workers"] processes.
+    ~
+    Only a few paragraphs per worker are in flight at once,
+    so memory use doesn't grow with text's length.  Paragraphs
+    cached in PARAGRAPH_CACHE aren't sent to workers, and workers'
+    renderings are only cached if the worker's key for them is
+    translator's, i.e. they were rendered with translator's lexicon.
+    ~
+    Workers which aren't forked don't have translator's own
+    lexicon, so if it's been edited, text is translated in this
+    process instead.
+
+    :param translator: BlissTranslator, translator placing Images
+    :param text: str or Iterable[str], text or open text file
+    :return: Generator[Image], an Image for each word/symbol in text
+    """
+    kwargs = translator._setdefault_kwargs(**kwargs)
+    workers = kwargs.pop("workers")
+    kwargs.pop("cache", None)
+    sub_all = kwargs["sub_all"]
+
+    context = pool_context()
+    if context.get_start_method() != "fork" and translator.lexicon_edit is not None:
+        for img in translator.iter_images(text, **kwargs):
+            yield img
+        return
+    if context.get_start_method() == "fork":
+        initargs = (translator, None)
+    else:
+        settings = {
+            "language": translator.language,
+            "font_path": translator.font_path,
+            "font_size": translator.font_size,
+        }
+        initargs = (None, settings)
+
+    pool = context.Pool(workers, initializer=init_worker, initargs=initargs)
+    pending = collections.deque()
+
+    session = current_session()
+    source = None if session is None else session.serial
+
+    def place(paragraph, edit, result):
+        if type(result) == list:
+            rendered = result
+        else:
+            rendered, key = result.get()
+            if key == translator.paragraph_key(paragraph, **kwargs):
+                translator.cache_rendered(key, paragraph, rendered, edit, source)
+        imgs = translator.place_rendered(rendered, sub_all)
+        if len(imgs) != 0 and imgs[-1] is not None:
+            imgs.append(None)
+        return imgs
+
+    try:
+        for paragraph in translator.iter_paragraphs(text):
+            key = translator.paragraph_key(paragraph, **kwargs)
+            cached = PARAGRAPH_CACHE.get(key, valid=translator.is_fresh)
+            edit = latest_edit()
+            if cached is MISSING:
+                result = pool.apply_async(render_paragraph, (paragraph, kwargs))
+            else:
+                result = translator.unpack_rendered(cached[0])
+            pending.append((paragraph, edit, result))
+            if len(pending) >= workers * WORKER_BACKLOG:
+                for img in place(*pending.popleft()):
+                    yield img
+        while len(pending) != 0:
+            for img in place(*pending.popleft()):
+                yield img
+    finally:
+        pool.terminate()
+        pool.join()
+        translator.init_seen_changed()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+PDF_WRITER:
+
+    Writes page Images to a PDF one page at a time.
+
+    Each page is saved to a temporary PNG, embedded, and deleted
+    as soon as it's added, so a document's page Images never need
+    to be held in memory at once.  The PDF itself keeps only each
+    page's compressed image data until it's output.
+"""
+import os
+import tempfile
+from fpdf import FPDF
+
+
+class PDFWriter:
+    """
+    A class for writing page Images to a PDF as they're made.
+    ~
+    The PDF's page size is set by its first page, plus margins
+    on every side.
+    ~
+    Adapted from:
+    https://stackoverflow.com/questions/27327513/create-pdf-from-a-list-of-images
+    """
+
+    def __init__(self, path, margins=50, page_number=None):
+        """
+        :param path: str, path to output PDF to
+        :param margins: int, space in margins (in pixels)
+        :param page_number: Optional[function], returns an Image of
+            a page number, or None to leave pages unnumbered
+        """
+        self.path = path
+        self.margins = margins
+        self.page_number = page_number
+        self.pdf = None
+        self.size = None
+        self.page_count = 0
+
+    def add_page(self, page):
+        """
+        Adds this page Image as the next page of this PDF.
+        ~
+        Pages after the second are numbered, if this writer
+        has a page_number function.
+
+        :param page: Image, page to add
+        :return: None
+        """
+        if self.pdf is None:
+            width, height = page.size
+            self.size = (width + self.margins * 2, height + self.margins * 2)
+            self.pdf = FPDF(unit="pt", format=list(self.size))
+
+        self.pdf.add_page()
+        self.paste(page, self.margins, self.margins)
+
+        idx = self.page_count
+        if idx > 1 and self.page_number is not None:
+            number = self.page_number(idx)
+            new_w, new_h = self.size
+            x = new_w // 2 - number.size[0]
+            y = new_h - (self.margins // 2) - number.size[1]
+            self.paste(number, x, y)
+
+        self.page_count += 1
+
+    def paste(self, image, x, y):
+        """
+        Embeds this Image on this PDF's current page at (x, y).
+
+        :param image: Image, image to embed
+        :param x: int, x-coordinate of image's top-left corner
+        :param y: int, y-coordinate of image's top-left corner
+        :return: None
+        """
+        fd, filename = tempfile.mkstemp(prefix="bliss_img", suffix=".png")
+        os.close(fd)
+        try:
+            image.save(filename)
+            self.pdf.image(filename, x=x, y=y)
+        finally:
+            os.remove(filename)  # deletes images once in PDF
+
+    def close(self):
+        """
+        Outputs this PDF to its path and returns it.
+        ~
+        If no pages were added, raises a ValueError.
+
+        :return: FPDF, finished PDF document
+        """
+        if self.pdf is None:
+            raise ValueError("cannot write a PDF without pages: " + self.path)
+        self.pdf.output(self.path, "F")
+        return self.pdf
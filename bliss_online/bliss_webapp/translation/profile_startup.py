@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+PROFILE_STARTUP:
+
+    Measures Blisscribe's cold-start cost.
+
+    Reports wall time and allocated memory for:
+     - each module imported by `from blisscribe import BlissTranslator`
+     - each data table loaded (blissnets, lexica)
+     - each phase of BlissTranslator initialization
+       (lexicon, bliss_dicts, fonts, OMW, ...)
+    ~
+    The report is written as JSON so startup times can be
+    compared across versions.  From bliss_webapp, run:
+
+    > python -m translation.profile_startup [--language French] [--output report.json]
+
+    Memory is measured with tracemalloc, which slows startup
+    down; pass --no-memory for more accurate wall times.
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+sys.path.append(os.path.dirname(PATH))  # so safe_import works when run from here
+import json
+import time
+import platform
+import functools
+import tracemalloc
+import importlib.machinery
+
+REPORT_VERSION = 1
+# loaders which are created per module, so exec_module can be wrapped per instance
+TIMED_LOADERS = (
+    importlib.machinery.SourceFileLoader,
+    importlib.machinery.SourcelessFileLoader,
+    importlib.machinery.ExtensionFileLoader,
+)
+# (defining module, function or Class.method, kind, phase name)
+TARGETS = [
+    ("lexicon_parser", "LexiconParser.__init__", "phase", "lexicon"),
+    ("lexicon_parser", "LexiconParser.load_lexicon", "phase", "lexica"),
+    ("blisscribe", "BlissTranslator.init_bliss_dicts", "phase", "bliss_dicts"),
+    ("blisscribe", "BlissTranslator.init_language", "phase", "language"),
+    ("blisscribe", "BlissTranslator.load_multilingual_lemmas", "phase", "omw"),
+    ("images", "make_font", "phase", "fonts"),
+    ("glyph_manifest", "GlyphManifest.load", "phase", "glyphs"),
+    ("resources.tables", "load_packed", "table", None),
+]
+
+
+class StartupProfiler:
+    """
+    A class for timing imports and function calls during startup.
+    ~
+    Each import or call is recorded as a dict with its kind
+    ("import", "table", or "phase"), name, wall time in seconds,
+    and net memory allocated in bytes (None without tracemalloc).
+    Import records also include their self time, excluding
+    nested imports.
+    """
+
+    def __init__(self, memory=True):
+        self.memory = memory
+        self.records = []
+        self._children = []
+        self._patched = {}
+
+    # MEASUREMENT
+    # ===========
+    def traced(self):
+        if self.memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return None
+
+    def measure(self, kind, name, func, *args, **kwargs):
+        """
+        Calls func with these args and records its wall time
+        and memory under this kind and name.
+
+        :param kind: str, kind of record
+        :param name: str, name of record
+        :param func: function, function to measure
+        :return: Any, func's return value
+        """
+        mem = self.traced()
+        self._children.append(0.0)
+        start = time.perf_counter()
+        error = None
+        try:
+            return func(*args, **kwargs)
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            if self._children:
+                self._children[-1] += elapsed
+            record = {
+                "kind": kind,
+                "name": name,
+                "seconds": elapsed,
+                "bytes": self.traced() - mem if mem is not None else None,
+            }
+            if kind == "import":
+                record["self_seconds"] = elapsed - children
+            if error is not None:
+                record["error"] = error
+            self.records.append(record)
+
+    # IMPORTS
+    # =======
+    def find_spec(self, fullname, path, target=None):
+        """
+        Finds fullname's spec with the remaining meta path finders
+        and wraps its loader's exec_module to time the import.
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                loader = spec.loader
+                if isinstance(loader, TIMED_LOADERS) and "exec_module" not in vars(loader):
+                    exec_module = loader.exec_module
+                    loader.exec_module = functools.partial(
+                        self.measure, "import", fullname, exec_module
+                    )
+                return spec
+        return None
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    # PHASES
+    # ======
+    def wrap(self, func, kind, phase):
+        """
+        Returns func wrapped to record each call.
+        ~
+        Table records are named after the table file loaded.
+        Phase records are named after the phase, plus the
+        language code for OMW loads.
+        """
+        profiler = self
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if kind == "table":
+                name = os.path.basename(str(args[0] if args else kwargs.get("table_path")))
+            elif phase == "omw" and len(args) > 1:
+                name = "{}:{}".format(phase, args[1])
+            else:
+                name = phase
+            return profiler.measure(kind, name, func, *args, **kwargs)
+
+        timed.__profiled__ = True
+        return timed
+
+    def patch_targets(self, targets=TARGETS):
+        """
+        Wraps each target function in every loaded module that
+        defines or imports it.
+        ~
+        Modules imported through safe_import may be loaded under
+        more than one name, so every copy is patched.
+
+        :param targets: List[Tuple[str, str, str, str]], functions to wrap
+        :return: None
+        """
+        for mod_name, qualname, kind, phase in targets:
+            owner_name, _, attr = qualname.rpartition(".")
+            for module in list(sys.modules.values()):
+                owner = getattr(module, owner_name, None) if owner_name else module
+                func = getattr(owner, attr, None) if owner is not None else None
+                if func is None or getattr(func, "__profiled__", False):
+                    continue
+                if not getattr(func, "__module__", "").endswith(mod_name):
+                    continue
+                if owner_name and not getattr(owner, "__module__", "").endswith(mod_name):
+                    continue
+                wrapped = self._patched.get(id(func), None)
+                if wrapped is None:
+                    wrapped = self._patched[id(func)] = self.wrap(func, kind, phase)
+                setattr(owner, attr, wrapped)
+
+    # REPORTING
+    # =========
+    def report(self, **extra):
+        """
+        Returns this profiler's records as a JSON-able report.
+
+        :return: dict, startup report
+        """
+        imports = [r for r in self.records if r["kind"] == "import"]
+        tables = [r for r in self.records if r["kind"] == "table"]
+        phases = [r for r in self.records if r["kind"] == "phase"]
+
+        report = {
+            "version": REPORT_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "memory_traced": self.memory,
+            "imports": sorted(imports, key=lambda r: -r["self_seconds"]),
+            "tables": tables,
+            "phases": phases,
+            "totals": {
+                "imports_seconds": sum(r["self_seconds"] for r in imports),
+                "tables_seconds": sum(r["seconds"] for r in tables),
+                "modules_imported": len(imports),
+            },
+        }
+        report["totals"].update(extra)
+        return report
+
+
+def max_rss():
+    """
+    Returns this process's peak resident set size in bytes,
+    or None where unavailable.
+
+    :return: Optional[int], peak RSS
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def profile_startup(language="English", memory=True):
+    """
+    Imports BlissTranslator and initializes one in this language,
+    and returns a startup report.
+    ~
+    Should be run in a fresh process, since modules already
+    imported aren't re-imported.
+
+    :param language: str, language to initialize BlissTranslator in
+    :param memory: bool, whether to measure memory with tracemalloc
+    :return: dict, startup report
+    """
+    profiler = StartupProfiler(memory=memory)
+    if memory:
+        tracemalloc.start()
+    profiler.install()
+
+    start = time.perf_counter()
+    error = None
+    try:
+        from blisscribe import BlissTranslator
+    finally:
+        profiler.uninstall()
+    import_seconds = time.perf_counter() - start
+
+    profiler.patch_targets()
+    init_start = time.perf_counter()
+    try:
+        profiler.measure("phase", "translator", BlissTranslator, language)
+    except Exception as e:
+        error = "{}: {}".format(type(e).__name__, e)
+    init_seconds = time.perf_counter() - init_start
+
+    peak = tracemalloc.get_traced_memory()[1] if memory else None
+    if memory:
+        tracemalloc.stop()
+
+    extra = {
+        "import_seconds": import_seconds,
+        "init_seconds": init_seconds,
+        "total_seconds": import_seconds + init_seconds,
+        "peak_traced_bytes": peak,
+        "max_rss_bytes": max_rss(),
+        "language": language,
+    }
+    if error is not None:
+        extra["init_error"] = error
+    return profiler.report(**extra)
+
+
+def summarize(report, top=15, out=sys.stderr):
+    """
+    Prints a short human-readable summary of this report.
+
+    :param report: dict, startup report
+    :param top: int, number of slowest imports to show
+    :param out: file, where to print summary
+    :return: None
+    """
+    def line(name, seconds, nbytes):
+        mem = "" if nbytes is None else "{:>10.1f} KiB".format(nbytes / 1024)
+        print("  {:<56}{:>9.1f} ms{}".format(name[:56], seconds * 1000, mem), file=out)
+
+    totals = report["totals"]
+    print(
+        "import {:.1f} ms, init {:.1f} ms, {} modules".format(
+            totals["import_seconds"] * 1000,
+            totals["init_seconds"] * 1000,
+            totals["modules_imported"],
+        ),
+        file=out,
+    )
+    print("slowest imports (self time):", file=out)
+    for record in report["imports"][:top]:
+        line(record["name"], record["self_seconds"], record["bytes"])
+    print("tables:", file=out)
+    for record in report["tables"]:
+        line(record["name"], record["seconds"], record["bytes"])
+    print("phases:", file=out)
+    for record in report["phases"]:
+        line(record["name"], record["seconds"], record["bytes"])
+    if "init_error" in totals:
+        print("init failed: " + totals["init_error"], file=out)
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Profile Blisscribe's startup time.")
+    parser.add_argument("--language", default="English")
+    parser.add_argument("--output", help="file to write JSON report to (default: stdout)")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracemalloc")
+    parser.add_argument("--top", type=int, default=15, help="imports in summary")
+    args = parser.parse_args(argv)
+
+    report = profile_startup(args.language, memory=not args.no_memory)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=1)
+        summarize(report, top=args.top)
+    else:
+        json.dump(report, sys.stdout, indent=1)
+        print()
+    return 1 if "init_error" in report["totals"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
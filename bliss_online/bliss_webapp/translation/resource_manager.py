@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+RESOURCE_MANAGER:
+
+    Locates the NLTK corpora and models Blisscribe depends on
+    without touching the network.
+
+    Resources are loaded from NLTK's usual data directories, plus
+    a Blisscribe data directory which defaults to
+    resources/nltk_data and can be overridden with the
+    BLISSCRIBE_NLTK_DATA environment variable.
+    ~
+    Importing Blisscribe only checks a local manifest of which
+    resources are installed.  To fetch missing resources, run:
+
+    > python resource_manager.py prepare-resources
+
+    or, from the repository root:
+
+    > pipenv run prepare-resources
+"""
+import os, sys
+
+PATH = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(PATH)
+import json
+import threading
+import warnings
+import nltk
+
+DATA_PATH = os.environ.get("BLISSCRIBE_NLTK_DATA", PATH + "/resources/nltk_data")
+MANIFEST_FILENAME = "blisscribe_resources.json"
+RESOURCES = {
+    # NLTK package -> path of resource in an NLTK data directory
+    "wordnet": "corpora/wordnet",
+    "averaged_perceptron_tagger": "taggers/averaged_perceptron_tagger",
+    "gutenberg": "corpora/gutenberg",
+}
+
+if DATA_PATH not in nltk.data.path:
+    nltk.data.path.insert(0, DATA_PATH)
+
+_manifest = None
+_manifest_lock = threading.Lock()
+_warned = set()
+
+
+def manifest_path(data_path=DATA_PATH):
+    return os.path.join(data_path, MANIFEST_FILENAME)
+
+
+def find_resource(name):
+    """
+    Returns True if the NLTK resource with this name is installed
+    in any NLTK data directory, False otherwise.
+    ~
+    Only searches local directories.
+
+    :param name: str, name of NLTK package, e.g. "wordnet"
+    :return: bool, whether resource is installed
+    """
+    resource = RESOURCES.get(name, name)
+    for candidate in (resource, resource + ".zip"):
+        try:
+            nltk.data.find(candidate)
+        except LookupError:
+            continue
+        else:
+            return True
+    return False
+
+
+def load_manifest():
+    """
+    Returns a dict recording which of Blisscribe's NLTK resources
+    are installed.
+    ~
+    Reads the manifest written by prepare_resources() if there is one.
+    Otherwise, looks for each resource locally.  Either way,
+    resources are only checked once per process.
+
+    :return: dict, where...
+        key (str) - name of NLTK package
+        val (bool) - whether package is installed
+    """
+    global _manifest
+
+    if _manifest is None:
+        with _manifest_lock:
+            if _manifest is None:
+                try:
+                    with open(manifest_path(), encoding="utf-8") as manifest:
+                        installed = json.load(manifest)
+                except (IOError, OSError, ValueError):
+                    installed = {}
+                for name in RESOURCES:
+                    if not installed.get(name, False):
+                        installed[name] = find_resource(name)
+                _manifest = installed
+    return _manifest
+
+
+def require_resources(*names):
+    """
+    Checks that the NLTK resources with these names are installed.
+    ~
+    Never downloads anything.  Warns once per missing resource,
+    pointing to prepare-resources.
+
+    :param names: str, names of NLTK packages
+    :return: bool, whether all resources are installed
+    """
+    installed = load_manifest()
+    missing = [n for n in names if not installed.get(n, False)]
+
+    for name in missing:
+        if name not in _warned:
+            _warned.add(name)
+            warnings.warn(
+                "NLTK resource {!r} is not installed; "
+                "run `python resource_manager.py prepare-resources` "
+                "to fetch it".format(name),
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    return len(missing) == 0
+
+
+def prepare_resources(names=None, data_path=DATA_PATH, quiet=False):
+    """
+    Downloads these NLTK resources to data_path, then writes the
+    manifest of installed resources.
+    ~
+    If names is None, downloads all resources Blisscribe uses.
+
+    :param names: Optional[List[str]], names of NLTK packages to fetch
+    :param data_path: str, directory to download resources to
+    :param quiet: bool, whether to suppress download progress
+    :return: dict, manifest as in load_manifest()
+    """
+    global _manifest
+
+    names = list(RESOURCES) if names is None else names
+    os.makedirs(data_path, exist_ok=True)
+    if data_path not in nltk.data.path:
+        nltk.data.path.insert(0, data_path)
+
+    for name in names:
+        if not find_resource(name):
+            nltk.download(name, download_dir=data_path, quiet=quiet)
+
+    installed = {name: find_resource(name) for name in RESOURCES}
+    with open(manifest_path(data_path), "w", encoding="utf-8") as manifest:
+        json.dump(installed, manifest, indent=1, sort_keys=True)
+
+    with _manifest_lock:
+        _manifest = installed
+    return installed
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manage Blisscribe's NLTK resources.")
+    parser.add_argument("command", choices=["prepare-resources", "check"])
+    parser.add_argument("names", nargs="*", help="NLTK packages (default: all)")
+    parser.add_argument("--data-path", default=DATA_PATH)
+    args = parser.parse_args(argv)
+
+    if args.command == "prepare-resources":
+        installed = prepare_resources(args.names or None, data_path=args.data_path)
+    else:
+        installed = load_manifest()
+
+    for name in sorted(installed):
+        print("{:<30}{}".format(name, "ok" if installed[name] else "MISSING"))
+    return 0 if all(installed.get(n, False) for n in args.names or RESOURCES) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,13 +6,47 @@ BLISSNETS:
     Includes blissnets for:
      - BCI-AV# to synset
      - blissname to synset
+    ~
+    Each blissnet is loaded the first time it's accessed, e.g.
+    blissnets.BCI_BLISSNET, from a packed table of its module
+    (see resources/tables.py).  Import this module rather than
+    importing blissnets from it, so unused blissnets stay unloaded.
 """
 import os, sys
+import threading
+from importlib import import_module
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
-from .all_blissymbols import ALL_BLISSYMBOLS
-from .bci_blissnames import BCI_BLISSNAMES
-from .bci_blissnet import BCI_BLISSNET
-from .bliss_derivations import DERIVATIONS
-from .bliss_unicode import BLISS_UNICODE
-from .blissnet import BLISSNET
+
+# blissnet name -> (module, packed)
+TABLES = {
+    "ALL_BLISSYMBOLS": ("all_blissymbols", False),
+    "BCI_BLISSNAMES": ("bci_blissnames", True),
+    "BCI_BLISSNET": ("bci_blissnet", True),
+    "DERIVATIONS": ("bliss_derivations", True),
+    "BLISS_UNICODE": ("bliss_unicode", True),
+    "BLISSNET": ("blissnet", True),
+}
+_lock = threading.Lock()
+
+
+def __getattr__(name):
+    if name not in TABLES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    with _lock:
+        table = globals().get(name, None)
+        if table is None:
+            module_name, packed = TABLES[name]
+            if packed:
+                from ..tables import load_table
+
+                table = load_table(__package__, module_name, name)
+            else:
+                table = getattr(import_module("." + module_name, __package__), name)
+            globals()[name] = table
+    return table
+
+
+def __dir__():
+    return sorted(set(globals()) | set(TABLES))
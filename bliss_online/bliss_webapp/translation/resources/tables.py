@@ -0,0 +1,323 @@
+"""
+TABLES:
+
+    Stores large read-only dicts as packed, memory-mapped tables.
+
+    A packed table keeps a sorted index of its keys so lookups are
+    a binary search over the file, and stores each distinct value
+    once as JSON, decoded only when it's looked up.  Opening a table
+    reads only its header, so unused tables cost no memory.
+    ~
+    Each table records the size and modification time of the
+    file it was packed from (e.g. a Python module holding the dict),
+    and is repacked whenever that file changes.
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import threading
+from array import array
+from collections.abc import Mapping
+from importlib import import_module
+
+TABLE_MAGIC = b"BLISSTAB"
+TABLE_VERSION = 1
+STR_KEYS, INT_KEYS = 0, 1
+# magic, version, byte order, key kind, #keys, #values, source mtime, source size
+HEADER = struct.Struct("<8sIBBIIqq")
+BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+
+
+class PackedTable(Mapping):
+    """
+    A read-only mapping backed by a packed table file.
+    ~
+    Keys are stored in the packed dict's order, which is also
+    the order they're iterated in.
+    ~
+    File layout (after HEADER):
+        key offsets     - uint32[#keys + 1], into key blob (STR_KEYS only)
+        int keys        - int64[#keys] (INT_KEYS only)
+        sorted index    - uint32[#keys], key indices sorted by key
+        value ids       - uint32[#keys], index into value offsets
+        value offsets   - uint32[#values + 1], into value blob
+        key blob        - UTF-8 keys (STR_KEYS only)
+        value blob      - JSON values
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as table:
+            self._mm = mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            version,
+            byte_order,
+            self.key_kind,
+            self._n,
+            self._m,
+            self.source_mtime,
+            self.source_size,
+        ) = HEADER.unpack_from(self._mm, 0)
+        if magic != TABLE_MAGIC or version != TABLE_VERSION or byte_order != BYTE_ORDER:
+            self._mm.close()
+            raise ValueError("incompatible table file: " + path)
+
+        view = memoryview(self._mm)
+        pos = HEADER.size
+        n, m = self._n, self._m
+        if self.key_kind == INT_KEYS:
+            self._key_offsets = None
+            self._int_keys = view[pos : pos + 8 * n].cast("q")
+            pos += 8 * n
+        else:
+            self._key_offsets = view[pos : pos + 4 * (n + 1)].cast("I")
+            self._int_keys = None
+            pos += 4 * (n + 1)
+        self._sorted = view[pos : pos + 4 * n].cast("I")
+        pos += 4 * n
+        self._value_ids = view[pos : pos + 4 * n].cast("I")
+        pos += 4 * n
+        self._value_offsets = view[pos : pos + 4 * (m + 1)].cast("I")
+        pos += 4 * (m + 1)
+        self._key_blob = pos
+        if self._key_offsets is not None:
+            pos += self._key_offsets[n]
+        self._value_blob = pos
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key_bytes(self, idx):
+        start = self._key_blob + self._key_offsets[idx]
+        end = self._key_blob + self._key_offsets[idx + 1]
+        return self._mm[start:end]
+
+    def _key(self, idx):
+        if self._int_keys is not None:
+            return self._int_keys[idx]
+        return self._key_bytes(idx).decode("utf-8")
+
+    def _find(self, key):
+        """
+        Returns the index of this key in this table, or -1 if absent.
+
+        :param key: str or int, key to find
+        :return: int, index of key
+        """
+        if self._int_keys is not None:
+            if type(key) != int:
+                return -1
+            target = key
+            probe = self._int_keys.__getitem__
+        else:
+            if type(key) != str:
+                return -1
+            target = key.encode("utf-8")
+            probe = self._key_bytes
+
+        order = self._sorted
+        lo, hi = 0, self._n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if probe(order[mid]) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n and probe(order[lo]) == target:
+            return order[lo]
+        return -1
+
+    def _value(self, value_id):
+        value = self._values.get(value_id, None)
+        if value is None:
+            start = self._value_blob + self._value_offsets[value_id]
+            end = self._value_blob + self._value_offsets[value_id + 1]
+            value = json.loads(self._mm[start:end].decode("utf-8"))
+            with self._lock:
+                value = self._values.setdefault(value_id, value)
+        return value
+
+    def __getitem__(self, key):
+        idx = self._find(key)
+        if idx < 0:
+            raise KeyError(key)
+        return self._value(self._value_ids[idx])
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for idx in range(self._n):
+            yield self._key(idx)
+
+    def items(self):
+        for idx in range(self._n):
+            yield self._key(idx), self._value(self._value_ids[idx])
+
+    def values(self):
+        for idx in range(self._n):
+            yield self._value(self._value_ids[idx])
+
+    def __len__(self):
+        return self._n
+
+    def __repr__(self):
+        return "PackedTable({!r}, {} keys)".format(self.path, self._n)
+
+    @staticmethod
+    def build(path, mapping, source_mtime=0, source_size=0):
+        """
+        Packs this mapping to a table file at path.
+        ~
+        Writes to a temporary file first and renames it over path,
+        so readers never see a partially written table.
+
+        :param path: str, path of table file to write
+        :param mapping: dict, mapping from all-str or all-int keys to JSON-able values
+        :param source_mtime: int, modification time (ns) of mapping's source
+        :param source_size: int, size of mapping's source
+        :return: None
+        """
+        keys = list(mapping)
+        if all(type(k) == int for k in keys):
+            key_kind = INT_KEYS
+            sort_key = keys.__getitem__
+        else:
+            key_kind = STR_KEYS
+            sort_key = lambda i: keys[i].encode("utf-8")
+        order = array("I", sorted(range(len(keys)), key=sort_key))
+
+        value_ids, value_offsets, value_blob = array("I"), array("I", [0]), []
+        interned = {}
+        blob_size = 0
+        for key in keys:
+            encoded = json.dumps(
+                mapping[key], ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            value_id = interned.get(encoded, None)
+            if value_id is None:
+                value_id = interned[encoded] = len(value_blob)
+                value_blob.append(encoded)
+                blob_size += len(encoded)
+                value_offsets.append(blob_size)
+            value_ids.append(value_id)
+
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as table:
+            table.write(
+                HEADER.pack(
+                    TABLE_MAGIC,
+                    TABLE_VERSION,
+                    BYTE_ORDER,
+                    key_kind,
+                    len(keys),
+                    len(value_blob),
+                    source_mtime,
+                    source_size,
+                )
+            )
+            if key_kind == INT_KEYS:
+                table.write(array("q", keys).tobytes())
+                key_blob = []
+            else:
+                key_blob = [k.encode("utf-8") for k in keys]
+                key_offsets, offset = array("I", [0]), 0
+                for encoded in key_blob:
+                    offset += len(encoded)
+                    key_offsets.append(offset)
+                table.write(key_offsets.tobytes())
+            table.write(order.tobytes())
+            table.write(value_ids.tobytes())
+            table.write(value_offsets.tobytes())
+            table.write(b"".join(key_blob))
+            table.write(b"".join(value_blob))
+
+        os.replace(tmp_path, path)
+
+
+def source_stat(source_path):
+    """
+    Returns the modification time (ns) and size of the file
+    at source_path, or (None, None) if it's missing.
+
+    :param source_path: str, path of file a table is built from
+    :return: Tuple[Optional[int], Optional[int]], mtime and size
+    """
+    try:
+        stat = os.stat(source_path)
+        return stat.st_mtime_ns, stat.st_size
+    except OSError:
+        return None, None
+
+
+def open_packed(table_path, source_path):
+    """
+    Returns the packed table at table_path, or None if it's
+    missing or older than the file at source_path.
+    ~
+    Never builds the table, see load_packed().
+
+    :param table_path: str, path of packed table file
+    :param source_path: str, path of file the table is built from
+    :return: Optional[PackedTable], up-to-date packed table
+    """
+    source_mtime, source_size = source_stat(source_path)
+    try:
+        table = PackedTable(table_path)
+    except (OSError, ValueError, struct.error):
+        return None
+    if source_mtime is None or (
+        table.source_mtime == source_mtime and table.source_size == source_size
+    ):
+        return table
+    return None
+
+
+def load_packed(table_path, source_path, build):
+    """
+    Returns the packed table at table_path.
+    ~
+    If the table is missing or older than the file at source_path,
+    calls build() to get the mapping to pack, repacks it, and
+    returns the new table.  If the table can't be written, returns
+    the built mapping instead.
+
+    :param table_path: str, path of packed table file
+    :param source_path: str, path of file the table is built from
+    :param build: function, returns mapping parsed from source_path
+    :return: Mapping, packed table (or built mapping)
+    """
+    table = open_packed(table_path, source_path)
+    if table is not None:
+        return table
+
+    source_mtime, source_size = source_stat(source_path)
+    mapping = build()
+    try:
+        PackedTable.build(table_path, mapping, source_mtime or 0, source_size or 0)
+        return PackedTable(table_path)
+    except (OSError, TypeError, ValueError):
+        return mapping  # e.g. read-only install; keep using the built mapping
+
+
+def load_table(package, module_name, attr):
+    """
+    Returns the dict named attr from this package's module_name
+    module as a PackedTable.
+    ~
+    If the module's packed table is missing or older than the
+    module, imports the module and repacks its dict.
+
+    :param package: str, name of package holding module
+    :param module_name: str, name of module holding dict
+    :param attr: str, name of dict in module
+    :return: Mapping, dict named attr
+    """
+    pkg_path = os.path.dirname(import_module(package).__file__)
+    return load_packed(
+        os.path.join(pkg_path, module_name + ".table"),
+        os.path.join(pkg_path, module_name + ".py"),
+        lambda: getattr(import_module("." + module_name, package), attr),
+    )
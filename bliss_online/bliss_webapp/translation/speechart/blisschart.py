@@ -7,6 +7,7 @@ import os, sys
 
 sys.path.append(os.path.dirname(os.path.realpath(__file__)))
 from bliss_online.bliss_webapp.translation.blisscribe import *
+from bliss_online.bliss_webapp.translation.caches import MISSING
 from . import speecharts
 from .images import *
 
@@ -129,15 +130,36 @@ class BlissChart(speecharts.LanguageChart):
         :return: List[Blissymbol], Blissymbols for words in words
         """
         blissymbols = list()
+        words = list(text)
+        vocab = [word for word in dict.fromkeys(words) if not self.is_punct(word)]
+        poses = {
+            word: self.translator.convert_wikt_to_pos(self.word_poses(word, self.language))
+            for word in vocab
+        }
+        found = {
+            word: blissymbol
+            for word, blissymbol in zip(
+                vocab,
+                self.translator.lookup_many(
+                    vocab, [poses[word] for word in vocab], lang=self.language
+                ),
+            )
+            if blissymbol is not None
+        }
 
-        for word in text:
+        for word in words:
             # print "\nFINDING BLISSYMBOL FOR", word
-            blissymbol = self.word_blissymbol(word)
+            blissymbol = found.get(word, MISSING)
+            if blissymbol is MISSING:  # looks up each word once, even if None
+                blissymbol = self.word_blissymbol(word, poses.get(word, None))
+                found[word] = blissymbol
             # print("FOUND BLISSYMBOL.\n")
 
             if blissymbol is not None:
                 if derivations:
-                    blissymbols.extend(blissymbol.derivation_blissymbols())
+                    blissymbols.extend(
+                        blissymbol.derivation_blissymbols(translator=self.translator)
+                    )
                 else:
                     # print word, blissymbol
                     blissymbols.append(blissymbol)
@@ -254,7 +276,7 @@ class BlissChart(speecharts.LanguageChart):
         for blissymbol in blissymbols:
             if derivations:
                 self.add_bliss_derivations(blissymbol)
-                derivs = blissymbol.derivation_blissymbols()
+                derivs = blissymbol.derivation_blissymbols(translator=self.translator)
                 terminal_symbol = derivs[-1]
                 bliss_states = self.label_states(terminal_symbol)
             else:
@@ -272,7 +294,7 @@ class BlissChart(speecharts.LanguageChart):
         :return: None
         """
         if blissymbol is not None:
-            derivations = blissymbol.derivation_blissymbols()
+            derivations = blissymbol.derivation_blissymbols(translator=self.translator)
             self.add_bliss_sentence(derivations)
 
     def add_bliss_sentence(self, sentence):
@@ -498,7 +520,7 @@ class BlissChart(speecharts.LanguageChart):
         :return: Image, image for Blissymbol
         """
         max_height = self.bliss_height / 2 if mini else self.bliss_height
-        return blissymbol.image(max_height=max_height)
+        return blissymbol.image(max_height=max_height, translator=self.translator)
 
     def empty_bliss_image(self):
         """
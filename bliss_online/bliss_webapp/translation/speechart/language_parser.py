@@ -34,7 +34,6 @@ class LanguageParser(WiktionaryParser):
         :return: None
         """
         if self.language != lang:
-            self.refresh_data()
             self.__init__(lang)
 
     # LEXICA
@@ -398,6 +397,9 @@ class LanguageParser(WiktionaryParser):
         Dumps this LanguageParser's data from...
             alphabets to alphabets.json, and
             wiktionary_entries to wiktionary_entries.json.
+        ~
+        Wiktionary entries are journalled as they're added, so
+        this compacts their journal into wiktionary_entries.json.
 
         :return: None
         """
@@ -11,6 +11,7 @@ sys.path.append(PATH)
 import re
 import string
 import json
+import threading
 import requests
 from bs4 import BeautifulSoup
 
@@ -18,6 +19,13 @@ try:
     from bliss_online.bliss_webapp.translation.ordered_set import OrderedSet
 except (ModuleNotFoundError, ImportError):
     from translation.ordered_set import OrderedSet
+sys.path.append(os.path.dirname(PATH))
+from imports import safe_import
+
+# imported as blisscribe and lexicon_parser do, so journals share
+# one module's edit counter
+safe_import("lexicon_journal")
+from lexicon_journal import lexicon_journal
 from .ipa_symbols import *
 
 
@@ -118,14 +126,33 @@ class WiktionaryParser:
         {"Pronunciation", "Etymology", "Declension", "Conjugation", "Inflections"}
     )
 
+    JOURNAL_PATH = PATH + "/resources/data/wiktionary_entries.journal"
+
     def __init__(self):
-        self._session = requests.session()
+        self._local = threading.local()  # each thread's requests session
+        self._entries_lock = threading.RLock()  # guards wiktionary_entries
         self.language = None
+        self.wikt_journal = lexicon_journal(
+            self.JOURNAL_PATH, WiktionaryParser.compact_wiktionary_entries
+        )
         self.wiktionary_entries = self.load_wiktionary_entries()
         self._quote_pattern = None
         self._paren_pattern = None
         self._space_pattern = None
 
+    @property
+    def _session(self):
+        """
+        Returns this thread's requests session, as sessions
+        aren't safe to share between threads.
+
+        :return: Session, this thread's requests session
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.session()
+        return session
+
     @property
     def quote_pattern(self):
         if self._quote_pattern is None:
@@ -244,7 +271,8 @@ class WiktionaryParser:
 
     # JSON
     # ----
-    def dump_json(self, data, filename):
+    @staticmethod
+    def dump_json(data, filename):
         """
         Dumps data (prettily) to filename.json.
 
@@ -261,7 +289,8 @@ class WiktionaryParser:
             ensure_ascii=False,
         )
 
-    def load_json(self, filename):
+    @staticmethod
+    def load_json(filename):
         """
         Returns a dictionary corresponding to the given JSON file.
 
@@ -273,22 +302,63 @@ class WiktionaryParser:
 
     def load_wiktionary_entries(self):
         """
-        Returns a dictionary of memoized Wiktionary pages.
+        Returns a dictionary of memoized Wiktionary pages,
+        with this WiktionaryParser's journalled edits applied.
 
         :return: dict(str, dict), where str is a word and dict is...
             key (str) - language of word entry
             val (dict) - language's entry under word
         """
-        return self.load_json("wiktionary_entries")
+        entries = self.load_json("wiktionary_entries")
+        self.wikt_journal.replay(
+            lambda kind, *args: self.apply_wikt_edit(entries, kind, *args)
+        )
+        return entries
 
     def refresh_wiktionary_entries(self):
         """
-        Dumps this WiktionaryParser's wiktionary_entries data to
+        Writes this WiktionaryParser's journalled edits to
         wiktionary_entries.json.
+        ~
+        Edits are journalled as they're made, so this only
+        brings compaction forward.
+
+        :return: None
+        """
+        self.wikt_journal.compact()
+
+    @staticmethod
+    def compact_wiktionary_entries(edits):
+        """
+        Dumps wiktionary_entries.json with these journalled
+        edits applied.
+
+        :param edits: List[tuple], journalled edits to apply
+        :return: None
+        """
+        entries = WiktionaryParser.load_json("wiktionary_entries")
+        for kind, args in edits:
+            WiktionaryParser.apply_wikt_edit(entries, kind, *args)
+        WiktionaryParser.dump_json(entries, "wiktionary_entries")
+
+    @staticmethod
+    def apply_wikt_edit(entries, kind, *args):
+        """
+        Applies this journalled edit to these Wiktionary entries.
+        ~
+        Kind should be one of:
+            "entry", as in add_wikt_entry(), or
+            "subentry", as in edit_wiktionary_entry().
 
+        :param entries: dict, Wiktionary entries to edit
+        :param kind: str, kind of edit
+        :param args: List[X], edit's arguments
         :return: None
         """
-        self.dump_json(self.wiktionary_entries, "wiktionary_entries")
+        if kind == "entry":
+            WiktionaryParser.merge_wikt_entry(entries, *args)
+        elif kind == "subentry":
+            WiktionaryParser.merge_wikt_subentry(entries, *args)
 
     # WIKTIONARY PAGES
     # ----------------
@@ -340,15 +410,32 @@ class WiktionaryParser:
             entry = dict()
         entry.setdefault(heading, list())
 
+        with self._entries_lock:
+            if self.merge_wikt_subentry(
+                self.wiktionary_entries, word, lang, heading, content
+            ):
+                self.wikt_journal.append(
+                    "subentry", word, lang, heading, content, learned=[word]
+                )
+
+    @staticmethod
+    def merge_wikt_subentry(entries, word, lang, heading, content):
+        """
+        Adds this content to these Wiktionary entries under
+        word, lang and heading, as in edit_wiktionary_entry().
+        ~
+        Returns False if entries have no entry for word in lang.
+
+        :return: bool, whether content was added
+        """
         try:
-            self.wiktionary_entries[word][lang].setdefault(heading, list())
+            entries[word][lang].setdefault(heading, list())
         except KeyError:
-            return
+            return False
         else:
-            entry = self.wiktionary_entries[word][lang][heading]
-            self.wiktionary_entries[word][lang][heading] = OrderedSet(
-                entry + content
-            ).items()
+            entry = entries[word][lang][heading]
+            entries[word][lang][heading] = OrderedSet(entry + content).items()
+            return True
 
     def contains_punct(self, word):
         """
@@ -1119,16 +1206,44 @@ class WiktionaryParser:
             return default
 
     def add_wikt_entry(self, word, lang, heading, content):
+        """
+        Adds this content to this WiktionaryParser's entry for word
+        under lang and heading, and journals the edit.
+        ~
+        Entries are changed one thread at a time.
+
+        :param word: str, word of Wiktionary entry
+        :param lang: str, language of entry
+        :param heading: str, heading of entry
+        :param content: str, list or dict, content to add to entry
+        :return: None
+        """
+        with self._entries_lock:
+            if self.merge_wikt_entry(
+                self.wiktionary_entries, word, lang, heading, content
+            ):
+                self.wikt_journal.append(
+                    "entry", word, lang, heading, content, learned=[word]
+                )
+
+    @staticmethod
+    def merge_wikt_entry(entries, word, lang, heading, content):
+        """
+        Adds this content to these Wiktionary entries under
+        word, lang and heading, as in add_wikt_entry().
+
+        :return: bool, whether entries changed
+        """
         try:
-            entry = self.wiktionary_entries[word][lang][heading]
+            entry = entries[word][lang][heading]
         except KeyError:
-            self.wiktionary_entries.setdefault(word, dict())
-            self.wiktionary_entries[word].setdefault(lang, dict())
-            self.wiktionary_entries[word][lang].setdefault(heading, type(content)())
-            entry = self.wiktionary_entries[word][lang][heading]
+            entries.setdefault(word, dict())
+            entries[word].setdefault(lang, dict())
+            entries[word][lang].setdefault(heading, type(content)())
+            entry = entries[word][lang][heading]
 
         if entry == content:
-            return
+            return False
         elif type(content) == str:
             if type(entry) == str:
                 entry = [entry]
@@ -1152,7 +1267,8 @@ class WiktionaryParser:
 
                     entry[header] = wikt_content
 
-        self.wiktionary_entries[word][lang][heading] = entry
+        entries[word][lang][heading] = entry
+        return True
 
     def add_wikt_entries(self, word, lang, headings, contents):
         for i in range(len(headings)):
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+TRANSLATION_SESSION:
+
+    Holds the state of translating one document, so that one
+    BlissTranslator can translate many documents at once.
+
+    A session is current in the thread it's entered in, and a
+    BlissTranslator reads and writes words_seen and words_changed
+    through its current session.  Sessions nest, so a translation
+    started inside another session's thread uses the innermost.
+"""
+import itertools
+import threading
+import collections
+
+_local = threading.local()
+_serials = itertools.count(1)
+
+
+def current_session():
+    """
+    Returns the innermost TranslationSession entered in this
+    thread, or None if no session is entered.
+
+    :return: Optional[TranslationSession], this thread's session
+    """
+    sessions = getattr(_local, "sessions", None)
+    return sessions[-1] if sessions else None
+
+
+class TranslationSession:
+    """
+    A class for holding the state of translating one document
+    with a BlissTranslator.
+    ~
+    Holds the document's translation options, which words have
+    been seen or subtitled so far, the new Blissymbol images
+    drawn for it, and the path of its PDF.
+    ~
+    Use as a context manager:
+        with translator.session(sub_all=False) as session:
+            session.translate(text)
+        pdf_path = session.pdf_path
+    """
+
+    def __init__(self, translator, pdf_path=None, **options):
+        """
+        :param translator: BlissTranslator, translator for this session
+        :param pdf_path: Optional[str], path to write this session's PDF
+            to, or None to write it to a new file in the out folder
+        :param options: translation keyword arguments, as in
+            BlissTranslator.translate()
+        """
+        self.serial = next(_serials)  # tells apart what sessions learn
+        self.translator = translator
+        self.options = translator._setdefault_kwargs(**options)
+        self.pdf_path = pdf_path
+        self.new_blissymbols = []
+        self.init_seen_changed()
+
+    def output_path(self):
+        """
+        Returns the path this session's PDF is written to,
+        making a new file for it if it has none yet.
+        ~
+        Each session's PDF has its own file, so concurrent
+        sessions don't overwrite each other's PDFs.
+
+        :return: str, path of this session's PDF
+        """
+        if self.pdf_path is None:
+            self.pdf_path = self.translator.new_pdf_path()
+        return self.pdf_path
+
+    def init_seen_changed(self):
+        """
+        Forgets which words this session has seen or subtitled.
+
+        :return: None
+        """
+        self.words_seen = collections.defaultdict(bool)
+        self.words_changed = collections.defaultdict(bool)
+
+    def translate(self, phrase, **kwargs):
+        """
+        Translates this phrase to a PDF with this session's
+        options, overridden by kwargs.
+
+        :param phrase: str or TextIO, text to translate
+        :return: FPDF, translated PDF document
+        """
+        options = dict(self.options)
+        options.update(kwargs)
+        with self:
+            return self.translator.translate(phrase, **options)
+
+    def __enter__(self):
+        sessions = getattr(_local, "sessions", None)
+        if sessions is None:
+            sessions = _local.sessions = []
+        self.translator.begin_session(self)
+        sessions.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.sessions.remove(self)
+        self.translator.end_session(self)
+        return False
@@ -5,8 +5,14 @@ TRANSLATION_WORD:
     A class for representing a word-in-translation as
     part of a BlissTranslator.
 """
+import collections
 from parts_of_speech import INDICATORS_MAP
 
+# a TranslationWord's resolved fields, see TranslationWord.resolution()
+Resolution = collections.namedtuple(
+    "Resolution", ["pos", "lemmas", "eng_lemmas", "synsets", "blissymbol"]
+)
+
 
 class TranslationWord:
     """
@@ -38,11 +44,55 @@ class TranslationWord:
         self.synsets = self.find_synsets()
         self.init_blissymbol()
         if self.blissymbol is not None:
-            self.synsets.extend(self.blissymbol.synsets)
-            self.blissymbol.add_translations(self.language, self.lemmas)
+            translations = [(self.language, self.lemmas)]
             if self.language != "English":
-                self.blissymbol.add_translations("English", self.eng_lemmas)
-            self.translator.add_bliss_entry(self.blissymbol)
+                translations.append(("English", self.eng_lemmas))
+            self.blissymbol = self.translator.learn_translations(
+                self.blissymbol, translations
+            )
+            self.synsets.extend(self.blissymbol.synsets)
+
+    def resolution(self):
+        """
+        Returns a record of what this TranslationWord resolved to,
+        i.e. its parts of speech, lemmas, English lemmas, synsets,
+        and Blissymbol.
+        ~
+        Used to make TranslationWords for repeats of this word
+        without resolving them again, see from_resolution().
+
+        :return: Resolution, this TranslationWord's resolved fields
+        """
+        return Resolution(
+            frozenset(self.pos),
+            tuple(self.lemmas),
+            tuple(self.eng_lemmas),
+            tuple(self.synsets),
+            self.blissymbol,
+        )
+
+    @classmethod
+    def from_resolution(cls, word, translator, resolution, lang=None):
+        """
+        Returns a new TranslationWord for this word with the
+        fields in this resolution, without looking anything up.
+
+        :param word: str, word token
+        :param translator: BlissTranslator, TranslationWord's translator
+        :param resolution: Resolution, fields resolved for an equal word
+        :param lang: Optional[str], word's native language
+        :return: TranslationWord, TranslationWord for word
+        """
+        trans_word = cls.__new__(cls)
+        trans_word.word = word
+        trans_word.pos = set(resolution.pos)
+        trans_word.translator = translator
+        trans_word.language = translator.language if lang is None else lang
+        trans_word.lemmas = list(resolution.lemmas)
+        trans_word.blissymbol = resolution.blissymbol
+        trans_word.eng_lemmas = list(resolution.eng_lemmas)
+        trans_word.synsets = list(resolution.synsets)
+        return trans_word
 
     def lemmatize(self):
         lemma = self.translator.lemmatize(self.word, self.pos, self.language)
@@ -178,7 +228,9 @@ class TranslationWord:
                 if t in INDICATORS_MAP
             ]
             if len(indicators) != 0:
-                return self.blissymbol.overlay_indicators(img, indicators)
+                return self.blissymbol.overlay_indicators(
+                    img, indicators, translator=self.translator
+                )
         return img
 
     def subbed_bliss_image(self, subs=False):
@@ -192,7 +244,11 @@ class TranslationWord:
         :return: Image, subtitled Blissymbol image
         """
         if self.has_blissymbol():
-            img = self.overlay_indicators(self.blissymbol.image())
+            img = self.overlay_indicators(
+                self.blissymbol.image(
+                    height=self.translator.image_heights(), translator=self.translator
+                )
+            )
         else:
             subs = False  # never subtitle a word with itself
             img = self.word_image()
@@ -415,9 +471,9 @@ class TranslationWord:
                     self.blissymbol = blissymbol
                     return
             else:
-                hypernym = self.translator.common_hypernym(self.synsets)
-                if hypernym is not None:
-                    self.blissymbol = self.translator.lookup_blissnet(synset=hypernym)
+                blissymbol = self.translator.nearest_bliss_ancestor(self.synsets)
+                if blissymbol is not None:
+                    self.blissymbol = blissymbol
                     return
         else:
             blissymbol = self.translator.synsets_to_blissymbol(self.synsets)
@@ -467,9 +523,10 @@ class TranslationWord:
         :return: None
         """
         if self.blissymbol is not None:
-            self.blissymbol.add_translations("English", self.eng_lemmas)
-            self.blissymbol.add_translation(self.language, self.lemma)
-            self.translator.add_bliss_entry(self.blissymbol)
+            self.blissymbol = self.translator.learn_translations(
+                self.blissymbol,
+                [("English", self.eng_lemmas), (self.language, [self.lemma])],
+            )
 
     def find_bliss_etymologies(self, word):
         """
@@ -616,14 +673,13 @@ class TranslationWord:
 
         :return: List[Synset], the word's synsets
         """
+        lang_code = self.translator.lang_code(self.language)
         synsets = self.translator.words_synsets(
-            self.lemmas, pos=self.pos, lang_code=self.translator.lang_code
+            self.lemmas, pos=self.pos, lang_code=lang_code
         )
 
         if len(synsets) == 0 and self.language != "English":
-            synsets += self.translator.word_synsets(
-                self.lemma, lang_code=self.translator.lang_code
-            )
+            synsets += self.translator.word_synsets(self.lemma, lang_code=lang_code)
             synsets += self.translator.words_synsets(
                 self.eng_lemmas, pos=self.pos, lang_code="eng"
             )
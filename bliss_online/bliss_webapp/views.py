@@ -1,4 +1,5 @@
 # encoding: utf-8
+import os
 from django.shortcuts import render
 from django.http.response import HttpResponse, FileResponse
 from django.utils.encoding import smart_str
@@ -75,16 +76,16 @@ def downloadPdf(request):
             page_nums=page_nums,
             fast_translate=fast_translate,
         )
-        translator.translate()
+        pdf_path = translator.translate()
         filename = "translation.pdf"
 
-        with open(path + filename, "rb") as pdf:
+        with open(pdf_path, "rb") as pdf:
             response = HttpResponse(FileWrapper(pdf), content_type="application/pdf")
             response["Content-Disposition"] = 'attachment; filename="' + filename + '"'
             response["X-Sendfile"] = smart_str(path)
 
         pdf.close()
-        translator.deleteTranslation(filename=filename)
+        translator.deleteTranslation(filename=os.path.basename(pdf_path))
         return response
 
     else: